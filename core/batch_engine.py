@@ -0,0 +1,575 @@
+import time
+import numpy as np
+from utils.constants import *
+
+# Per-side geometry, in player order: left, right, top, bottom.
+# "Normal" is the axis the ball travels along toward that side's goal,
+# "tangent" the axis the paddle slides along.
+SIDE_NORMAL_AXIS = (0, 0, 1, 1)        # 0 = x, 1 = y
+SIDE_SIGN = (-1, 1, -1, 1)             # Direction of the goal along the normal axis
+SIDE_FACE = (                          # Paddle face the ball bounces off
+    PADDLE_MARGIN + PADDLE_WIDTH,
+    WORLD_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH,
+    PADDLE_MARGIN + H_PADDLE_HEIGHT,
+    WORLD_HEIGHT - PADDLE_MARGIN - H_PADDLE_HEIGHT,
+)
+SIDE_PADDLE_CENTER = (                # Paddle center along the normal axis (Paddle.get_center)
+    PADDLE_MARGIN + PADDLE_WIDTH // 2,
+    WORLD_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH + PADDLE_WIDTH // 2,
+    PADDLE_MARGIN + H_PADDLE_HEIGHT // 2,
+    WORLD_HEIGHT - PADDLE_MARGIN - H_PADDLE_HEIGHT + H_PADDLE_HEIGHT // 2,
+)
+SIDE_PADDLE_LENGTH = (PADDLE_HEIGHT, PADDLE_HEIGHT, H_PADDLE_WIDTH, H_PADDLE_WIDTH)
+SIDE_NEIGHBORS = ((2, 3), (2, 3), (0, 1), (0, 1))  # Sides bounding each paddle's lane (low, high)
+SIDE_ARENA_SIZE = (WORLD_WIDTH, WORLD_WIDTH, WORLD_HEIGHT, WORLD_HEIGHT)
+SIDE_TANGENT_SIZE = (WORLD_HEIGHT, WORLD_HEIGHT, WORLD_WIDTH, WORLD_WIDTH)
+SIDE_BASE_ANGLE = (0.0, 180.0, 90.0, 270.0)  # Straight out from each side (degrees)
+
+# AIPlayer threshold hysteresis states and their dead-zone multipliers
+THRESHOLD_TIGHT, THRESHOLD_NORMAL, THRESHOLD_LOOSE = 0, 1, 2
+THRESHOLD_SCALE = np.array([0.8, 1.0, 1.3])
+PREDICTION_HISTORY = 5  # AIPlayer.max_prediction_history
+
+class BatchEngine:
+    """Struct-of-arrays engine that steps N independent 4-player matches per NumPy call.
+
+    Ball position/velocity, paddle positions, lives and alive masks for all
+    matches live in NumPy arrays. Each step applies the Ball.bounce_off_paddle
+    and Ball.bounce_off_wall rules to every match at once through masks
+    (paddles are swept like CollisionSystem, so fast balls do not tunnel),
+    and the aiming phase is a countdown that launches at a random angle like
+    the AI auto-aim.
+
+    Paddles follow a vectorized copy of AIPlayer.update: reaction delay,
+    BallForecast impact prediction (with its goal checks and bounce limit),
+    prediction history, center seeking, accuracy error, distance-based
+    smoothing, threshold hysteresis and movement commitment. Random draws
+    come from one NumPy generator instead of per-match streams and each tick
+    resolves at most one paddle contact (the earliest), so results agree
+    with HeadlessRunner statistically (see compare_with_scalar) but not tick
+    for tick.
+    """
+
+    def __init__(self, num_matches, ai_difficulty=DIFFICULTY_VALUES[DIFFICULTY_MEDIUM], seed=None):
+        self.num_matches = num_matches
+        self.ai_difficulty = ai_difficulty
+        self.rng = np.random.default_rng(seed)
+
+        self.radius = BALL_SIZE // 2
+        self.ball_speed = float(BALL_SPEED)
+        self.init_ai_profile(ai_difficulty)
+
+        n = num_matches
+        self.ball_pos = np.zeros((n, 2))         # Ball center (x, y)
+        self.ball_vel = np.zeros((n, 2))         # Ball velocity per tick
+        self.paddle_pos = np.zeros((n, 4))       # Top-left coordinate along each paddle's slide axis
+        self.paddle_dir = np.zeros((n, 4))       # Current AI move direction (-1, 0, 1)
+        # AIPlayer state per paddle
+        self.reaction_delay = np.zeros((n, 4), dtype=np.int32)  # Ticks the AI still ignores the ball
+        self.commitment = np.zeros((n, 4), dtype=np.int32)      # Decisions to hold still after a move
+        self.paddle_target = np.full((n, 4), np.nan)  # Smoothed AI target along the slide axis (NaN = none yet)
+        self.threshold_state = np.full((n, 4), THRESHOLD_NORMAL, dtype=np.int8)
+        self.history = np.zeros((n, 4, PREDICTION_HISTORY))  # Recent predictions (slide axis), ring buffer
+        self.history_count = np.zeros((n, 4), dtype=np.int32)
+        self.history_head = np.zeros((n, 4), dtype=np.int32)
+        self.lives = np.zeros((n, 4), dtype=np.int32)
+        self.alive = np.zeros((n, 4), dtype=bool)
+        self.aiming_timer = np.zeros(n, dtype=np.int32)  # > 0 while a player is aiming
+        self.aiming_player = np.full(n, -1, dtype=np.int32)
+        self.done = np.zeros(n, dtype=bool)
+        self.winner = np.full(n, -1, dtype=np.int32)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.elimination_tick = np.full((n, 4), -1, dtype=np.int64)
+
+        self.reset()
+
+    def init_ai_profile(self, difficulty):
+        """Derive paddle policy parameters the same way AIPlayer does"""
+        if difficulty < 0.25:  # Easy mode (0.1)
+            speed_modifier, accuracy, reaction_delay = 0.7, 0.6, 20
+        elif difficulty < 0.5:  # Medium mode (0.3)
+            speed_modifier, accuracy, reaction_delay = 0.85, 0.8, 12
+        else:  # Hard mode (0.6+)
+            speed_modifier, accuracy, reaction_delay = 1.0, 1.0, int(10 * (1 - difficulty))
+        self.paddle_speed = max(1, int(PADDLE_SPEED * speed_modifier))
+        self.accuracy = accuracy
+        self.max_reaction_delay = reaction_delay
+        self.commitment_ticks = 3
+        self.smoothing = 0.3
+        self.move_threshold = 35 * (1 - difficulty + 0.3)
+        self.use_prediction = AI_PREDICTION_ENABLED and difficulty >= 0.25
+        self.use_center_seek = AI_CENTER_SEEK_ENABLED and difficulty >= 0.25
+        # Wall bounces the prediction folds through (None = unlimited)
+        self.max_prediction_bounces = AI_MAX_PREDICTION_BOUNCES if difficulty < 0.5 else None
+
+    def reset(self):
+        """Reset every match to its starting state"""
+        n = self.num_matches
+        for side in range(4):
+            self.paddle_pos[:, side] = SIDE_TANGENT_SIZE[side] // 2 - SIDE_PADDLE_LENGTH[side] // 2
+        self.paddle_dir[:] = 0
+        self.reaction_delay[:] = 0
+        self.commitment[:] = 0
+        self.paddle_target[:] = np.nan
+        self.threshold_state[:] = THRESHOLD_NORMAL
+        self.history[:] = 0.0
+        self.history_count[:] = 0
+        self.history_head[:] = 0
+        self.lives[:] = STARTING_LIVES
+        self.alive[:] = True
+        self.aiming_timer[:] = 0
+        self.aiming_player[:] = -1
+        self.done[:] = False
+        self.winner[:] = -1
+        self.ticks[:] = 0
+        self.elimination_tick[:] = -1
+        self.reset_balls(np.ones(n, dtype=bool))
+
+    def reset_balls(self, mask):
+        """Ball.reset_position for the masked matches - center, random direction"""
+        count = int(mask.sum())
+        if count == 0:
+            return
+        angle = self.rng.uniform(0, 2 * np.pi, count)
+        self.ball_pos[mask] = (WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+        self.ball_vel[mask] = np.stack([np.cos(angle), np.sin(angle)], axis=1) * self.ball_speed
+
+    @staticmethod
+    def enforce_min_speed(velocity, minimum):
+        """Push each velocity component to at least +/- minimum (keeping its sign)"""
+        sign = np.where(velocity >= 0, 1.0, -1.0)
+        return np.where(np.abs(velocity) < minimum, sign * minimum, velocity)
+
+    def normalize_velocity(self, velocity, target_speed):
+        """Ball.normalize_velocity for a block of velocities"""
+        speed = np.hypot(velocity[:, 0], velocity[:, 1])
+        zero = speed == 0
+        scale = np.where(zero, 0.0, target_speed / np.where(zero, 1.0, speed))
+        result = velocity * scale[:, None]
+        result[zero] = (target_speed, 0.0)
+        return result
+
+    def mirror_fold(self, position, low, high):
+        """math_utils.mirror_fold for arrays - (folded, bounces, first_wall)"""
+        span = high - low
+        offset = position - low
+        bounces = np.where(offset > span, np.floor(offset / span),
+                           np.where(offset < 0, np.ceil(-offset / span), 0))
+        first_wall = np.where(offset > span, 1, np.where(offset < 0, -1, 0))
+        offset = np.mod(offset, 2 * span)
+        folded = low + np.where(offset > span, 2 * span - offset, offset)
+        return np.where(bounces > 0, folded, position), bounces, first_wall
+
+    def step(self):
+        """Advance every unfinished match by one tick"""
+        active = ~self.done
+        if not active.any():
+            return
+
+        playing = active & (self.aiming_timer == 0)
+        self.update_paddles(playing)
+        self.move_balls(playing)
+        self.update_aiming(active & ~playing)
+        self.ticks[active] += 1
+
+    def update_paddles(self, playing):
+        """Vectorized AIPlayer.update plus Paddle.update for all four paddles.
+
+        While a reaction delay runs the AI ignores the ball and the paddle
+        keeps going the way it was; otherwise the AI decides afresh.
+        """
+        for side in range(4):
+            length = SIDE_PADDLE_LENGTH[side]
+            tangent_size = SIDE_TANGENT_SIZE[side]
+
+            movable = playing & self.alive[:, side]
+            delayed = movable & (self.reaction_delay[:, side] > 0)
+            self.reaction_delay[delayed, side] -= 1
+
+            deciding = np.nonzero(movable & ~delayed)[0]
+            if deciding.size:
+                self.decide_paddle_moves(side, deciding)
+
+            step = np.where(movable, self.paddle_dir[:, side] * self.paddle_speed, 0.0)
+            self.paddle_pos[:, side] = np.clip(self.paddle_pos[:, side] + step,
+                                               BOUNDARY_THICKNESS, tangent_size - BOUNDARY_THICKNESS - length)
+
+    def predict_impacts(self, side, rows, ball_normal, ball_tangent, velocity_normal, velocity_tangent):
+        """BallForecast.get_impact along one side's slide axis - NaN where no impact is predicted"""
+        radius = self.radius
+        tangent_size = SIDE_TANGENT_SIZE[side]
+        contact_plane = SIDE_FACE[side] - SIDE_SIGN[side] * radius
+
+        moving = np.abs(velocity_normal) >= 0.1
+        time_to_reach = (contact_plane - ball_normal) / np.where(moving, velocity_normal, 1.0)
+        unfolded = ball_tangent + velocity_tangent * time_to_reach
+
+        # Live neighbors are goal lines the ball center crosses, dead ones walls its edge bounces off
+        low_side, high_side = SIDE_NEIGHBORS[side]
+        low_is_goal = self.alive[rows, low_side]
+        high_is_goal = self.alive[rows, high_side]
+        low = BOUNDARY_THICKNESS + np.where(low_is_goal, 0, radius)
+        high = tangent_size - BOUNDARY_THICKNESS - np.where(high_is_goal, 0, radius)
+        folded, bounces, first_wall = self.mirror_fold(unfolded, low, high)
+
+        # Reaching another player's goal first means no impact here
+        first_is_goal = np.where(first_wall > 0, high_is_goal, low_is_goal)
+        second_is_goal = np.where(first_wall > 0, low_is_goal, high_is_goal)
+        blocked = (bounces > 0) & (first_is_goal | ((bounces > 1) & second_is_goal))
+
+        if self.max_prediction_bounces is not None:
+            # Limited lookahead - reflect only as far as the AI can see
+            limited = unfolded
+            for _ in range(self.max_prediction_bounces):
+                limited = np.where(limited < low, 2 * low - limited,
+                                   np.where(limited > high, 2 * high - limited, limited))
+            folded = np.where(bounces > self.max_prediction_bounces, np.clip(limited, low, high), folded)
+
+        return np.where(moving & (time_to_reach >= 0) & ~blocked, folded, np.nan)
+
+    def decide_paddle_moves(self, side, rows):
+        """AIPlayer.update decision for one side's paddles in the given matches"""
+        normal_axis = SIDE_NORMAL_AXIS[side]
+        tangent_axis = 1 - normal_axis
+        sign = SIDE_SIGN[side]
+        length = SIDE_PADDLE_LENGTH[side]
+        center = SIDE_TANGENT_SIZE[side] // 2
+
+        ball_normal = self.ball_pos[rows, normal_axis]
+        ball_tangent = self.ball_pos[rows, tangent_axis]
+        velocity_normal = self.ball_vel[rows, normal_axis]
+        velocity_tangent = self.ball_vel[rows, tangent_axis]
+        paddle_center = self.paddle_pos[rows, side] + length // 2
+        distance = np.hypot(ball_normal - SIDE_PADDLE_CENTER[side], ball_tangent - paddle_center)
+        approaching = velocity_normal * sign > 0
+
+        # predict_ball_intersection - the impact point, else the ball itself
+        predicted = ball_tangent
+        if self.use_prediction:
+            impact = self.predict_impacts(side, rows, ball_normal, ball_tangent,
+                                          velocity_normal, velocity_tangent)
+            predicted = np.where(np.isnan(impact), ball_tangent, impact)
+
+        # stabilize_prediction - blend with the average of the last few predictions
+        head = self.history_head[rows, side]
+        self.history[rows, side, head] = predicted
+        self.history_head[rows, side] = (head + 1) % PREDICTION_HISTORY
+        count = np.minimum(self.history_count[rows, side] + 1, PREDICTION_HISTORY)
+        self.history_count[rows, side] = count
+        average = self.history[rows, side].sum(axis=1) / count
+        target = np.where(count >= 2, predicted * 0.6 + average * 0.4, predicted)
+
+        if self.use_center_seek:
+            # calculate_strategic_target
+            heading_opposite = velocity_normal * -sign > AI_OPPOSITE_WALL_THRESHOLD * np.abs(velocity_tangent)
+            blend = np.where(heading_opposite, AI_CENTER_SEEK_STRENGTH * 1.2,
+                    np.where((distance > AI_MIN_THREAT_DISTANCE) | ~approaching,
+                             AI_CENTER_SEEK_STRENGTH * (1 - self.ai_difficulty * 0.3),
+                    np.where(distance < AI_ANTICIPATION_DISTANCE, AI_CENTER_SEEK_STRENGTH * 0.2, 0.0)))
+            target = target * (1 - blend) + center * blend
+
+        # apply_accuracy_modifier - occasionally aim up to 50px off
+        miss = self.rng.random(rows.size) > self.accuracy
+        target = target + np.where(miss, self.rng.integers(-50, 51, rows.size), 0)
+
+        # get_dynamic_smoothing - smooth harder as the ball closes in
+        closeness = np.clip(1 - distance / AI_ANTICIPATION_DISTANCE, 0.0, None)
+        smoothing = np.minimum(self.smoothing + closeness * 0.3, 0.8)
+        smoothed = self.paddle_target[rows, side]
+        smoothed = np.where(np.isnan(smoothed), target, smoothed + (target - smoothed) * smoothing)
+        self.paddle_target[rows, side] = smoothed
+
+        # get_stable_threshold - hysteresis between tight, normal and loose dead zones
+        wanted = np.where((distance < AI_ANTICIPATION_DISTANCE * 0.8) & approaching, THRESHOLD_TIGHT,
+                 np.where((distance > AI_ANTICIPATION_DISTANCE * 1.3) | ~approaching, THRESHOLD_LOOSE,
+                          THRESHOLD_NORMAL))
+        state = self.threshold_state[rows, side]
+        state = np.where((state == THRESHOLD_NORMAL) | (wanted != THRESHOLD_NORMAL), wanted, state)
+        self.threshold_state[rows, side] = state
+        threshold = self.move_threshold * THRESHOLD_SCALE[state]
+
+        # Movement flags are cleared every decision; a commitment holds the paddle still
+        diff = smoothed - paddle_center
+        committed = self.commitment[rows, side] > 0
+        moving = ~committed & (np.abs(diff) > threshold)
+        self.commitment[rows, side] = np.where(committed, self.commitment[rows, side] - 1,
+                                               np.where(moving, self.commitment_ticks, 0))
+        self.paddle_dir[rows, side] = np.where(moving, np.where(diff < 0, -1.0, 1.0), 0.0)
+        # Large corrections are followed by a reaction delay
+        large = moving & (np.abs(diff) > threshold * 1.5)
+        self.reaction_delay[rows, side] = np.where(large, self.max_reaction_delay, 0)
+
+    def sweep_paddle(self, side, ball_normal, ball_tangent, velocity_normal, velocity_tangent, paddle_start):
+        """math_utils.sweep_circle_aabb against one side's paddles - time of impact, NaN on a miss"""
+        radius = self.radius
+        face = SIDE_FACE[side]
+        back = face + SIDE_SIGN[side] * (PADDLE_WIDTH if SIDE_NORMAL_AXIS[side] == 0 else H_PADDLE_HEIGHT)
+        normal_low, normal_high = min(face, back), max(face, back)
+        paddle_end = paddle_start + SIDE_PADDLE_LENGTH[side]
+
+        # Slab test against the paddle grown by the radius
+        with np.errstate(divide='ignore', invalid='ignore'):
+            enter_normal, exit_normal = self.sweep_slab(ball_normal, velocity_normal,
+                                                        normal_low - radius, normal_high + radius)
+            enter_tangent, exit_tangent = self.sweep_slab(ball_tangent, velocity_tangent,
+                                                          paddle_start - radius, paddle_end + radius)
+        enter = np.maximum(enter_normal, enter_tangent)
+        leave = np.minimum(exit_normal, exit_tangent)
+        toi = np.maximum(enter, 0.0)
+        toi[(enter > leave) | (leave < 0) | (enter > 1)] = np.nan
+
+        # Entered through a rounded corner of the grown box - sweep against the corner point
+        hit_normal = ball_normal + velocity_normal * toi
+        hit_tangent = ball_tangent + velocity_tangent * toi
+        corner = (((hit_normal < normal_low) | (hit_normal > normal_high)) &
+                  ((hit_tangent < paddle_start) | (hit_tangent > paddle_end)))
+        if corner.any():
+            offset_normal = ball_normal[corner] - np.where(hit_normal[corner] < normal_low, normal_low, normal_high)
+            offset_tangent = ball_tangent[corner] - np.where(hit_tangent[corner] < paddle_start[corner],
+                                                             paddle_start[corner], paddle_end[corner])
+            toi[corner] = self.sweep_point(offset_normal, offset_tangent,
+                                           velocity_normal[corner], velocity_tangent[corner])
+        return toi
+
+    @staticmethod
+    def sweep_slab(origin, delta, low, high):
+        """Entry/exit times of 1D sweeps through [low, high] (parallel moves: always or never inside)"""
+        first = (low - origin) / delta
+        second = (high - origin) / delta
+        inside = (origin >= low) & (origin <= high)
+        parallel = delta == 0
+        enter = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(first, second))
+        leave = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(first, second))
+        return enter, leave
+
+    def sweep_point(self, offset_x, offset_y, velocity_x, velocity_y):
+        """math_utils.sweep_circle_point for centers at an offset from the point - toi, NaN on a miss"""
+        c = offset_x * offset_x + offset_y * offset_y - self.radius * self.radius
+        a = velocity_x * velocity_x + velocity_y * velocity_y
+        b = offset_x * velocity_x + offset_y * velocity_y
+        discriminant = b * b - a * c
+        approaching = (a > 0) & (b < 0) & (discriminant >= 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            toi = (-b - np.sqrt(np.where(approaching, discriminant, 0.0))) / np.where(approaching, a, 1.0)
+        toi = np.where(approaching & (toi <= 1), toi, np.nan)
+        return np.where(c <= 0, 0.0, toi)  # Already touching
+
+    def move_balls(self, playing):
+        """Move balls one tick, bouncing off paddles and walls and scoring goals"""
+        old_pos = self.ball_pos.copy()
+        velocity = self.ball_vel
+        new_pos = np.where(playing[:, None], old_pos + velocity, old_pos)
+        radius = self.radius
+        target_speed = self.ball_speed * (1.0 + BALL_SPEED_BOOST)
+
+        # Paddles - swept like CollisionSystem, so a fast ball cannot tunnel through and a
+        # paddle sliding onto the ball (or a ball clipping its end) still counts as a hit.
+        # Every side is swept with the pre-tick velocity; only the earliest hit bounces,
+        # as in CollisionSystem.find_first_contact (ties go to the lower side)
+        start_velocity = velocity.copy()
+        paddle_toi = np.full((self.num_matches, 4), np.inf)
+        for side in range(4):
+            normal_axis = SIDE_NORMAL_AXIS[side]
+            tangent_axis = 1 - normal_axis
+            rows = np.nonzero(playing & self.alive[:, side])[0]
+            if rows.size == 0:
+                continue
+            toi = self.sweep_paddle(side, old_pos[rows, normal_axis], old_pos[rows, tangent_axis],
+                                    start_velocity[rows, normal_axis], start_velocity[rows, tangent_axis],
+                                    self.paddle_pos[rows, side])
+            paddle_toi[rows, side] = np.where(np.isnan(toi), np.inf, toi)
+        first_side = paddle_toi.argmin(axis=1)
+        first_toi = paddle_toi[np.arange(self.num_matches), first_side]
+
+        for side in range(4):
+            rows = np.nonzero((first_side == side) & np.isfinite(first_toi))[0]
+            if rows.size == 0:
+                continue
+            normal_axis = SIDE_NORMAL_AXIS[side]
+            tangent_axis = 1 - normal_axis
+            sign = SIDE_SIGN[side]
+            length = SIDE_PADDLE_LENGTH[side]
+            toi = first_toi[rows]
+            paddle_start = self.paddle_pos[rows, side]
+
+            # Ball.bounce_off_paddle: reflect, add spin from the hit offset, push clear
+            hit_tangent = old_pos[rows, tangent_axis] + start_velocity[rows, tangent_axis] * toi
+            relative = np.clip((hit_tangent - (paddle_start + length // 2)) / (length / 2), -1, 1)
+            bounced = np.empty((rows.size, 2))
+            bounced[:, normal_axis] = -start_velocity[rows, normal_axis]
+            bounced[:, tangent_axis] = relative * self.ball_speed * 0.7
+            bounced = self.normalize_velocity(bounced, target_speed)
+            bounced = self.normalize_velocity(self.enforce_min_speed(bounced, 1), target_speed)
+            velocity[rows] = bounced
+
+            # Spend the rest of the tick travelling away from the paddle
+            remaining = 1.0 - toi
+            new_pos[rows, normal_axis] = SIDE_FACE[side] - sign * (radius + 5) + bounced[:, normal_axis] * remaining
+            new_pos[rows, tangent_axis] = hit_tangent + bounced[:, tangent_axis] * remaining
+
+        # Boundaries - walls for dead players, goal lines for live ones (all four sides)
+        goal_side = np.full(self.num_matches, -1, dtype=np.int32)
+        for side in range(4):
+            normal_axis = SIDE_NORMAL_AXIS[side]
+            sign = SIDE_SIGN[side]
+            arena_size = SIDE_ARENA_SIZE[side]
+            goal_line = BOUNDARY_THICKNESS if sign < 0 else arena_size - BOUNDARY_THICKNESS
+            wall_line = goal_line - sign * radius
+
+            position = new_pos[:, normal_axis]
+            alive = self.alive[:, side]
+
+            # Ball.bounce_off_wall
+            wall_hit = playing & ~alive & (position * sign >= wall_line * sign)
+            new_pos[wall_hit, normal_axis] = 2 * wall_line - position[wall_hit]
+            velocity[wall_hit, normal_axis] = -sign * np.abs(velocity[wall_hit, normal_axis])
+
+            goal = playing & alive & (position * sign >= goal_line * sign) & (goal_side < 0)
+            goal_side[goal] = side
+
+        self.ball_pos[:] = new_pos
+        self.handle_life_loss(goal_side)
+
+    def handle_life_loss(self, goal_side):
+        """Apply lost lives, eliminations, game over and the aiming phase"""
+        scored = goal_side >= 0
+        if not scored.any():
+            return
+
+        matches = np.nonzero(scored)[0]
+        sides = goal_side[matches]
+        self.lives[matches, sides] -= 1
+
+        eliminated = self.lives[matches, sides] <= 0
+        eliminated_matches = matches[eliminated]
+        self.alive[eliminated_matches, sides[eliminated]] = False
+        self.elimination_tick[eliminated_matches, sides[eliminated]] = self.ticks[eliminated_matches] + 1
+
+        # Game over when one player (or none) is left
+        over = np.zeros(self.num_matches, dtype=bool)
+        over[eliminated_matches] = self.alive[eliminated_matches].sum(axis=1) <= 1
+        self.done |= over
+        finished = np.nonzero(over)[0]
+        self.winner[finished] = np.where(self.alive[finished].any(axis=1),
+                                         self.alive[finished].argmax(axis=1), -1)
+
+        # Eliminated (match continues) - ball back to the center
+        reset_mask = np.zeros(self.num_matches, dtype=bool)
+        reset_mask[eliminated_matches] = True
+        reset_mask &= ~over
+        self.reset_balls(reset_mask)
+
+        # Still alive - park the ball in front of the player and start aiming
+        aiming_matches = matches[~eliminated]
+        aiming_sides = sides[~eliminated]
+        margin = 120
+        for side in range(4):
+            rows = aiming_matches[aiming_sides == side]
+            if rows.size == 0:
+                continue
+            normal_axis = SIDE_NORMAL_AXIS[side]
+            sign = SIDE_SIGN[side]
+            arena_size = SIDE_ARENA_SIZE[side]
+            self.ball_pos[rows, normal_axis] = (BOUNDARY_THICKNESS + margin if sign < 0
+                                                else arena_size - BOUNDARY_THICKNESS - margin)
+            self.ball_pos[rows, 1 - normal_axis] = SIDE_TANGENT_SIZE[side] // 2
+        self.ball_vel[aiming_matches] = 0.0
+        self.aiming_player[aiming_matches] = aiming_sides
+        self.aiming_timer[aiming_matches] = AIMING_TIME
+
+    def update_aiming(self, aiming):
+        """Count down aiming and launch like AimingSystem.auto_aim_for_ai + launch_ball"""
+        if not aiming.any():
+            return
+        self.aiming_timer[aiming] -= 1
+        launching = aiming & (self.aiming_timer <= 0)
+        count = int(launching.sum())
+        if count == 0:
+            return
+
+        base_angle = np.take(SIDE_BASE_ANGLE, self.aiming_player[launching])
+        angle = np.radians(base_angle + self.rng.uniform(-45, 45, count))
+        velocity = np.stack([np.cos(angle), np.sin(angle)], axis=1) * BALL_SPEED
+        self.ball_vel[launching] = self.enforce_min_speed(velocity, 2)
+        self.aiming_timer[launching] = 0
+        self.aiming_player[launching] = -1
+
+    def run(self, max_ticks=HEADLESS_MAX_MATCH_TICKS):
+        """Step until every match is over (or max_ticks is reached) and return stats"""
+        start_time = time.perf_counter()
+        tick = 0
+        while tick < max_ticks and not self.done.all():
+            self.step()
+            tick += 1
+        return self.get_stats(time.perf_counter() - start_time)
+
+    def get_stats(self, elapsed=0.0):
+        """Aggregate results in the same shape as HeadlessRunner.run"""
+        eliminated = self.elimination_tick >= 0
+        return {
+            'ai_difficulty': self.ai_difficulty,
+            'matches': self.num_matches,
+            'ticks': int(self.ticks.sum()),
+            'elapsed': elapsed,
+            'timeouts': int((~self.done).sum()),
+            'wins': [int((self.winner == side).sum()) for side in range(4)],
+            'eliminations': [int(eliminated[:, side].sum()) for side in range(4)],
+            'elimination_tick_total': [int(self.elimination_tick[eliminated[:, side], side].sum())
+                                       for side in range(4)]
+        }
+
+def compare_with_scalar(num_matches, ai_difficulty=DIFFICULTY_VALUES[DIFFICULTY_MEDIUM], seed=0,
+                        max_ticks=HEADLESS_MAX_MATCH_TICKS):
+    """Play the same seeded match count on BatchEngine and HeadlessRunner and compare the results.
+
+    The two draw from different random generators, so matches differ one by
+    one; what must agree is the distribution. Average match length and each
+    seat's win share are checked against BATCH_CHECK_SIGMAS standard errors
+    of the difference between the two runs.
+    """
+    from core.headless_runner import HeadlessRunner
+
+    engine = BatchEngine(num_matches, ai_difficulty, seed=seed)
+    batch_stats = engine.run(max_ticks)
+    batch_ticks = engine.ticks.astype(float)
+    batch_winners = engine.winner
+
+    # Free flight is exact, so it only makes the reference run faster
+    runner = HeadlessRunner(ai_difficulty, max_ticks=max_ticks, free_flight=True)
+    results = [runner.run_match(seed=seed + i) for i in range(num_matches)]
+    scalar_ticks = np.array([result['ticks'] for result in results], dtype=float)
+    scalar_winners = np.array([result['winner'] for result in results])
+
+    checks = []
+    tick_error = np.sqrt(batch_ticks.var(ddof=1) / num_matches + scalar_ticks.var(ddof=1) / num_matches)
+    checks.append(("Average ticks", batch_ticks.mean(), scalar_ticks.mean(), BATCH_CHECK_SIGMAS * tick_error))
+    for side in range(4):
+        batch_share = (batch_winners == side).mean()
+        scalar_share = (scalar_winners == side).mean()
+        share_error = np.sqrt((batch_share * (1 - batch_share) + scalar_share * (1 - scalar_share)) / num_matches)
+        checks.append((f"Player {side + 1} win share", batch_share, scalar_share,
+                       BATCH_CHECK_SIGMAS * max(share_error, 1 / num_matches)))
+
+    checks = [{'name': name, 'batch': float(batch), 'scalar': float(scalar), 'tolerance': float(tolerance),
+               'ok': bool(abs(batch - scalar) <= tolerance)}
+              for name, batch, scalar, tolerance in checks]
+    return {
+        'ai_difficulty': ai_difficulty,
+        'matches': num_matches,
+        'seed': seed,
+        'batch_elapsed': batch_stats['elapsed'],
+        'checks': checks,
+        'agree': all(check['ok'] for check in checks)
+    }
+
+def print_comparison_report(comparison):
+    """Print the compare_with_scalar checks side by side"""
+    print(f"Batch vs scalar: {comparison['matches']} matches per engine, "
+          f"AI {comparison['ai_difficulty']}, seed {comparison['seed']}")
+    print(f"  {'Check':<22}{'Batch':>10}{'Scalar':>10}{'Tolerance':>12}")
+    for check in comparison['checks']:
+        value_format = ",.0f" if check['name'] == "Average ticks" else ".1%"
+        batch, scalar, tolerance = (format(check[key], value_format) for key in ('batch', 'scalar', 'tolerance'))
+        print(f"  {check['name']:<22}{batch:>10}{scalar:>10}{'±' + tolerance:>12}  "
+              f"{'ok' if check['ok'] else 'MISMATCH'}")
+    print(f"  {'Engines agree' if comparison['agree'] else 'Engines disagree'}")
@@ -0,0 +1,52 @@
+from utils.math_utils import sweep_circle_aabb
+
+class AABB:
+    """Axis-aligned box with float coordinates - the pygame-free stand-in for pygame.Rect"""
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def left(self):
+        return self.x
+
+    @property
+    def top(self):
+        return self.y
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    @property
+    def center(self):
+        return (self.x + self.width / 2, self.y + self.height / 2)
+
+    def move_to(self, x, y):
+        """Move the box so its top-left corner is at (x, y)"""
+        self.x = x
+        self.y = y
+
+    def colliderect(self, other):
+        """Check if two boxes overlap (touching edges don't count, like pygame.Rect)"""
+        return (self.x < other.x + other.width and other.x < self.x + self.width and
+                self.y < other.y + other.height and other.y < self.y + self.height)
+
+    def sweep_circle(self, cx, cy, dx, dy, radius):
+        """Time of impact of a circle moving by (dx, dy) against this box.
+
+        Returns (toi, normal_x, normal_y) or None - see sweep_circle_aabb.
+        """
+        return sweep_circle_aabb(cx, cy, dx, dy, radius,
+                                 self.x, self.y, self.x + self.width, self.y + self.height)
+
+    def __repr__(self):
+        return f"AABB({self.x}, {self.y}, {self.width}, {self.height})"
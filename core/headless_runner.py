@@ -0,0 +1,117 @@
+import time
+from core.match import Match
+from utils.constants import *
+
+class HeadlessRunner:
+    """Runs 4-player AI matches back to back with no display, effects or frame cap"""
+
+    def __init__(self, ai_difficulty=DIFFICULTY_VALUES[DIFFICULTY_MEDIUM], max_ticks=HEADLESS_MAX_MATCH_TICKS,
+                 free_flight=False):
+        self.ai_difficulty = ai_difficulty
+        self.max_ticks = max_ticks
+        self.free_flight = free_flight  # Skip collision tests while the ball can't touch anything
+
+        # One match object reused for every run - reset() keeps it warm
+        self.match = Match(ai_difficulty=ai_difficulty, ai_player_ids=(0, 1, 2, 3),
+                           verbose=False, visual_effects=False, free_flight=free_flight)
+
+    def run_match(self, seat_difficulties=None, seed=None):
+        """Play one match to the end and return its result.
+
+        seat_difficulties gives each seat its own AI difficulty; seed makes
+        the match repeatable.
+        """
+        match = self.match
+        match.player_manager.set_seat_difficulties(seat_difficulties)
+        match.reset(seed)
+        elimination_order = []
+        elimination_ticks = []
+        winner = -1
+
+        while not match.is_over() and match.tick_count < self.max_ticks:
+            for event in match.step():
+                if event['type'] == MATCH_EVENT_LIFE_LOST and event['eliminated']:
+                    elimination_order.append(event['player'])
+                    elimination_ticks.append(match.tick_count)
+                elif event['type'] == MATCH_EVENT_GAME_OVER:
+                    winner = event['winner']
+
+        return {
+            'winner': winner,
+            'seed': match.get_seed(),
+            'ticks': match.tick_count,
+            'unchecked_ticks': match.unchecked_ticks,
+            'timed_out': not match.is_over(),
+            'elimination_order': elimination_order,
+            'elimination_ticks': elimination_ticks,
+            'lives': list(match.player_manager.get_lives())
+        }
+
+    def run(self, num_matches, base_seed=None):
+        """Run a batch of matches and return aggregate statistics.
+
+        With base_seed, match i is seeded base_seed + i so the run replays.
+        """
+        stats = {
+            'ai_difficulty': self.ai_difficulty,
+            'matches': 0,
+            'ticks': 0,
+            'unchecked_ticks': 0,
+            'elapsed': 0.0,
+            'timeouts': 0,
+            'wins': [0, 0, 0, 0],
+            'eliminations': [0, 0, 0, 0],
+            'elimination_tick_total': [0, 0, 0, 0]
+        }
+
+        start_time = time.perf_counter()
+        for i in range(num_matches):
+            result = self.run_match(seed=None if base_seed is None else base_seed + i)
+            stats['matches'] += 1
+            stats['ticks'] += result['ticks']
+            stats['unchecked_ticks'] += result['unchecked_ticks']
+            if result['timed_out']:
+                stats['timeouts'] += 1
+            if result['winner'] >= 0:
+                stats['wins'][result['winner']] += 1
+            for player_id, tick in zip(result['elimination_order'], result['elimination_ticks']):
+                stats['eliminations'][player_id] += 1
+                stats['elimination_tick_total'][player_id] += tick
+        stats['elapsed'] = time.perf_counter() - start_time
+
+        return stats
+
+def get_difficulty_name(ai_difficulty):
+    """Get the human-readable name for a difficulty value"""
+    for name, value in DIFFICULTY_VALUES.items():
+        if abs(value - ai_difficulty) < 0.01:
+            return name
+    return f"{ai_difficulty:.2f}"
+
+def print_headless_report(stats):
+    """Print throughput and win/elimination statistics for a headless run"""
+    matches = max(1, stats['matches'])
+    elapsed = max(stats['elapsed'], 1e-9)
+
+    print(f"Headless run: {stats['matches']} matches, "
+          f"{get_difficulty_name(stats['ai_difficulty'])} AI ({stats['ai_difficulty']})")
+    print(f"  Simulated {stats['ticks']:,} ticks in {stats['elapsed']:.2f}s")
+    if stats.get('unchecked_ticks'):
+        print(f"  Free flight: {stats['unchecked_ticks']:,} ticks "
+              f"({stats['unchecked_ticks'] / max(1, stats['ticks']):.0%}) moved without a collision test")
+    print(f"  Throughput: {stats['ticks'] / elapsed:,.0f} ticks/s, "
+          f"{stats['matches'] / elapsed:,.2f} matches/s")
+    average_ticks = stats['ticks'] / matches
+    print(f"  Average match: {average_ticks:,.0f} ticks ({average_ticks / TICK_RATE:.1f}s game time), "
+          f"{stats['timeouts']} timed out")
+    print()
+    print(f"  {'Seat':<10}{'Wins':>6}{'Win %':>8}{'Eliminated':>12}{'Avg elim tick':>15}")
+    for player_id in range(4):
+        wins = stats['wins'][player_id]
+        eliminations = stats['eliminations'][player_id]
+        if eliminations:
+            average_elimination = f"{stats['elimination_tick_total'][player_id] / eliminations:,.0f}"
+        else:
+            average_elimination = "-"
+        print(f"  {'Player ' + str(player_id + 1):<10}{wins:>6}{wins / matches:>8.1%}"
+              f"{eliminations:>12}{average_elimination:>15}")
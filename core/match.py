@@ -0,0 +1,166 @@
+from entities.ball import Ball
+from systems.player_manager import PlayerManager
+from systems.collision_system import CollisionSystem
+from systems.aiming_system import AimingSystem
+from core.rng import RNGRegistry
+from core.snapshot import pack_match, unpack_match
+from utils.constants import *
+
+class Match:
+    """Pure-Python simulation of one 4-player match - no pygame import.
+
+    Owns the ball, players (lives, paddles, AI), collisions and the aiming
+    phase, and advances them one fixed tick at a time. Visual feedback is left
+    to the caller: every step returns a list of match events (dicts with a
+    'type' of MATCH_EVENT_*) that the pygame shell turns into particles,
+    screen shake and state changes.
+
+    All match randomness (serves, AI errors and aim) comes from the match's
+    own RNGRegistry, so the same seed replays the same match regardless of
+    what cosmetic effects draw in the meantime.
+    """
+
+    def __init__(self, ai_difficulty=0.6, ai_player_ids=(1, 2, 3), verbose=True, visual_effects=True,
+                 seat_difficulties=None, free_flight=False, seed=None):
+        self.rng = RNGRegistry(seed)
+        self.ball = Ball(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, rng=self.rng.get(RNG_STREAM_GAMEPLAY))
+        self.player_manager = PlayerManager(ai_difficulty=ai_difficulty, ai_player_ids=ai_player_ids,
+                                            verbose=verbose, seat_difficulties=seat_difficulties,
+                                            ai_rng=self.rng.get(RNG_STREAM_AI))
+        self.collision_system = CollisionSystem()
+        self.aiming_system = AimingSystem(rng=self.rng.get(RNG_STREAM_AI))
+
+        self.phase = GAME_STATE_PLAYING  # GAME_STATE_PLAYING, _AIMING or _GAME_OVER
+        self.tick_count = 0
+
+        # Ball trail/glow bookkeeping - headless runs switch it off
+        self.visual_effects = visual_effects
+
+        # Free flight (headless only) - ticks in which the ball cannot touch anything
+        # move it without the swept collision test; outcomes are unchanged
+        self.free_flight = free_flight
+        self.free_flight_ticks = 0  # Ticks the ball can still fly without a collision check
+        self.unchecked_ticks = 0    # Ticks moved without a collision check so far
+
+    def reset(self, seed=None):
+        """Reset the match to its starting state (reseeded when seed is given)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.player_manager.reset()
+        self.ball.reset_position()
+        self.aiming_system.reset()
+        self.phase = GAME_STATE_PLAYING
+        self.tick_count = 0
+        self.free_flight_ticks = 0
+        self.unchecked_ticks = 0
+
+    def snapshot(self, buffer=None, include_rng=True):
+        """Pack the full simulation state into a compact binary blob (see core.snapshot)"""
+        return pack_match(self, buffer, include_rng)
+
+    def restore(self, data):
+        """Restore the state captured by snapshot()"""
+        unpack_match(self, data)
+
+    def get_seed(self):
+        """Get the seed that replays this match"""
+        return self.rng.seed_value
+
+    def is_over(self):
+        """Check if the match has finished"""
+        return self.phase == GAME_STATE_GAME_OVER
+
+    def step(self, input_handler=None):
+        """Advance the match by one tick and return the events it produced.
+
+        input_handler drives the human seat (player 0); pass None to let the
+        AI aim for every seat.
+        """
+        events = []
+        if self.phase == GAME_STATE_PLAYING:
+            self.update_playing(input_handler, events)
+        elif self.phase == GAME_STATE_AIMING:
+            self.update_aiming(input_handler, events)
+        else:
+            return events
+
+        self.tick_count += 1
+        return events
+
+    def update_playing(self, input_handler, events):
+        """Advance one tick of normal play"""
+        paddles = self.player_manager.get_paddles()
+        alive_players = self.player_manager.get_alive_players()
+
+        # Update input for the human player (player 0)
+        if input_handler is not None and 0 not in self.player_manager.ai_player_ids:
+            input_handler.update_paddle_movement([paddles[0]])
+
+        # Update AI players
+        self.player_manager.update_ai_players(self.ball)
+
+        # Update paddles
+        self.player_manager.update_paddles()
+
+        # Update ball trail and glow
+        if self.visual_effects:
+            self.ball.update_effects()
+
+        # Out of reach of every paddle lane and boundary - nothing to test
+        if self.free_flight_ticks > 0:
+            self.free_flight_ticks -= 1
+            self.unchecked_ticks += 1
+            self.ball.move()
+            return
+
+        # Move ball with swept collision detection against paddles and boundaries
+        collision_info = self.collision_system.move_ball(self.ball, paddles, alive_players)
+
+        if self.free_flight:
+            # Whole ticks of guaranteed contact-free flight from here
+            flight_time = self.collision_system.free_flight_time(self.ball, paddles, alive_players,
+                                                                 HEADLESS_FREE_FLIGHT_LOOKAHEAD)
+            self.free_flight_ticks = max(0, int(flight_time) - 1)
+
+        for kind, player_id, x, y in collision_info['contacts']:
+            event_type = MATCH_EVENT_PADDLE_HIT if kind == 'paddle' else MATCH_EVENT_WALL_BOUNCE
+            events.append({'type': event_type, 'player': player_id, 'x': x, 'y': y})
+
+        if collision_info['life_lost']:
+            self.free_flight_ticks = 0
+            self.handle_life_loss(collision_info['player_hit'], events)
+
+    def update_aiming(self, input_handler, events):
+        """Advance one tick of the aiming phase"""
+        paddles = self.player_manager.get_paddles()
+        alive_players = self.player_manager.get_alive_players()
+
+        # Launch ball when timer expires
+        # The launch preview is only for display - headless runs skip it
+        preview_ball = self.ball if self.visual_effects else None
+        if self.aiming_system.update_aiming_mode(paddles, alive_players, input_handler, preview_ball):
+            self.aiming_system.launch_ball(self.ball)
+            self.phase = GAME_STATE_PLAYING
+            events.append({'type': MATCH_EVENT_LAUNCH})
+
+    def handle_life_loss(self, player_id, events):
+        """Handle a player losing a life"""
+        result = self.player_manager.lose_life(player_id)
+        events.append({
+            'type': MATCH_EVENT_LIFE_LOST,
+            'player': player_id,
+            'eliminated': result['eliminated']
+        })
+
+        if result['eliminated']:
+            # Just reset ball for eliminated player
+            self.ball.reset_position()
+
+            if result['game_over']:
+                self.phase = GAME_STATE_GAME_OVER
+                events.append({'type': MATCH_EVENT_GAME_OVER, 'winner': result['winner']})
+        else:
+            # Player lost life but is still alive - enter aiming mode
+            alive_players = self.player_manager.get_alive_players()
+            self.aiming_system.enter_aiming_mode(player_id, self.ball, alive_players)
+            self.phase = GAME_STATE_AIMING
@@ -0,0 +1,45 @@
+import random
+from utils.constants import *
+
+class RNGRegistry:
+    """Named random streams that all derive from one seed.
+
+    Each stream (RNG_STREAM_GAMEPLAY, _AI, _COSMETIC, ...) is its own
+    random.Random seeded from the registry seed and the stream name, so
+    draws on one stream never shift another. Particles or screen shake can
+    change how much cosmetic randomness a frame uses without touching the
+    ball or the AI, and a match seed replays exactly.
+    """
+
+    def __init__(self, seed=None):
+        self.streams = {}
+        self.seed_value = None
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Reseed every stream in place (None picks a fresh random seed)"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed_value = seed
+        # Existing stream objects are reseeded, so holders keep valid references
+        for name, stream in self.streams.items():
+            stream.seed(self.get_stream_seed(name))
+
+    def get_stream_seed(self, name):
+        """Seed for one named stream - stable across runs and processes"""
+        return f"{self.seed_value}:{name}"
+
+    def get(self, name):
+        """Get a named stream, creating it on first use"""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = random.Random(self.get_stream_seed(name))
+            self.streams[name] = stream
+        return stream
+
+# Process-wide registry for everything that isn't owned by a seeded Match
+default_registry = RNGRegistry()
+
+def get_stream(name):
+    """Get a named stream from the default registry"""
+    return default_registry.get(name)
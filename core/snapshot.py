@@ -0,0 +1,190 @@
+import math
+import struct
+from utils.constants import *
+
+# Binary layout of a Match snapshot (little-endian, fixed size per match setup):
+#   header | ball | paddles x4 | players | aiming | AI x N | RNG streams (optional)
+SNAPSHOT_VERSION = 1
+
+HEADER = struct.Struct("<BBBBIIH")         # version, phase, AI count, has RNG, tick, unchecked, free flight
+BALL = struct.Struct("<7d3B")               # x, y, vx, vy, prev x/y, glow, last hit color
+PADDLE = struct.Struct("<4dhB")             # x, y, prev x/y, speed, movement flags
+PLAYERS = struct.Struct("<4BB")             # lives x4, alive bitmask
+AIMING = struct.Struct("<bhddB")            # player, timer, angle, AI target angle, AI started
+AI = struct.Struct("<BhdhBBB10d")           # player id, reaction delay, target, commitment, moving,
+                                            # threshold state, history length, history (5 x/y pairs)
+RNG_STATE = struct.Struct("<625Id")         # Mersenne Twister state + gauss_next (NaN = None)
+GAME_HEADER = struct.Struct("<BB")          # GameStateManager current/previous state (prefixes a Game snapshot)
+
+PHASES = (GAME_STATE_PLAYING, GAME_STATE_AIMING, GAME_STATE_GAME_OVER)
+GAME_STATES = (GAME_STATE_START_SCREEN, GAME_STATE_SETTINGS, GAME_STATE_PLAYING,
+               GAME_STATE_AIMING, GAME_STATE_PAUSED, GAME_STATE_GAME_OVER)
+THRESHOLD_STATES = ("tight", "normal", "loose")
+SNAPSHOT_RNG_STREAMS = (RNG_STREAM_GAMEPLAY, RNG_STREAM_AI)
+MAX_PREDICTION_HISTORY = 5
+
+def get_snapshot_size(ai_count, include_rng=True):
+    """Size in bytes of a snapshot for a match with ai_count AI players"""
+    size = HEADER.size + BALL.size + 4 * PADDLE.size + PLAYERS.size + AIMING.size + ai_count * AI.size
+    if include_rng:
+        size += len(SNAPSHOT_RNG_STREAMS) * RNG_STATE.size
+    return size
+
+def _optional(value):
+    """Pack None as NaN"""
+    return math.nan if value is None else value
+
+def _from_optional(value):
+    """Unpack NaN as None"""
+    return None if value != value else value
+
+def pack_match(match, buffer=None, include_rng=True):
+    """Write the match's full simulation state into buffer (allocated if None).
+
+    Reusing a buffer (e.g. a rollback ring) means no allocation at all.
+    The random stream states are included by default so a restored match
+    replays exactly; leave them out for what-if branches that should roll
+    their own dice.
+    """
+    ai_players = match.player_manager.get_ai_players()
+    size = get_snapshot_size(len(ai_players), include_rng)
+    if buffer is None:
+        buffer = bytearray(size)
+
+    offset = 0
+    HEADER.pack_into(buffer, offset, SNAPSHOT_VERSION, PHASES.index(match.phase), len(ai_players),
+                     include_rng, match.tick_count, match.unchecked_ticks, match.free_flight_ticks)
+    offset += HEADER.size
+
+    ball = match.ball
+    BALL.pack_into(buffer, offset, ball.x, ball.y, ball.velocity.x, ball.velocity.y,
+                   ball.prev_x, ball.prev_y, ball.glow_intensity, *ball.last_hit_color)
+    offset += BALL.size
+
+    for paddle in match.player_manager.get_paddles():
+        flags = (paddle.moving_up | paddle.moving_down << 1 |
+                 paddle.moving_left << 2 | paddle.moving_right << 3)
+        PADDLE.pack_into(buffer, offset, paddle.x, paddle.y, paddle.prev_x, paddle.prev_y,
+                         paddle.speed, flags)
+        offset += PADDLE.size
+
+    alive_players = match.player_manager.get_alive_players()
+    alive_mask = sum(1 << i for i, alive in enumerate(alive_players) if alive)
+    PLAYERS.pack_into(buffer, offset, *match.player_manager.get_lives(), alive_mask)
+    offset += PLAYERS.size
+
+    aiming = match.aiming_system
+    AIMING.pack_into(buffer, offset, aiming.aiming_player, aiming.aiming_timer, aiming.aiming_angle,
+                     aiming.ai_target_angle, aiming.ai_aiming_started)
+    offset += AIMING.size
+
+    history_slots = [0.0] * (2 * MAX_PREDICTION_HISTORY)
+    for ai_player in ai_players:
+        history = ai_player.prediction_history
+        for i, (x, y) in enumerate(history):
+            history_slots[2 * i] = x
+            history_slots[2 * i + 1] = y
+        AI.pack_into(buffer, offset, ai_player.paddle.player_id, ai_player.reaction_delay,
+                     _optional(ai_player.target_position), ai_player.movement_commitment_frames,
+                     ai_player.is_moving, THRESHOLD_STATES.index(ai_player.last_threshold_state),
+                     len(history), *history_slots)
+        offset += AI.size
+
+    if include_rng:
+        for name in SNAPSHOT_RNG_STREAMS:
+            _, state, gauss_next = match.rng.get(name).getstate()
+            RNG_STATE.pack_into(buffer, offset, *state, _optional(gauss_next))
+            offset += RNG_STATE.size
+
+    return buffer
+
+def unpack_match(match, data):
+    """Restore a match from a pack_match snapshot.
+
+    The match must have the same AI seats as the one that was packed.
+    """
+    offset = 0
+    version, phase, ai_count, has_rng, tick_count, unchecked, free_flight = \
+        HEADER.unpack_from(data, offset)
+    offset += HEADER.size
+    ai_players = match.player_manager.get_ai_players()
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    if ai_count != len(ai_players):
+        raise ValueError(f"Snapshot has {ai_count} AI players, match has {len(ai_players)}")
+
+    match.phase = PHASES[phase]
+    match.tick_count = tick_count
+    match.unchecked_ticks = unchecked
+    match.free_flight_ticks = free_flight
+
+    ball = match.ball
+    (ball.x, ball.y, ball.velocity.x, ball.velocity.y, ball.prev_x, ball.prev_y,
+     ball.glow_intensity, red, green, blue) = BALL.unpack_from(data, offset)
+    offset += BALL.size
+    ball.last_hit_color = (red, green, blue)
+    ball.rect.move_to(ball.x - ball.size // 2, ball.y - ball.size // 2)
+    ball.trail.clear()  # Cosmetic - rebuilt as the ball moves
+
+    for paddle in match.player_manager.get_paddles():
+        paddle.x, paddle.y, paddle.prev_x, paddle.prev_y, paddle.speed, flags = \
+            PADDLE.unpack_from(data, offset)
+        offset += PADDLE.size
+        paddle.moving_up = bool(flags & 1)
+        paddle.moving_down = bool(flags & 2)
+        paddle.moving_left = bool(flags & 4)
+        paddle.moving_right = bool(flags & 8)
+        paddle.rect.move_to(paddle.x, paddle.y)
+
+    player_manager = match.player_manager
+    *lives, alive_mask = PLAYERS.unpack_from(data, offset)
+    offset += PLAYERS.size
+    player_manager.lives = lives
+    player_manager.alive_players = [bool(alive_mask & (1 << i)) for i in range(4)]
+
+    aiming = match.aiming_system
+    (aiming.aiming_player, aiming.aiming_timer, aiming.aiming_angle, aiming.ai_target_angle,
+     ai_started) = AIMING.unpack_from(data, offset)
+    offset += AIMING.size
+    aiming.ai_aiming_started = bool(ai_started)
+    aiming.preview_impact = None
+    aiming.preview_forecast.invalidate()
+
+    for ai_player in ai_players:
+        (player_id, reaction_delay, target_position, commitment, is_moving, threshold_state,
+         history_length, *history_slots) = AI.unpack_from(data, offset)
+        offset += AI.size
+        if player_id != ai_player.paddle.player_id:
+            raise ValueError(f"Snapshot AI seat {player_id} does not match seat {ai_player.paddle.player_id}")
+        ai_player.reaction_delay = reaction_delay
+        ai_player.target_position = _from_optional(target_position)
+        ai_player.movement_commitment_frames = commitment
+        ai_player.is_moving = bool(is_moving)
+        ai_player.last_threshold_state = THRESHOLD_STATES[threshold_state]
+        ai_player.prediction_history = [(history_slots[2 * i], history_slots[2 * i + 1])
+                                         for i in range(history_length)]
+
+    # Cached per-tick views are rebuilt from the restored state
+    player_manager.get_ball_forecast().invalidate()
+
+    if has_rng:
+        for name in SNAPSHOT_RNG_STREAMS:
+            *state, gauss_next = RNG_STATE.unpack_from(data, offset)
+            offset += RNG_STATE.size
+            match.rng.get(name).setstate((3, tuple(state), _from_optional(gauss_next)))
+
+def pack_game(state_manager, match, include_rng=True):
+    """Snapshot a running game: GameStateManager states followed by the match"""
+    buffer = bytearray(GAME_HEADER.size + get_snapshot_size(
+        len(match.player_manager.get_ai_players()), include_rng))
+    GAME_HEADER.pack_into(buffer, 0, GAME_STATES.index(state_manager.current_state),
+                          GAME_STATES.index(state_manager.previous_state))
+    pack_match(match, memoryview(buffer)[GAME_HEADER.size:], include_rng)
+    return bytes(buffer)
+
+def unpack_game(state_manager, match, data):
+    """Restore a pack_game snapshot"""
+    current_state, previous_state = GAME_HEADER.unpack_from(data, 0)
+    state_manager.current_state = GAME_STATES[current_state]
+    state_manager.previous_state = GAME_STATES[previous_state]
+    unpack_match(match, memoryview(data)[GAME_HEADER.size:])
@@ -0,0 +1,159 @@
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from utils.constants import *
+
+# Worker-process state - built once by init_worker and reused for every match
+_worker_runner = None
+
+def build_lineups(difficulty_names=DIFFICULTY_OPTIONS):
+    """Build seat lineups for every difficulty pairing and seat rotation.
+
+    A pairing (A, B) puts A on two seats and B on the other two. The base
+    lineup (seat order left, right, top, bottom) is rotated one seat at a
+    time: rotations 0 and 2 give A an opposite pair (left/right, then
+    top/bottom), rotations 1 and 3 a pair that meets at a corner. Over the
+    four rotations every seat plays each difficulty of the pairing in two
+    of them, so seat bias cancels out.
+    """
+    lineups = []
+    for pairing in itertools.combinations_with_replacement(difficulty_names, 2):
+        base = [pairing[0], pairing[0], pairing[1], pairing[1]]
+        for rotation in range(4):
+            lineups.append({
+                'pairing': list(pairing),
+                'rotation': rotation,
+                'seats': base[-rotation:] + base[:-rotation] if rotation else list(base)
+            })
+    return lineups
+
+def build_tournament_specs(num_matches, base_seed=0, difficulty_names=DIFFICULTY_OPTIONS):
+    """Spread num_matches over all lineups, each match with its own seed"""
+    lineups = build_lineups(difficulty_names)
+    specs = []
+    for match_id in range(num_matches):
+        spec = dict(lineups[match_id % len(lineups)])
+        spec['match_id'] = match_id
+        spec['seed'] = base_seed + match_id
+        specs.append(spec)
+    return specs
+
+def init_worker(max_ticks, free_flight=False):
+    """Pool initializer - import the simulation once and keep a warm runner"""
+    global _worker_runner
+    from core.headless_runner import HeadlessRunner
+    _worker_runner = HeadlessRunner(max_ticks=max_ticks, free_flight=free_flight)
+
+def run_spec(spec):
+    """Play the match described by spec on this worker's runner"""
+    seat_difficulties = [DIFFICULTY_VALUES[name] for name in spec['seats']]
+    result = _worker_runner.run_match(seat_difficulties=seat_difficulties, seed=spec['seed'])
+    result.update(spec)
+    result['winner_difficulty'] = spec['seats'][result['winner']] if result['winner'] >= 0 else None
+    return result
+
+class TournamentStats:
+    """Running win-rate aggregate per seat and per difficulty"""
+
+    def __init__(self, difficulty_names=DIFFICULTY_OPTIONS):
+        self.difficulty_names = list(difficulty_names)
+        self.matches = 0
+        self.ticks = 0
+        self.timeouts = 0
+        self.elapsed = 0.0
+        self.seat_wins = [0, 0, 0, 0]
+        self.difficulty_wins = {name: 0 for name in self.difficulty_names}
+        self.difficulty_seats = {name: 0 for name in self.difficulty_names}  # Seat appearances
+
+    def add_result(self, result):
+        """Fold one match result into the aggregate"""
+        self.matches += 1
+        self.ticks += result['ticks']
+        if result['timed_out']:
+            self.timeouts += 1
+        for name in result['seats']:
+            self.difficulty_seats[name] += 1
+        if result['winner'] >= 0:
+            self.seat_wins[result['winner']] += 1
+            self.difficulty_wins[result['winner_difficulty']] += 1
+
+    def get_seat_win_rate(self, player_id):
+        """Share of matches won from a seat"""
+        return self.seat_wins[player_id] / self.matches if self.matches else 0.0
+
+    def get_difficulty_win_rate(self, name):
+        """Share of seats played at a difficulty that won their match"""
+        seats = self.difficulty_seats[name]
+        return self.difficulty_wins[name] / seats if seats else 0.0
+
+    def get_summary_line(self, total_matches, elapsed):
+        """One-line live progress summary"""
+        seats = " ".join(f"P{i + 1} {self.get_seat_win_rate(i):.0%}" for i in range(4))
+        difficulties = " ".join(f"{name} {self.get_difficulty_win_rate(name):.0%}"
+                                for name in self.difficulty_names)
+        rate = self.matches / max(elapsed, 1e-9)
+        return (f"[{self.matches}/{total_matches}] {rate:.1f} matches/s | "
+                f"seat wins: {seats} | win/seat: {difficulties}")
+
+class TournamentRunner:
+    """Plays tournament matches across all cores and streams results as JSONL"""
+
+    def __init__(self, workers=None, max_ticks=HEADLESS_MAX_MATCH_TICKS, free_flight=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ticks = max_ticks
+        self.free_flight = free_flight
+
+    def run(self, specs, output_path=TOURNAMENT_DEFAULT_OUTPUT, progress=True):
+        """Run every spec and return the final TournamentStats.
+
+        Each result is written to output_path as one JSON line the moment its
+        worker finishes, so a long tournament can be inspected while it is
+        still running.
+        """
+        stats = TournamentStats()
+        start_time = time.perf_counter()
+        last_progress = 0.0
+
+        # Small chunks keep results streaming while still amortizing IPC
+        chunksize = max(1, min(TOURNAMENT_MAX_CHUNKSIZE, len(specs) // (self.workers * 8)))
+
+        with open(output_path, 'w') as output, \
+             multiprocessing.Pool(self.workers, initializer=init_worker,
+                                  initargs=(self.max_ticks, self.free_flight)) as pool:
+            for result in pool.imap_unordered(run_spec, specs, chunksize=chunksize):
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+                stats.add_result(result)
+
+                now = time.perf_counter()
+                if progress and (now - last_progress >= TOURNAMENT_PROGRESS_INTERVAL
+                                 or stats.matches == len(specs)):
+                    last_progress = now
+                    sys.stdout.write("\r" + stats.get_summary_line(len(specs), now - start_time))
+                    sys.stdout.flush()
+
+        if progress:
+            print()
+        stats.elapsed = time.perf_counter() - start_time
+        return stats
+
+def print_tournament_report(stats, workers, output_path):
+    """Print final win rates per seat and per difficulty"""
+    elapsed = max(stats.elapsed, 1e-9)
+    print(f"Tournament: {stats.matches} matches on {workers} workers in {elapsed:.1f}s "
+          f"({stats.matches / elapsed:,.1f} matches/s, {stats.ticks / elapsed:,.0f} ticks/s), "
+          f"{stats.timeouts} timed out")
+    print(f"  Results written to {output_path}")
+    print()
+    print(f"  {'Seat':<10}{'Wins':>6}{'Win %':>8}")
+    for player_id in range(4):
+        print(f"  {'Player ' + str(player_id + 1):<10}{stats.seat_wins[player_id]:>6}"
+              f"{stats.get_seat_win_rate(player_id):>8.1%}")
+    print()
+    print(f"  {'Difficulty':<14}{'Seats':>7}{'Wins':>6}{'Win/seat':>10}")
+    for name in stats.difficulty_names:
+        print(f"  {name + ' (' + str(DIFFICULTY_VALUES[name]) + ')':<14}{stats.difficulty_seats[name]:>7}"
+              f"{stats.difficulty_wins[name]:>6}{stats.get_difficulty_win_rate(name):>10.1%}")
@@ -1,18 +1,64 @@
-import pygame
-import random
 import math
 from utils.constants import *
 from utils.math_utils import Vector2, clamp
+from core.geometry import AABB
+from core.rng import get_stream
+
+class BallTrail:
+    """Ball positions from the last few ticks in a fixed ring buffer.
+
+    One sample is written per simulation tick and the oldest is overwritten,
+    so nothing is allocated once the buffer exists. The renderer samples it
+    by time (fractional ticks), so the trail moves as smoothly as the
+    interpolated ball at any frame rate.
+    """
+
+    def __init__(self, length=BALL_TRAIL_LENGTH):
+        self.length = length
+        self.xs = [0.0] * length
+        self.ys = [0.0] * length
+        self.head = 0   # Slot the next sample is written to
+        self.count = 0  # Valid samples (up to length)
+
+    def __len__(self):
+        return self.count
+
+    def append(self, x, y):
+        """Record this tick's position, overwriting the oldest sample when full"""
+        self.xs[self.head] = x
+        self.ys[self.head] = y
+        self.head = (self.head + 1) % self.length
+        if self.count < self.length:
+            self.count += 1
+
+    def clear(self):
+        """Forget every sample (after a teleport)"""
+        self.count = 0
+
+    def sample(self, age):
+        """Position age ticks before the newest sample, interpolated - None beyond the oldest"""
+        if age < 0 or age > self.count - 1:
+            return None
+        newer_age = int(age)
+        blend = age - newer_age
+        newer = (self.head - 1 - newer_age) % self.length
+        x, y = self.xs[newer], self.ys[newer]
+        if blend > 0:
+            older = newer - 1  # Index -1 wraps to the last slot
+            x += (self.xs[older] - x) * blend
+            y += (self.ys[older] - y) * blend
+        return x, y
 
 class Ball:
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
         self.x = x
         self.y = y
         self.size = BALL_SIZE
         self.speed = BALL_SPEED
+        self.rng = rng or get_stream(RNG_STREAM_GAMEPLAY)  # Serve directions
 
         # Random starting direction
-        angle = random.uniform(0, 2 * math.pi)
+        angle = self.rng.uniform(0, 2 * math.pi)
         self.velocity = Vector2(
             math.cos(angle) * self.speed,
             math.sin(angle) * self.speed
@@ -24,33 +70,44 @@ class Ball:
         if abs(self.velocity.y) < 2:
             self.velocity.y = 2 if self.velocity.y >= 0 else -2
 
-        self.rect = pygame.Rect(self.x - self.size//2, self.y - self.size//2,
-                                self.size, self.size)
+        self.rect = AABB(self.x - self.size//2, self.y - self.size//2,
+                         self.size, self.size)
+
+        # Position at the previous simulation tick (for render interpolation)
+        self.prev_x = self.x
+        self.prev_y = self.y
 
         # Visual effects
-        self.trail_positions = []
-        self.max_trail_length = 15
+        self.trail = BallTrail()
         self.last_hit_color = NEON_BLUE  # Color from last paddle hit
         self.glow_intensity = 1.0
 
-    def update(self):
-        """Update ball position and handle wall collisions"""
+    def store_previous_position(self):
+        """Remember the current position as the previous tick's position"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_render_position(self, interpolation=1.0):
+        """Get the position interpolated between the last two ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * interpolation,
+                self.prev_y + (self.y - self.prev_y) * interpolation)
+
+    def update_effects(self):
+        """Update trail and glow effects for this tick"""
         # Store position for trail effect
-        self.trail_positions.append((self.x, self.y))
-        if len(self.trail_positions) > self.max_trail_length:
-            self.trail_positions.pop(0)
+        self.trail.append(self.x, self.y)
         
         # Gradually reduce glow intensity
         if self.glow_intensity > 1.0:
             self.glow_intensity -= 0.02
 
-        # Update position
-        self.x += self.velocity.x
-        self.y += self.velocity.y
+    def move(self, fraction=1.0):
+        """Move the ball along its velocity by a fraction of a tick"""
+        self.x += self.velocity.x * fraction
+        self.y += self.velocity.y * fraction
 
         # Update collision rect
-        self.rect.x = self.x - self.size//2
-        self.rect.y = self.y - self.size//2
+        self.rect.move_to(self.x - self.size//2, self.y - self.size//2)
 
     def bounce_off_paddle(self, paddle):
         """Handle collision with paddle"""
@@ -70,7 +127,7 @@ class Ball:
             self.velocity.y = relative_intersect_y * self.speed * 0.7
 
             # Move ball away from paddle to prevent sticking
-            if paddle.x < SCREEN_WIDTH // 2:  # Left paddle
+            if paddle.x < WORLD_WIDTH // 2:  # Left paddle
                 self.x = paddle.x + paddle.width + self.size//2 + 5
             else:  # Right paddle
                 self.x = paddle.x - self.size//2 - 5
@@ -84,7 +141,7 @@ class Ball:
             self.velocity.x = relative_intersect_x * self.speed * 0.7
 
             # Move ball away from paddle to prevent sticking
-            if paddle.y < SCREEN_HEIGHT // 2:  # Top paddle
+            if paddle.y < WORLD_HEIGHT // 2:  # Top paddle
                 self.y = paddle.y + paddle.height + self.size//2 + 5
             else:  # Bottom paddle
                 self.y = paddle.y - self.size//2 - 5
@@ -110,27 +167,29 @@ class Ball:
             self.x = BOUNDARY_THICKNESS + self.size//2
             self.velocity.x = abs(self.velocity.x)  # Ensure rightward velocity
         elif wall_side == "right":
-            self.x = SCREEN_WIDTH - BOUNDARY_THICKNESS - self.size//2
+            self.x = WORLD_WIDTH - BOUNDARY_THICKNESS - self.size//2
             self.velocity.x = -abs(self.velocity.x)  # Ensure leftward velocity
         elif wall_side == "top":
             self.y = BOUNDARY_THICKNESS + self.size//2
             self.velocity.y = abs(self.velocity.y)  # Ensure downward velocity
         elif wall_side == "bottom":
-            self.y = SCREEN_HEIGHT - BOUNDARY_THICKNESS - self.size//2
+            self.y = WORLD_HEIGHT - BOUNDARY_THICKNESS - self.size//2
             self.velocity.y = -abs(self.velocity.y)  # Ensure upward velocity
         
         # Update collision rect
-        self.rect.x = self.x - self.size//2
-        self.rect.y = self.y - self.size//2
+        self.rect.move_to(self.x - self.size//2, self.y - self.size//2)
 
     def reset_position(self):
         """Reset ball to center with random direction"""
-        self.x = SCREEN_WIDTH // 2
-        self.y = SCREEN_HEIGHT // 2
-        self.trail_positions.clear()
+        self.x = WORLD_WIDTH // 2
+        self.y = WORLD_HEIGHT // 2
+        self.trail.clear()
+
+        # Teleport - don't interpolate from the old position
+        self.store_previous_position()
 
         # Random starting direction
-        angle = random.uniform(0, 2 * math.pi)
+        angle = self.rng.uniform(0, 2 * math.pi)
         self.velocity = Vector2(
             math.cos(angle) * self.speed,
             math.sin(angle) * self.speed
@@ -1,6 +1,6 @@
-import pygame
 from utils.constants import *
 from utils.math_utils import clamp
+from core.geometry import AABB
 
 class Paddle:
     def __init__(self, x, y, player_id, orientation='vertical'):
@@ -26,8 +26,22 @@ class Paddle:
         self.moving_left = False
         self.moving_right = False
 
-        # Create pygame rect for collision detection
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # Float collision box (no pygame, no int rounding)
+        self.rect = AABB(self.x, self.y, self.width, self.height)
+
+        # Position at the previous simulation tick (for render interpolation)
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def store_previous_position(self):
+        """Remember the current position as the previous tick's position"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_render_position(self, interpolation=1.0):
+        """Get the top-left position interpolated between the last two ticks"""
+        return (self.prev_x + (self.x - self.prev_x) * interpolation,
+                self.prev_y + (self.y - self.prev_y) * interpolation)
 
     def update(self):
         """Update paddle position based on movement flags"""
@@ -40,7 +54,7 @@ class Paddle:
 
             # Clamp to screen boundaries
             self.y = clamp(self.y, BOUNDARY_THICKNESS,
-                           SCREEN_HEIGHT - BOUNDARY_THICKNESS - self.height)
+                           WORLD_HEIGHT - BOUNDARY_THICKNESS - self.height)
 
         else:  # horizontal
             # Horizontal paddles move left/right
@@ -51,11 +65,10 @@ class Paddle:
 
             # Clamp to screen boundaries
             self.x = clamp(self.x, BOUNDARY_THICKNESS,
-                           SCREEN_WIDTH - BOUNDARY_THICKNESS - self.width)
+                           WORLD_WIDTH - BOUNDARY_THICKNESS - self.width)
 
         # Update rect position
-        self.rect.x = self.x
-        self.rect.y = self.y
+        self.rect.move_to(self.x, self.y)
 
     def get_center(self):
         """Get the center point of the paddle"""
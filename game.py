@@ -1,42 +1,57 @@
 import pygame
-from entities.ball import Ball
+import time
+from core.match import Match
+from core.snapshot import pack_game, unpack_game
 from systems.renderer import GameRenderer
 from systems.input_handler import InputHandler
 from systems.particle_system import ParticleSystem
 from systems.game_state_manager import GameStateManager
 from systems.menu_system import MenuSystem
-from systems.aiming_system import AimingSystem
-from systems.collision_system import CollisionSystem
-from systems.player_manager import PlayerManager
 from systems.start_screen_system import StartScreenSystem
 from systems.game_over_system import GameOverSystem
 from systems.settings_system import SettingsSystem
 from systems.settings_screen_system import SettingsScreenSystem
+from systems.quality_governor import QualityGovernor, run_quality_benchmark
 from utils.constants import *
 
 class Game:
-    def __init__(self):
+    def __init__(self, dirty_rects=False, bloom_quality=BLOOM_DEFAULT_QUALITY, render_scale=1.0,
+                 dynamic_resolution=False, fullscreen=False, fps=FPS):
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if fullscreen:
+            # SDL scales the fixed-size frame up to the display, so a bigger display costs no extra drawing.
+            # Its renderer can wait for vsync; the frame cap below still applies if that's refused
+            flags = pygame.SCALED | pygame.FULLSCREEN
+            try:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags, vsync=1)
+            except pygame.error:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("4-Player Neon Pong")
         self.clock = pygame.time.Clock()
+        self.fps = fps  # Render frame cap - frames beyond the display's refresh rate are never seen
         self.running = True
 
         # Initialize game systems
-        self.renderer = GameRenderer(self.screen)
+        self.renderer = GameRenderer(self.screen, dirty_rects, bloom_quality, render_scale, dynamic_resolution)
         self.input_handler = InputHandler()
         self.particle_system = ParticleSystem()
         self.state_manager = GameStateManager()
         self.menu_system = MenuSystem()
-        self.aiming_system = AimingSystem()
-        self.collision_system = CollisionSystem()
         
         # Initialize settings system first to get settings
         self.settings_system = SettingsSystem()
         ai_difficulty = self.settings_system.get_setting('ai_difficulty')
         controller_sensitivity = self.settings_system.get_setting('controller_sensitivity')
         
-        self.player_manager = PlayerManager(ai_difficulty=ai_difficulty)
+        # Pure-Python match simulation - this class is the pygame shell around it
+        self.match = Match(ai_difficulty=ai_difficulty)
+        
+        # Shortcuts to the match's long-lived simulation objects
+        self.ball = self.match.ball
+        self.player_manager = self.match.player_manager
+        self.aiming_system = self.match.aiming_system
         
         # Apply controller sensitivity if it's different from default
         if controller_sensitivity != CONTROLLER_SENSITIVITY:
@@ -45,9 +60,6 @@ class Game:
         self.game_over_system = GameOverSystem()
         self.settings_screen_system = SettingsScreenSystem()
         
-        # Initialize game entities
-        self.ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        
         # Set up menu callbacks
         self.menu_system.set_callbacks(
             on_resume=self.resume_game,
@@ -77,12 +89,44 @@ class Game:
         # Pause input handling
         self.pause_key_pressed = False  # Track pause key state for single-press detection
         
+        # Graphics quality - Auto mode starts from a preset benchmarked on first launch
+        self.quality_governor = QualityGovernor(self.settings_system.get_setting('graphics_quality'),
+                                                self.settings_system.get_setting('auto_quality_start'))
+        if self.quality_governor.is_auto() and self.settings_system.get_setting('auto_quality_start') is None:
+            auto_quality_start = self.benchmark_quality()
+            self.settings_system.set_setting('auto_quality_start', auto_quality_start)
+            self.quality_governor.set_mode(QUALITY_AUTO, auto_quality_start)
+        self.apply_quality_preset(self.quality_governor.get_preset())
+        
         # Show controller status
         if self.input_handler.controller_connected:
             print(f"Game ready with controller: {self.input_handler.controller.get_name()}")
         else:
             print("Game ready with keyboard input")
 
+    def apply_quality_preset(self, preset):
+        """Apply a graphics quality preset to the renderers and the particle system"""
+        settings = QUALITY_PRESETS[preset]
+        self.renderer.apply_quality(settings)
+        self.particle_system.set_budget(settings['particle_budget'])
+
+    def benchmark_quality(self):
+        """Briefly render a busy gameplay frame at each preset and return the best one this machine holds"""
+        print("Benchmarking graphics quality...")
+        paddles = self.player_manager.get_paddles()
+        lives = self.player_manager.get_lives()
+        alive_players = self.player_manager.get_alive_players()
+        self.particle_system.add_victory_celebration(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, NEON_PINK)
+
+        def render_frame():
+            self.renderer.render_frame(paddles, self.ball, lives, alive_players, self.particle_system)
+            self.renderer.present()
+
+        preset = run_quality_benchmark(self.apply_quality_preset, render_frame)
+        self.particle_system.clear()
+        print(f"Starting graphics quality: {preset}")
+        return preset
+
     def resume_game(self):
         """Resume game from pause"""
         self.state_manager.resume_game()
@@ -95,10 +139,8 @@ class Game:
     def start_game(self):
         """Start the main game from start screen"""
         # Reset game entities without resetting state manager
-        self.player_manager.reset()
-        self.ball.reset_position()
+        self.match.reset()
         self.particle_system.clear()
-        self.aiming_system.reset()
         self.menu_system.reset_menu()
         self.pause_key_pressed = False
         
@@ -137,15 +179,17 @@ class Game:
         elif setting_key == 'sound_enabled':
             print(f"Sound setting updated to: {setting_value}")
             # Note: Sound system will be implemented in future
+        elif setting_key == 'graphics_quality':
+            self.quality_governor.set_mode(setting_value)
+            self.apply_quality_preset(self.quality_governor.get_preset())
+            print(f"Graphics quality updated to: {setting_value} ({self.quality_governor.get_preset()})")
         
     def restart_game(self):
         """Restart the game from game over screen"""
         print("Restarting game...")
         # Reset game entities without resetting state manager
-        self.player_manager.reset()
-        self.ball.reset_position()
+        self.match.reset()
         self.particle_system.clear()
-        self.aiming_system.reset()
         self.menu_system.reset_menu()
         self.game_over_system.reset()
         self.pause_key_pressed = False
@@ -157,10 +201,8 @@ class Game:
         """Return to the start screen from game over"""
         print("Returning to main menu...")
         # Reset all systems
-        self.player_manager.reset()
-        self.ball.reset_position()
+        self.match.reset()
         self.particle_system.clear()
-        self.aiming_system.reset()
         self.menu_system.reset_menu()
         self.game_over_system.reset()
         self.start_screen_system.reset()
@@ -218,17 +260,20 @@ class Game:
 
 
     def update(self):
-        """Update game state based on current mode"""
+        """Advance the simulation by one fixed tick based on current mode"""
+        # Remember last tick's positions for render interpolation
+        self.ball.store_previous_position()
+        for paddle in self.player_manager.get_paddles():
+            paddle.store_previous_position()
+        
         if self.state_manager.is_start_screen():
             self.update_start_screen()
         elif self.state_manager.is_settings():
             self.update_settings()
         elif self.state_manager.is_game_over():
             self.update_game_over()
-        elif self.state_manager.is_playing():
-            self.update_playing_mode()
-        elif self.state_manager.is_aiming():
-            self.update_aiming_mode()
+        elif self.state_manager.is_playing() or self.state_manager.is_aiming():
+            self.update_match()
         elif self.state_manager.is_paused():
             # Don't update game logic when paused, only particle system
             pass
@@ -236,6 +281,9 @@ class Game:
         # Always update particle system (except on start screen, settings, and game over)
         if not self.state_manager.is_start_screen() and not self.state_manager.is_settings() and not self.state_manager.is_game_over():
             self.particle_system.update()
+        
+        # Animation clock and screen shake count ticks, not rendered frames
+        self.renderer.update()
     
     def update_start_screen(self):
         """Update start screen demo game"""
@@ -250,75 +298,44 @@ class Game:
         """Update game over screen effects"""
         self.game_over_system.update()
     
-    def update_playing_mode(self):
-        """Update game during normal play"""
-        # Update input for human player (player 0)
-        paddles = self.player_manager.get_paddles()
-        alive_players = self.player_manager.get_alive_players()
-        
-        self.input_handler.update_paddle_movement([paddles[0]])
-
-        # Update AI players
-        self.player_manager.update_ai_players(self.ball)
-
-        # Update paddles
-        self.player_manager.update_paddles()
-
-        # Update ball
-        self.ball.update()
-
-        # Check ball-paddle collisions
-        self.collision_system.check_ball_paddle_collisions(
-            self.ball, paddles, alive_players, self.particle_system, self.renderer
-        )
-
-        # Check for boundary collisions and handle life loss
-        collision_info = self.collision_system.check_ball_boundary_collisions(
-            self.ball, alive_players, self.particle_system, self.renderer
-        )
-        
-        if collision_info['life_lost']:
-            self.handle_life_loss(collision_info['player_hit'])
+    def update_match(self):
+        """Advance the match simulation one tick and present its events"""
+        for event in self.match.step(self.input_handler):
+            self.apply_match_event(event)
     
-    def update_aiming_mode(self):
-        """Update game during aiming phase"""
-        paddles = self.player_manager.get_paddles()
-        alive_players = self.player_manager.get_alive_players()
-        
-        # Update aiming system
-        should_launch = self.aiming_system.update_aiming_mode(
-            paddles, alive_players, self.input_handler
-        )
-        
-        # Launch ball when timer expires
-        if should_launch:
-            self.aiming_system.launch_ball(self.ball)
-            self.state_manager.enter_playing_mode()
-            
-    def handle_life_loss(self, player_id):
-        """Handle a player losing a life"""
-        result = self.player_manager.lose_life(player_id)
-        
-        if result['eliminated']:
-            # Add dramatic elimination particle effect
-            self.particle_system.add_elimination_effect(
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, PLAYER_COLORS[player_id])
+    def apply_match_event(self, event):
+        """Turn a match event into visual feedback and state changes"""
+        event_type = event['type']
+        
+        if event_type == MATCH_EVENT_PADDLE_HIT:
+            # Add particle effect and screen shake for paddle hit
+            self.particle_system.add_ball_impact_burst(
+                event['x'], event['y'], PLAYER_COLORS[event['player']])
+            self.renderer.add_screen_shake(3, 8)
             
-            # Strong screen shake for elimination
-            self.renderer.add_screen_shake(10, 20)
+        elif event_type == MATCH_EVENT_WALL_BOUNCE:
+            # Dead player's wall - small sparks
+            self.particle_system.add_wall_impact_sparks(event['x'], event['y'])
+            self.renderer.add_screen_shake(1, 4)
             
-            # Just reset ball for eliminated player
-            self.ball.reset_position()
+        elif event_type == MATCH_EVENT_LIFE_LOST:
+            if event['eliminated']:
+                # Add dramatic elimination particle effect
+                self.particle_system.add_elimination_effect(
+                    WORLD_WIDTH // 2, WORLD_HEIGHT // 2, PLAYER_COLORS[event['player']])
+                
+                # Strong screen shake for elimination
+                self.renderer.add_screen_shake(10, 20)
+            else:
+                # Player lost life but is still alive - enter aiming mode
+                self.renderer.add_screen_shake(6, 15)
+                self.state_manager.enter_aiming_mode()
+                
+        elif event_type == MATCH_EVENT_LAUNCH:
+            self.state_manager.enter_playing_mode()
             
-            if result['game_over']:
-                self.game_over()
-        else:
-            # Player lost life but is still alive - enter aiming mode
-            self.renderer.add_screen_shake(6, 15)
-            alive_players = self.player_manager.get_alive_players()
-            self.aiming_system.enter_aiming_mode(player_id, self.ball, alive_players)
-            self.state_manager.enter_aiming_mode()
-
+        elif event_type == MATCH_EVENT_GAME_OVER:
+            self.game_over()
 
     def game_over(self):
         """Handle game over state"""
@@ -336,35 +353,41 @@ class Game:
         if winner_info['winner'] >= 0:
             # Add victory celebration
             self.particle_system.add_victory_celebration(
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, PLAYER_COLORS[winner_info['winner']])
+                WORLD_WIDTH // 2, WORLD_HEIGHT // 2, PLAYER_COLORS[winner_info['winner']])
         
         # Enter game over state instead of resetting immediately
         self.state_manager.enter_game_over()
 
+    def snapshot(self, include_rng=True):
+        """Serialize the simulation (game state + match) into a compact binary blob"""
+        return pack_game(self.state_manager, self.match, include_rng)
+
+    def restore(self, data):
+        """Restore a state captured by snapshot()"""
+        unpack_game(self.state_manager, self.match, data)
+
     def reset_game(self):
         """Reset the game to initial state"""
         # Reset all systems
-        self.player_manager.reset()
-        self.ball.reset_position()
+        self.match.reset()
         self.particle_system.clear()
         self.state_manager.reset()
-        self.aiming_system.reset()
         self.menu_system.reset_menu()
         
         # Reset pause input state
         self.pause_key_pressed = False
 
-    def render(self):
-        """Render the game"""
+    def render(self, interpolation=1.0):
+        """Render the game, interpolating positions between the last two ticks"""
         if self.state_manager.is_start_screen():
             # Render start screen
-            self.renderer.render_start_screen(self.start_screen_system)
+            self.renderer.render_start_screen(self.start_screen_system, interpolation)
         elif self.state_manager.is_settings():
             # Render settings screen
-            self.renderer.render_settings_screen(self.settings_screen_system)
+            self.renderer.render_settings_screen(self.settings_screen_system, interpolation)
         elif self.state_manager.is_game_over():
             # Render game over screen
-            self.renderer.render_game_over_screen(self.game_over_system)
+            self.renderer.render_game_over_screen(self.game_over_system, interpolation)
         else:
             # Get data from systems
             paddles = self.player_manager.get_paddles()
@@ -374,19 +397,50 @@ class Game:
             aiming_player = self.aiming_system.get_aiming_player()
             aiming_angle = self.aiming_system.get_aiming_angle()
             aiming_timer = self.aiming_system.get_aiming_timer()
+            aiming_impact = self.aiming_system.get_preview_impact()
             pause_menu_selected = self.menu_system.get_selected_option()
             
             self.renderer.render_frame(paddles, self.ball, lives, alive_players, 
                                      self.particle_system, game_state, aiming_player, 
-                                     aiming_angle, aiming_timer, pause_menu_selected)
-        pygame.display.flip()
+                                     aiming_angle, aiming_timer, pause_menu_selected,
+                                     interpolation, aiming_impact)
+        self.renderer.present()
 
     def run(self):
-        """Main game loop"""
+        """Main game loop - fixed-tick simulation decoupled from rendering"""
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        
         while self.running:
+            current_time = time.perf_counter()
+            # Clamp huge deltas (window drag, debugger) so we never spiral
+            frame_time = min(current_time - previous_time, MAX_FRAME_TIME)
+            previous_time = current_time
+            accumulator += frame_time
+            
             self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            
+            # Run as many fixed ticks as real time demands, up to the catch-up cap
+            ticks_run = 0
+            while accumulator >= TICK_DURATION and ticks_run < MAX_TICKS_PER_FRAME:
+                self.update()
+                accumulator -= TICK_DURATION
+                ticks_run += 1
+            
+            # Still behind after the cap - drop the backlog rather than slow down further
+            if accumulator >= TICK_DURATION:
+                accumulator %= TICK_DURATION
+            
+            # Draw the fraction of the way between the last two ticks
+            self.render(accumulator / TICK_DURATION)
+            
+            # Auto quality judges the frame's busy time (the frame cap's wait excluded); with
+            # dynamic resolution the render scale goes first, quality follows at its ends
+            render_scale = self.renderer.render_scale
+            lowest_scale = not render_scale.dynamic or render_scale.level == len(RENDER_SCALE_LEVELS) - 1
+            full_scale = not render_scale.dynamic or render_scale.level == 0
+            if self.quality_governor.update((time.perf_counter() - current_time) * 1000, lowest_scale, full_scale):
+                self.apply_quality_preset(self.quality_governor.get_preset())
+            self.clock.tick(self.fps)
 
         pygame.quit()
\ No newline at end of file
@@ -11,18 +11,142 @@ Controls:
 
 Press R to reset the game
 Press ESC to quit
+
+Dirty-rectangle presentation (still background, only changed regions sent to the display):
+    python main.py --dirty-rects
+
+Reduced render resolution (arena drawn at a share of the window resolution and scaled up):
+    python main.py --render-scale 0.75
+    python main.py --dynamic-resolution   (lowers/raises the scale to keep frame draw time in budget)
+    python main.py --fullscreen           (frame scaled to the display by SDL)
+
+Render frame cap (default 60 - match it to the display's refresh rate):
+    python main.py --fps 144
+
+Headless mode (no window, all-AI matches at full speed):
+    python main.py --headless --matches 100 --difficulty hard
+    python main.py --headless --batch --matches 5000   (NumPy, all matches at once)
+    python main.py --headless --batch-check --matches 400   (batch engine vs scalar runner statistics)
+
+Tournament (difficulty pairings and seat rotations on every core, JSONL results):
+    python main.py --tournament --matches 2400 --workers 8
 """
 
 import sys
 import os
+import argparse
 
 # Add the project directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from game import Game
+from utils.constants import (BLOOM_DEFAULT_QUALITY, BLOOM_QUALITY_LEVELS, DIFFICULTY_OPTIONS, DIFFICULTY_VALUES,
+                             FPS, HEADLESS_DEFAULT_MATCHES, HEADLESS_MAX_MATCH_TICKS, RENDER_SCALE_LEVELS,
+                             TOURNAMENT_DEFAULT_OUTPUT)
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="4-Player Neon Pong")
+    parser.add_argument('--headless', action='store_true',
+                        help="run all-AI matches with no display and print statistics")
+    parser.add_argument('--matches', type=int, default=HEADLESS_DEFAULT_MATCHES,
+                        help="number of headless matches to run")
+    parser.add_argument('--difficulty', default='medium',
+                        choices=[name.lower() for name in DIFFICULTY_OPTIONS],
+                        help="AI difficulty for headless matches")
+    parser.add_argument('--max-ticks', type=int, default=HEADLESS_MAX_MATCH_TICKS,
+                        help="stop a headless match after this many ticks")
+    parser.add_argument('--batch', action='store_true',
+                        help="step all headless matches at once with the NumPy batch engine")
+    parser.add_argument('--batch-check', action='store_true',
+                        help="play the same seeded matches on the batch engine and the scalar runner, "
+                             "compare match length and win shares, exit 1 if they disagree")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="base random seed - match i uses seed + i (replays exactly)")
+    parser.add_argument('--free-flight', action='store_true',
+                        help="skip collision tests while the ball can't reach a paddle or boundary "
+                             "(headless/tournament, same results)")
+    parser.add_argument('--tournament', action='store_true',
+                        help="play difficulty pairings with seat rotations across all cores")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="tournament worker processes (default: all cores)")
+    parser.add_argument('--output', default=TOURNAMENT_DEFAULT_OUTPUT,
+                        help="JSONL file that tournament results stream to")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="only push changed screen regions to the display (software-rendered kiosks)")
+    parser.add_argument('--bloom', default=BLOOM_DEFAULT_QUALITY, choices=list(BLOOM_QUALITY_LEVELS),
+                        help="glow post-process quality (off: layered glow surfaces)")
+    parser.add_argument('--render-scale', type=float, default=1.0, choices=RENDER_SCALE_LEVELS,
+                        help="arena render resolution as a share of the window (starting value with --dynamic-resolution)")
+    parser.add_argument('--dynamic-resolution', action='store_true',
+                        help="lower or raise the arena render resolution to keep frame draw time in budget")
+    parser.add_argument('--fps', type=int, default=FPS,
+                        help="render frame cap - set it to the display's refresh rate (game speed is unaffected)")
+    parser.add_argument('--fullscreen', action='store_true',
+                        help="fullscreen, with the frame scaled up to the display by SDL")
+    args = parser.parse_args(argv)
+    # The batch engine has no collision-free shortcut; --batch-check already uses it for its scalar run
+    if args.fps <= 0:
+        parser.error("--fps must be positive")
+    if args.free_flight and (args.batch or args.batch_check):
+        parser.error("--free-flight applies to the scalar runner and can't be combined with --batch or --batch-check")
+    return args
+
+def run_headless(args):
+    """Run headless AI matches at maximum speed and print the results"""
+    # Only the pygame-free core is imported here - no SDL initialization
+    from core.headless_runner import HeadlessRunner, print_headless_report
+
+    difficulty_name = next(name for name in DIFFICULTY_OPTIONS if name.lower() == args.difficulty)
+    ai_difficulty = DIFFICULTY_VALUES[difficulty_name]
+
+    if args.batch_check:
+        from core.batch_engine import compare_with_scalar, print_comparison_report
+        comparison = compare_with_scalar(args.matches, ai_difficulty, seed=args.seed or 0, max_ticks=args.max_ticks)
+        print_comparison_report(comparison)
+        if not comparison['agree']:
+            sys.exit(1)
+        return
+
+    try:
+        if args.batch:
+            # NumPy is only needed for the batch engine
+            from core.batch_engine import BatchEngine
+            engine = BatchEngine(args.matches, ai_difficulty, seed=args.seed)
+            stats = engine.run(args.max_ticks)
+        else:
+            runner = HeadlessRunner(ai_difficulty, max_ticks=args.max_ticks, free_flight=args.free_flight)
+            stats = runner.run(args.matches, base_seed=args.seed)
+    except KeyboardInterrupt:
+        print("\nHeadless run interrupted by user")
+        return
+    print_headless_report(stats)
+
+def run_tournament(args):
+    """Run a multi-core AI tournament and print per-seat/per-difficulty win rates"""
+    from core.tournament import TournamentRunner, build_tournament_specs, print_tournament_report
+
+    specs = build_tournament_specs(args.matches, base_seed=args.seed or 0)
+    runner = TournamentRunner(workers=args.workers, max_ticks=args.max_ticks, free_flight=args.free_flight)
+
+    try:
+        stats = runner.run(specs, output_path=args.output)
+    except KeyboardInterrupt:
+        print(f"\nTournament interrupted by user - partial results are in {args.output}")
+        return
+    print_tournament_report(stats, runner.workers, args.output)
 
 def main():
     """Main entry point"""
+    args = parse_args()
+    if args.tournament:
+        run_tournament(args)
+        return
+    if args.headless:
+        run_headless(args)
+        return
+
+    from game import Game
+
     print("Starting 4-Player Neon Pong...")
     print("Controls:")
     print("  Player 1 (Left, Blue): Nintendo Switch Controller or W/S keys")
@@ -35,7 +159,8 @@ def main():
     print()
 
     try:
-        game = Game()
+        game = Game(dirty_rects=args.dirty_rects, bloom_quality=args.bloom, render_scale=args.render_scale,
+                    dynamic_resolution=args.dynamic_resolution, fullscreen=args.fullscreen, fps=args.fps)
         game.run()
     except KeyboardInterrupt:
         print("\nGame interrupted by user")
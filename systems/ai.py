@@ -1,13 +1,13 @@
-from utils.math_utils import clamp
+from core.rng import get_stream
 from utils.constants import (AI_PREDICTION_ENABLED, AI_PREDICTION_LOOKAHEAD_TIME, AI_MAX_PREDICTION_BOUNCES, 
                              AI_PREDICTION_ACCURACY, AI_CENTER_SEEK_ENABLED, AI_CENTER_SEEK_STRENGTH, 
                              AI_ANTICIPATION_DISTANCE, AI_DEFENSIVE_ZONE_SIZE, AI_MIN_THREAT_DISTANCE,
-                             AI_OPPOSITE_WALL_THRESHOLD, SCREEN_WIDTH, SCREEN_HEIGHT, BOUNDARY_THICKNESS)
-import math
+                             WORLD_WIDTH, WORLD_HEIGHT, RNG_STREAM_AI)
 
 class AIPlayer:
-    def __init__(self, paddle, difficulty=0.8):
+    def __init__(self, paddle, difficulty=0.8, rng=None):
         self.paddle = paddle
+        self.rng = rng or get_stream(RNG_STREAM_AI)  # Accuracy errors
         self.difficulty = difficulty  # 0.0 to 1.0, higher = better AI
         self.reaction_delay = 0
         
@@ -52,121 +52,30 @@ class AIPlayer:
         else:  # Hard mode (0.6+)
             self.accuracy_modifier = 1.0  # Perfect accuracy
 
-    def predict_ball_intersection(self, ball):
-        """Predict where the ball will intersect with this paddle's plane"""
+        # How many wall bounces the prediction looks through (None = unlimited)
+        if difficulty < 0.5:
+            self.max_prediction_bounces = AI_MAX_PREDICTION_BOUNCES
+        else:  # Hard mode folds the whole trajectory
+            self.max_prediction_bounces = None
+
+    def predict_ball_intersection(self, ball, forecast):
+        """Predict where the ball will intersect with this paddle's plane.
+
+        Returns (x, y, time_to_reach) with time_to_reach in ticks, or the
+        ball's current position and None when no arrival is predicted (ball
+        moving away, prediction disabled, or heading into another goal first).
+        """
         if not AI_PREDICTION_ENABLED:
-            return ball.x, ball.y
+            return ball.x, ball.y, None
             
         # Disable prediction for easier difficulties
         if self.difficulty < 0.25:  # Easy mode (0.1) - no prediction
-            return ball.x, ball.y
-        
-        # Get current ball state
-        ball_x, ball_y = ball.x, ball.y
-        vel_x, vel_y = ball.velocity.x, ball.velocity.y
-        
-        # Determine the plane this paddle defends
-        if self.paddle.orientation == 'vertical':
-            # Vertical paddle defends a vertical line
-            if self.paddle.x < SCREEN_WIDTH // 2:  # Left paddle
-                target_x = self.paddle.x + self.paddle.width
-            else:  # Right paddle
-                target_x = self.paddle.x
-            
-            # Calculate time to reach paddle's X position
-            if abs(vel_x) < 0.1:  # Ball not moving horizontally
-                return ball_x, ball_y
-            
-            time_to_reach = (target_x - ball_x) / vel_x
-            
-            # If ball is moving away from paddle, return current position
-            if time_to_reach < 0:
-                return ball_x, ball_y
-            
-            # Predict Y position at intersection
-            predicted_y = ball_y + vel_y * time_to_reach
-            
-            # Account for wall bounces
-            predicted_y = self._predict_wall_bounces_y(predicted_y, vel_y, time_to_reach)
-            
-            return target_x, predicted_y
-            
-        else:  # Horizontal paddle
-            # Horizontal paddle defends a horizontal line
-            if self.paddle.y < SCREEN_HEIGHT // 2:  # Top paddle
-                target_y = self.paddle.y + self.paddle.height
-            else:  # Bottom paddle
-                target_y = self.paddle.y
-            
-            # Calculate time to reach paddle's Y position
-            if abs(vel_y) < 0.1:  # Ball not moving vertically
-                return ball_x, ball_y
-            
-            time_to_reach = (target_y - ball_y) / vel_y
-            
-            # If ball is moving away from paddle, return current position
-            if time_to_reach < 0:
-                return ball_x, ball_y
-            
-            # Predict X position at intersection
-            predicted_x = ball_x + vel_x * time_to_reach
-            
-            # Account for wall bounces
-            predicted_x = self._predict_wall_bounces_x(predicted_x, vel_x, time_to_reach)
-            
-            return predicted_x, target_y
-    
-    def _predict_wall_bounces_y(self, predicted_y, vel_y, time_remaining):
-        """Predict Y position accounting for wall bounces"""
-        if AI_MAX_PREDICTION_BOUNCES == 0:
-            return predicted_y
-        
-        # Check if ball will hit top or bottom wall
-        if predicted_y < BOUNDARY_THICKNESS:
-            # Ball hits top wall
-            bounce_time = (BOUNDARY_THICKNESS - predicted_y) / abs(vel_y) if vel_y < 0 else 0
-            if bounce_time < time_remaining:
-                # Ball bounces off top wall
-                remaining_time = time_remaining - bounce_time
-                new_vel_y = -vel_y  # Reverse Y velocity
-                return BOUNDARY_THICKNESS + new_vel_y * remaining_time
-        
-        elif predicted_y > SCREEN_HEIGHT - BOUNDARY_THICKNESS:
-            # Ball hits bottom wall
-            bounce_time = (predicted_y - (SCREEN_HEIGHT - BOUNDARY_THICKNESS)) / abs(vel_y) if vel_y > 0 else 0
-            if bounce_time < time_remaining:
-                # Ball bounces off bottom wall
-                remaining_time = time_remaining - bounce_time
-                new_vel_y = -vel_y  # Reverse Y velocity
-                return (SCREEN_HEIGHT - BOUNDARY_THICKNESS) + new_vel_y * remaining_time
-        
-        return predicted_y
-    
-    def _predict_wall_bounces_x(self, predicted_x, vel_x, time_remaining):
-        """Predict X position accounting for wall bounces"""
-        if AI_MAX_PREDICTION_BOUNCES == 0:
-            return predicted_x
-        
-        # Check if ball will hit left or right wall
-        if predicted_x < BOUNDARY_THICKNESS:
-            # Ball hits left wall
-            bounce_time = (BOUNDARY_THICKNESS - predicted_x) / abs(vel_x) if vel_x < 0 else 0
-            if bounce_time < time_remaining:
-                # Ball bounces off left wall
-                remaining_time = time_remaining - bounce_time
-                new_vel_x = -vel_x  # Reverse X velocity
-                return BOUNDARY_THICKNESS + new_vel_x * remaining_time
-        
-        elif predicted_x > SCREEN_WIDTH - BOUNDARY_THICKNESS:
-            # Ball hits right wall
-            bounce_time = (predicted_x - (SCREEN_WIDTH - BOUNDARY_THICKNESS)) / abs(vel_x) if vel_x > 0 else 0
-            if bounce_time < time_remaining:
-                # Ball bounces off right wall
-                remaining_time = time_remaining - bounce_time
-                new_vel_x = -vel_x  # Reverse X velocity
-                return (SCREEN_WIDTH - BOUNDARY_THICKNESS) + new_vel_x * remaining_time
-        
-        return predicted_x
+            return ball.x, ball.y, None
+
+        impact = forecast.get_impact(self.paddle.player_id, self.max_prediction_bounces)
+        if impact is None:
+            return ball.x, ball.y, None
+        return impact
 
     def stabilize_prediction(self, predicted_x, predicted_y):
         """Stabilize predictions by averaging recent history"""
@@ -188,9 +97,9 @@ class AIPlayer:
         
         return predicted_x, predicted_y
 
-    def get_dynamic_smoothing(self, ball):
+    def get_dynamic_smoothing(self, forecast):
         """Calculate dynamic smoothing factor based on ball distance"""
-        ball_distance = self.calculate_ball_distance(ball)
+        ball_distance = self.calculate_ball_distance(forecast)
         
         # Increase smoothing when ball is close to reduce shaking
         if ball_distance < AI_ANTICIPATION_DISTANCE:
@@ -201,11 +110,14 @@ class AIPlayer:
         
         return self.movement_smoothing
 
-    def get_stable_threshold(self, ball):
-        """Calculate movement threshold with hysteresis to prevent rapid switching"""
-        ball_distance = self.calculate_ball_distance(ball)
-        is_approaching = self.is_ball_approaching(ball)
-        base_threshold = 35 * (1 - self.difficulty + 0.3)
+    def get_base_threshold(self):
+        """Movement dead zone before hysteresis"""
+        return 35 * (1 - self.difficulty + 0.3)
+
+    def get_next_threshold_state(self, forecast):
+        """Threshold state after this tick's hysteresis step"""
+        ball_distance = self.calculate_ball_distance(forecast)
+        is_approaching = self.is_ball_approaching(forecast)
         
         # Determine what threshold state we should be in
         if ball_distance < AI_ANTICIPATION_DISTANCE * 0.8 and is_approaching:
@@ -221,143 +133,110 @@ class AIPlayer:
             if (self.last_threshold_state == "tight" and target_state == "loose") or \
                (self.last_threshold_state == "loose" and target_state == "tight") or \
                (self.last_threshold_state == "normal" and target_state != "normal"):
-                self.last_threshold_state = target_state
-        
-        # Return threshold based on stable state
-        if self.last_threshold_state == "tight":
+                return target_state
+        return self.last_threshold_state
+
+    def get_state_threshold(self, state):
+        """Movement threshold for a threshold state"""
+        base_threshold = self.get_base_threshold()
+        if state == "tight":
             return base_threshold * 0.8  # Tighter than before
-        elif self.last_threshold_state == "loose":
+        elif state == "loose":
             return base_threshold * 1.3  # Looser than before
         else:
             return base_threshold  # Normal
 
+    def get_stable_threshold(self, forecast):
+        """Calculate movement threshold with hysteresis to prevent rapid switching"""
+        self.last_threshold_state = self.get_next_threshold_state(forecast)
+        return self.get_state_threshold(self.last_threshold_state)
+
     def get_paddle_center_position(self):
         """Get the ideal center position for this paddle"""
         if self.paddle.orientation == 'vertical':
-            return SCREEN_HEIGHT // 2
+            return WORLD_HEIGHT // 2
         else:
-            return SCREEN_WIDTH // 2
+            return WORLD_WIDTH // 2
     
-    def calculate_ball_distance(self, ball):
-        """Calculate distance from ball to paddle"""
-        paddle_center = self.paddle.get_center()
-        return math.sqrt((ball.x - paddle_center[0])**2 + (ball.y - paddle_center[1])**2)
+    def calculate_ball_distance(self, forecast):
+        """Get distance from ball to paddle"""
+        return forecast.distance[self.paddle.player_id]
     
-    def is_ball_approaching(self, ball):
+    def is_ball_approaching(self, forecast):
         """Determine if ball is moving toward this paddle"""
-        if self.paddle.orientation == 'vertical':
-            if self.paddle.x < SCREEN_WIDTH // 2:  # Left paddle
-                return ball.velocity.x < 0
-            else:  # Right paddle
-                return ball.velocity.x > 0
-        else:  # Horizontal paddle
-            if self.paddle.y < SCREEN_HEIGHT // 2:  # Top paddle
-                return ball.velocity.y < 0
-            else:  # Bottom paddle
-                return ball.velocity.y > 0
+        return forecast.approaching[self.paddle.player_id]
     
-    def is_ball_heading_to_opposite_wall(self, ball):
+    def is_ball_heading_to_opposite_wall(self, forecast):
         """Determine if ball is clearly heading toward the opposite wall (not this paddle's responsibility)"""
-        if self.paddle.orientation == 'vertical':
-            if self.paddle.x < SCREEN_WIDTH // 2:  # Left paddle
-                # Ball heading strongly right (toward right wall)
-                return ball.velocity.x > AI_OPPOSITE_WALL_THRESHOLD * abs(ball.velocity.y)
-            else:  # Right paddle
-                # Ball heading strongly left (toward left wall)  
-                return ball.velocity.x < -AI_OPPOSITE_WALL_THRESHOLD * abs(ball.velocity.y)
-        else:  # Horizontal paddle
-            if self.paddle.y < SCREEN_HEIGHT // 2:  # Top paddle
-                # Ball heading strongly down (toward bottom wall)
-                return ball.velocity.y > AI_OPPOSITE_WALL_THRESHOLD * abs(ball.velocity.x)
-            else:  # Bottom paddle
-                # Ball heading strongly up (toward top wall)
-                return ball.velocity.y < -AI_OPPOSITE_WALL_THRESHOLD * abs(ball.velocity.x)
+        return forecast.heading_opposite[self.paddle.player_id]
     
-    def calculate_strategic_target(self, ball, predicted_x, predicted_y):
-        """Calculate target position considering strategic positioning"""
+    def get_center_blend(self, forecast):
+        """How strongly the target is pulled toward the center (0 = pure prediction)"""
         if not AI_CENTER_SEEK_ENABLED:
-            return predicted_x, predicted_y
+            return 0.0
             
         # Disable strategic positioning for easier difficulties
         if self.difficulty < 0.25:  # Easy mode (0.1) - no strategic positioning
-            return predicted_x, predicted_y
+            return 0.0
         
         # Calculate distance to ball and whether it's approaching
-        ball_distance = self.calculate_ball_distance(ball)
-        is_approaching = self.is_ball_approaching(ball)
-        is_heading_opposite = self.is_ball_heading_to_opposite_wall(ball)
+        ball_distance = self.calculate_ball_distance(forecast)
+        is_approaching = self.is_ball_approaching(forecast)
+        is_heading_opposite = self.is_ball_heading_to_opposite_wall(forecast)
+        
+        # Strong center-seeking if ball is heading to opposite wall
+        if is_heading_opposite:
+            return AI_CENTER_SEEK_STRENGTH * 1.2  # Extra strong center-seeking
+        
+        # If ball is far away or moving away, blend toward center
+        elif ball_distance > AI_MIN_THREAT_DISTANCE or not is_approaching:
+            return AI_CENTER_SEEK_STRENGTH * (1 - self.difficulty * 0.3)
+        
+        # If ball is close and approaching, prioritize interception but allow some center bias
+        elif ball_distance < AI_ANTICIPATION_DISTANCE and is_approaching:
+            return AI_CENTER_SEEK_STRENGTH * 0.2  # Light center bias
+        
+        # Default: use predicted position
+        return 0.0
+
+    def calculate_strategic_target(self, forecast, predicted_x, predicted_y):
+        """Calculate target position considering strategic positioning"""
+        center_blend = self.get_center_blend(forecast)
+        if center_blend == 0.0:
+            return predicted_x, predicted_y
         
         # Get ideal center position
         center_position = self.get_paddle_center_position()
         
-        # Determine positioning strategy
         if self.paddle.orientation == 'vertical':
-            current_target = predicted_y
-            
-            # Strong center-seeking if ball is heading to opposite wall
-            if is_heading_opposite:
-                center_blend = AI_CENTER_SEEK_STRENGTH * 1.2  # Extra strong center-seeking
-                strategic_target = current_target * (1 - center_blend) + center_position * center_blend
-                return predicted_x, strategic_target
-            
-            # If ball is far away or moving away, blend toward center
-            elif ball_distance > AI_MIN_THREAT_DISTANCE or not is_approaching:
-                center_blend = AI_CENTER_SEEK_STRENGTH * (1 - self.difficulty * 0.3)
-                strategic_target = current_target * (1 - center_blend) + center_position * center_blend
-                return predicted_x, strategic_target
-            
-            # If ball is close and approaching, prioritize interception but allow some center bias
-            elif ball_distance < AI_ANTICIPATION_DISTANCE and is_approaching:
-                # Use predicted position but with slight center bias for better positioning
-                center_blend = AI_CENTER_SEEK_STRENGTH * 0.2  # Light center bias
-                strategic_target = current_target * (1 - center_blend) + center_position * center_blend
-                return predicted_x, strategic_target
-            
+            strategic_target = predicted_y * (1 - center_blend) + center_position * center_blend
+            return predicted_x, strategic_target
         else:  # Horizontal paddle
-            current_target = predicted_x
-            
-            # Strong center-seeking if ball is heading to opposite wall
-            if is_heading_opposite:
-                center_blend = AI_CENTER_SEEK_STRENGTH * 1.2  # Extra strong center-seeking
-                strategic_target = current_target * (1 - center_blend) + center_position * center_blend
-                return strategic_target, predicted_y
-            
-            # If ball is far away or moving away, blend toward center
-            elif ball_distance > AI_MIN_THREAT_DISTANCE or not is_approaching:
-                center_blend = AI_CENTER_SEEK_STRENGTH * (1 - self.difficulty * 0.3)
-                strategic_target = current_target * (1 - center_blend) + center_position * center_blend
-                return strategic_target, predicted_y
-            
-            # If ball is close and approaching, prioritize interception but allow some center bias
-            elif ball_distance < AI_ANTICIPATION_DISTANCE and is_approaching:
-                # Use predicted position but with slight center bias for better positioning
-                center_blend = AI_CENTER_SEEK_STRENGTH * 0.2  # Light center bias
-                strategic_target = current_target * (1 - center_blend) + center_position * center_blend
-                return strategic_target, predicted_y
-        
-        # Default: use predicted position
-        return predicted_x, predicted_y
+            strategic_target = predicted_x * (1 - center_blend) + center_position * center_blend
+            return strategic_target, predicted_y
         
     def apply_accuracy_modifier(self, target_x, target_y):
         """Apply intentional accuracy reduction for easier difficulties"""
-        import random
-        
         # Check if AI should "miss" this time
-        if random.random() > self.accuracy_modifier:
+        if self.rng.random() > self.accuracy_modifier:
             # Introduce intentional error
             if self.paddle.orientation == 'vertical':
                 # Add random offset to Y target (up to 50 pixels off)
-                error_offset = random.randint(-50, 50)
+                error_offset = self.rng.randint(-50, 50)
                 target_y += error_offset
             else:  # horizontal paddle
                 # Add random offset to X target (up to 50 pixels off)
-                error_offset = random.randint(-50, 50)
+                error_offset = self.rng.randint(-50, 50)
                 target_x += error_offset
                 
         return target_x, target_y
 
-    def update(self, ball):
-        """Update AI paddle movement to track the ball"""
+    def update(self, ball, forecast):
+        """Update AI paddle movement to track the ball.
+
+        forecast is the tick's shared BallForecast (already updated for this
+        ball), so every AI sees the same prediction without redoing the math.
+        """
         # Simple reaction delay to make AI beatable
         if self.reaction_delay > 0:
             self.reaction_delay -= 1
@@ -366,13 +245,13 @@ class AIPlayer:
         paddle_center = self.paddle.get_center()
         
         # Get predicted ball intersection point
-        predicted_x, predicted_y = self.predict_ball_intersection(ball)
+        predicted_x, predicted_y, _ = self.predict_ball_intersection(ball, forecast)
         
         # Stabilize predictions to reduce shaking
         stable_x, stable_y = self.stabilize_prediction(predicted_x, predicted_y)
         
         # Apply strategic positioning
-        strategic_x, strategic_y = self.calculate_strategic_target(ball, stable_x, stable_y)
+        strategic_x, strategic_y = self.calculate_strategic_target(forecast, stable_x, stable_y)
         
         # Apply accuracy modifier for easier difficulties
         strategic_x, strategic_y = self.apply_accuracy_modifier(strategic_x, strategic_y)
@@ -383,7 +262,7 @@ class AIPlayer:
             ball_target = strategic_y
             
             # Smooth target position update with dynamic smoothing
-            dynamic_smoothing = self.get_dynamic_smoothing(ball)
+            dynamic_smoothing = self.get_dynamic_smoothing(forecast)
             if self.target_position is None:
                 self.target_position = ball_target
             else:
@@ -397,7 +276,7 @@ class AIPlayer:
 
             # Move towards smoothed target with stable threshold and movement hysteresis
             diff = self.target_position - current_y
-            threshold = self.get_stable_threshold(ball)
+            threshold = self.get_stable_threshold(forecast)
             
             # Movement commitment - continue current movement for minimum duration
             if self.movement_commitment_frames > 0:
@@ -431,7 +310,7 @@ class AIPlayer:
             ball_target = strategic_x
             
             # Smooth target position update with dynamic smoothing
-            dynamic_smoothing = self.get_dynamic_smoothing(ball)
+            dynamic_smoothing = self.get_dynamic_smoothing(forecast)
             if self.target_position is None:
                 self.target_position = ball_target
             else:
@@ -445,7 +324,7 @@ class AIPlayer:
 
             # Move towards smoothed target with stable threshold and movement hysteresis
             diff = self.target_position - current_x
-            threshold = self.get_stable_threshold(ball)
+            threshold = self.get_stable_threshold(forecast)
             
             # Movement commitment - continue current movement for minimum duration
             if self.movement_commitment_frames > 0:
@@ -472,4 +351,4 @@ class AIPlayer:
             else:
                 self.is_moving = False
                 # Restore original speed when not moving
-                self.paddle.speed = self.original_paddle_speed
\ No newline at end of file
+                self.paddle.speed = self.original_paddle_speed
@@ -1,11 +1,13 @@
 import math
-import random
+from core.rng import get_stream
+from systems.ball_forecast import BallForecast
 from utils.constants import *
 
 class AimingSystem:
     """Manages aiming mode for both human and AI players"""
     
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng or get_stream(RNG_STREAM_AI)  # AI aim choices
         self.aiming_player = -1  # Which player is currently aiming (-1 = none)
         self.aiming_timer = 0    # Timer for aiming phase
         self.aiming_angle = 0    # Current aiming angle
@@ -14,6 +16,10 @@ class AimingSystem:
         self.ai_target_angle = 0  # Target angle for AI
         self.ai_angle_speed = 1.5  # Degrees per frame for smooth movement
         self.ai_aiming_started = False
+
+        # Where the ball would go if launched now (drawn as an impact marker)
+        self.preview_forecast = BallForecast()
+        self.preview_impact = None
         
     def is_aiming_active(self):
         """Check if aiming mode is currently active"""
@@ -45,41 +51,47 @@ class AimingSystem:
             margin = 120  # Distance from boundary
             if losing_player == 0:  # Left player
                 ball.x = BOUNDARY_THICKNESS + margin
-                ball.y = SCREEN_HEIGHT // 2
+                ball.y = WORLD_HEIGHT // 2
                 self.aiming_angle = 0  # Start aiming straight right
             elif losing_player == 1:  # Right player
-                ball.x = SCREEN_WIDTH - BOUNDARY_THICKNESS - margin
-                ball.y = SCREEN_HEIGHT // 2
+                ball.x = WORLD_WIDTH - BOUNDARY_THICKNESS - margin
+                ball.y = WORLD_HEIGHT // 2
                 self.aiming_angle = 180  # Start aiming straight left
             elif losing_player == 2:  # Top player
-                ball.x = SCREEN_WIDTH // 2
+                ball.x = WORLD_WIDTH // 2
                 ball.y = BOUNDARY_THICKNESS + margin
                 self.aiming_angle = 90  # Start aiming straight down
             elif losing_player == 3:  # Bottom player
-                ball.x = SCREEN_WIDTH // 2
-                ball.y = SCREEN_HEIGHT - BOUNDARY_THICKNESS - margin
+                ball.x = WORLD_WIDTH // 2
+                ball.y = WORLD_HEIGHT - BOUNDARY_THICKNESS - margin
                 self.aiming_angle = 270  # Start aiming straight up
             
             ball.velocity.x = 0
             ball.velocity.y = 0
+
+            # Teleport - don't interpolate from the old position
+            ball.store_previous_position()
         else:
             # Dead player - just reset ball normally
             ball.reset_position()
             
-    def update_aiming_mode(self, paddles, alive_players, input_handler):
-        """Update game during aiming phase"""
+    def update_aiming_mode(self, paddles, alive_players, input_handler, ball=None):
+        """Update game during aiming phase (ball refreshes the launch preview)"""
         # Update aiming timer
         self.aiming_timer -= 1
         
         # Update input for aiming player only
         if self.aiming_player >= 0 and alive_players[self.aiming_player]:
-            if self.aiming_player == 0:  # Human player
+            if self.aiming_player == 0 and input_handler is not None:  # Human player
                 input_handler.update_paddle_movement([paddles[0]])
                 # Actually update the paddle position
                 paddles[0].update()
                 self.update_aiming_angle(paddles[self.aiming_player])
             else:  # AI player - auto aim
                 self.auto_aim_for_ai()
+
+            if ball is not None:
+                self.update_preview(ball, paddles, alive_players)
         
         # Return True if it's time to launch the ball
         return self.aiming_timer <= 0
@@ -94,23 +106,23 @@ class AimingSystem:
         # Convert paddle position to angle based on which player is aiming
         if self.aiming_player == 0:  # Left player
             # Paddle Y position controls angle from straight right
-            normalized_pos = (paddle_center[1] - SCREEN_HEIGHT // 2) / (SCREEN_HEIGHT // 2)
+            normalized_pos = (paddle_center[1] - WORLD_HEIGHT // 2) / (WORLD_HEIGHT // 2)
             # Clamp normalized position to avoid extreme angles
             normalized_pos = max(-1, min(1, normalized_pos))
             self.aiming_angle = -normalized_pos * AIMING_ANGLE_RANGE  # Negative for upward
             
         elif self.aiming_player == 1:  # Right player  
-            normalized_pos = (paddle_center[1] - SCREEN_HEIGHT // 2) / (SCREEN_HEIGHT // 2)
+            normalized_pos = (paddle_center[1] - WORLD_HEIGHT // 2) / (WORLD_HEIGHT // 2)
             normalized_pos = max(-1, min(1, normalized_pos))
             self.aiming_angle = 180 + normalized_pos * AIMING_ANGLE_RANGE
             
         elif self.aiming_player == 2:  # Top player
-            normalized_pos = (paddle_center[0] - SCREEN_WIDTH // 2) / (SCREEN_WIDTH // 2)
+            normalized_pos = (paddle_center[0] - WORLD_WIDTH // 2) / (WORLD_WIDTH // 2)
             normalized_pos = max(-1, min(1, normalized_pos))
             self.aiming_angle = 90 + normalized_pos * AIMING_ANGLE_RANGE
             
         elif self.aiming_player == 3:  # Bottom player
-            normalized_pos = (paddle_center[0] - SCREEN_WIDTH // 2) / (SCREEN_WIDTH // 2)
+            normalized_pos = (paddle_center[0] - WORLD_WIDTH // 2) / (WORLD_WIDTH // 2)
             normalized_pos = max(-1, min(1, normalized_pos))
             self.aiming_angle = 270 - normalized_pos * AIMING_ANGLE_RANGE
             
@@ -121,7 +133,7 @@ class AimingSystem:
             base_angles = [0, 180, 90, 270]  # Straight out for each player
             base_angle = base_angles[self.aiming_player]
             # Larger range for more interesting AI behavior
-            angle_offset = random.uniform(-45, 45)
+            angle_offset = self.rng.uniform(-45, 45)
             self.ai_target_angle = base_angle + angle_offset
             self.ai_aiming_started = True
         
@@ -144,25 +156,45 @@ class AimingSystem:
         # Keep angle in valid range
         self.aiming_angle = self.aiming_angle % 360
         
-    def launch_ball(self, ball):
-        """Launch the ball with the current aiming angle"""
+    def get_launch_velocity(self):
+        """Velocity the ball would be launched with at the current aiming angle"""
         # Convert angle to velocity
         angle_rad = math.radians(self.aiming_angle)
         speed = BALL_SPEED
         
-        ball.velocity.x = math.cos(angle_rad) * speed
-        ball.velocity.y = math.sin(angle_rad) * speed
+        velocity_x = math.cos(angle_rad) * speed
+        velocity_y = math.sin(angle_rad) * speed
         
         # Ensure minimum speeds
-        if abs(ball.velocity.x) < 2:
-            ball.velocity.x = 2 if ball.velocity.x >= 0 else -2
-        if abs(ball.velocity.y) < 2:
-            ball.velocity.y = 2 if ball.velocity.y >= 0 else -2
+        if abs(velocity_x) < 2:
+            velocity_x = 2 if velocity_x >= 0 else -2
+        if abs(velocity_y) < 2:
+            velocity_y = 2 if velocity_y >= 0 else -2
+        return velocity_x, velocity_y
+
+    def update_preview(self, ball, paddles, alive_players):
+        """Forecast the first paddle line the ball would reach if launched now"""
+        velocity_x, velocity_y = self.get_launch_velocity()
+        self.preview_forecast.radius = ball.size // 2
+        # Only re-solved when the aiming angle actually changes
+        self.preview_forecast.update_from_state(ball.x, ball.y, velocity_x, velocity_y,
+                                                paddles, alive_players)
+        first_impact = self.preview_forecast.get_first_impact()
+        self.preview_impact = first_impact[1:3] if first_impact is not None else None
+
+    def get_preview_impact(self):
+        """Get the forecast (x, y) impact point for the current aim, or None"""
+        return self.preview_impact
+        
+    def launch_ball(self, ball):
+        """Launch the ball with the current aiming angle"""
+        ball.velocity.x, ball.velocity.y = self.get_launch_velocity()
         
         # Reset aiming state
         self.aiming_player = -1
         self.aiming_timer = 0
         self.ai_aiming_started = False
+        self.preview_impact = None
         
     def reset(self):
         """Reset aiming system to initial state"""
@@ -170,4 +202,5 @@ class AimingSystem:
         self.aiming_timer = 0
         self.aiming_angle = 0
         self.ai_target_angle = 0
-        self.ai_aiming_started = False
\ No newline at end of file
+        self.ai_aiming_started = False
+        self.preview_impact = None
@@ -0,0 +1,182 @@
+import math
+from utils.math_utils import clamp, mirror_fold
+from utils.constants import *
+
+# Per-side layout in player order: left, right, top, bottom
+SIDE_NORMAL_AXIS = (0, 0, 1, 1)  # Axis the ball travels along to reach the side (0 = x, 1 = y)
+SIDE_SIGN = (-1, 1, -1, 1)       # Direction of the side along that axis
+SIDE_NEIGHBORS = ((2, 3), (2, 3), (0, 1), (0, 1))  # Sides bounding the trajectory (low, high)
+
+class BallForecast:
+    """Shared view of where the ball is heading, computed once per tick.
+
+    Caches, for every side, whether the ball is approaching it, how far it is
+    from that side's paddle, and the next impact point and time on the
+    paddle's contact plane. The impact prediction only depends on the
+    ball's line of flight, so it is recomputed only when the velocity (or
+    the alive mask) changes or the ball jumps off its line; between
+    bounces the cached arrival times just count down.
+    """
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.vx = 0.0
+        self.vy = 0.0
+        self.radius = BALL_SIZE // 2
+        self.alive_players = None
+        self.valid = False
+
+        # Per-side forecast
+        self.approaching = [False, False, False, False]
+        self.heading_opposite = [False, False, False, False]
+        self.distance = [0.0, 0.0, 0.0, 0.0]         # Ball to paddle center
+        self.contact_plane = [0.0, 0.0, 0.0, 0.0]    # Ball-center line where it meets the paddle
+        self.time_to_impact = [None, None, None, None]  # Ticks until the contact plane is reached
+        self.unfolded_impact = [None, None, None, None]  # Tangent position before wall folding
+        self.impact = [None, None, None, None]       # (x, y) after unlimited wall bounces, or None
+
+        self.recompute_count = 0  # How often the trajectory was actually re-solved
+
+    def invalidate(self):
+        """Force the next update to recompute the trajectory"""
+        self.valid = False
+
+    def update(self, ball, paddles, alive_players):
+        """Refresh the forecast from the live ball (call once per tick)"""
+        self.radius = ball.size // 2
+        self.update_from_state(ball.x, ball.y, ball.velocity.x, ball.velocity.y, paddles, alive_players)
+
+    def update_from_state(self, x, y, vx, vy, paddles, alive_players):
+        """Refresh the forecast for an arbitrary ball state (e.g. an aiming preview)"""
+        alive = tuple(alive_players)
+        same_line = self.valid and vx == self.vx and vy == self.vy and alive == self.alive_players
+
+        if same_line and x == self.x and y == self.y:
+            pass  # Nothing moved
+        elif same_line and abs(x - (self.x + vx)) < 1e-6 and abs(y - (self.y + vy)) < 1e-6:
+            # One tick further along the same line - impacts are unchanged, just closer
+            for side in range(4):
+                if self.time_to_impact[side] is not None:
+                    self.time_to_impact[side] -= 1
+        else:
+            self.recompute(x, y, vx, vy, paddles, alive)
+
+        self.x, self.y = x, y
+        for side, paddle in enumerate(paddles):
+            center_x, center_y = paddle.get_center()
+            self.distance[side] = math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
+
+    def recompute(self, x, y, vx, vy, paddles, alive):
+        """Solve the trajectory against every side"""
+        self.vx, self.vy = vx, vy
+        self.alive_players = alive
+        self.valid = True
+        self.recompute_count += 1
+
+        position = (x, y)
+        velocity = (vx, vy)
+        for side, paddle in enumerate(paddles):
+            normal_axis = SIDE_NORMAL_AXIS[side]
+            sign = SIDE_SIGN[side]
+            vel_normal = velocity[normal_axis]
+            vel_tangent = velocity[1 - normal_axis]
+
+            self.approaching[side] = vel_normal * sign > 0
+            # Clearly heading for the opposite wall - not this paddle's responsibility
+            self.heading_opposite[side] = -sign * vel_normal > AI_OPPOSITE_WALL_THRESHOLD * abs(vel_tangent)
+
+            if paddle.orientation == 'vertical':
+                plane = paddle.x + paddle.width + self.radius if sign < 0 else paddle.x - self.radius
+            else:
+                plane = paddle.y + paddle.height + self.radius if sign < 0 else paddle.y - self.radius
+            self.contact_plane[side] = plane
+
+            self.time_to_impact[side] = None
+            self.unfolded_impact[side] = None
+            self.impact[side] = None
+            if not alive[side] or abs(vel_normal) < 0.1:
+                continue
+
+            time_to_reach = (plane - position[normal_axis]) / vel_normal
+            if time_to_reach < 0:  # Moving away (or already past the paddle)
+                continue
+
+            unfolded = position[1 - normal_axis] + vel_tangent * time_to_reach
+            folded = self.fold(side, unfolded, None)
+            if folded is None:  # Reaches another player's goal first
+                continue
+
+            self.time_to_impact[side] = time_to_reach
+            self.unfolded_impact[side] = unfolded
+            self.impact[side] = self.to_point(side, folded)
+
+    def get_tangent_bounds(self, side):
+        """Ball-center limits along a side's paddle axis, and whether each end is a goal"""
+        low_side, high_side = SIDE_NEIGHBORS[side]
+        tangent_size = WORLD_HEIGHT if SIDE_NORMAL_AXIS[side] == 0 else WORLD_WIDTH
+        low_is_goal = self.alive_players[low_side]
+        high_is_goal = self.alive_players[high_side]
+        # Dead sides are walls the ball edge bounces off; live sides are goal lines
+        low = BOUNDARY_THICKNESS if low_is_goal else BOUNDARY_THICKNESS + self.radius
+        high = tangent_size - (BOUNDARY_THICKNESS if high_is_goal else BOUNDARY_THICKNESS + self.radius)
+        return low, high, low_is_goal, high_is_goal
+
+    def fold(self, side, position, max_bounces):
+        """Fold an unbounded tangent position through wall bounces in O(1).
+
+        Returns None when the ball reaches a live player's goal before this
+        side. max_bounces limits how far the fold looks (None = unlimited).
+        """
+        low, high, low_is_goal, high_is_goal = self.get_tangent_bounds(side)
+        folded, bounces, first_wall = mirror_fold(position, low, high)
+        if bounces == 0:
+            return folded
+
+        # Walls are hit alternately starting with first_wall - any goal ends the flight
+        first_is_goal = high_is_goal if first_wall > 0 else low_is_goal
+        second_is_goal = low_is_goal if first_wall > 0 else high_is_goal
+        if first_is_goal or (bounces > 1 and second_is_goal):
+            return None
+
+        if max_bounces is not None and bounces > max_bounces:
+            # Limited lookahead - reflect only as far as the caller can see
+            for _ in range(max_bounces):
+                if position < low:
+                    position = 2 * low - position
+                elif position > high:
+                    position = 2 * high - position
+            return clamp(position, low, high)
+
+        return folded
+
+    def to_point(self, side, tangent):
+        """Convert a position along a side's contact plane to (x, y)"""
+        if SIDE_NORMAL_AXIS[side] == 0:
+            return self.contact_plane[side], tangent
+        return tangent, self.contact_plane[side]
+
+    def get_impact(self, side, max_bounces=None):
+        """Next (x, y, time_to_impact) on a side's contact plane, or None.
+
+        max_bounces caps how many wall bounces are folded through, for AIs
+        with limited lookahead; None uses the cached unlimited prediction.
+        """
+        time_to_impact = self.time_to_impact[side]
+        if time_to_impact is None:
+            return None
+        if max_bounces is None:
+            x, y = self.impact[side]
+        else:
+            x, y = self.to_point(side, self.fold(side, self.unfolded_impact[side], max_bounces))
+        return x, y, time_to_impact
+
+    def get_first_impact(self):
+        """Earliest impact on any live side as (side, x, y, time), or None"""
+        first = None
+        for side in range(4):
+            time_to_impact = self.time_to_impact[side]
+            if time_to_impact is not None and (first is None or time_to_impact < first[3]):
+                x, y = self.impact[side]
+                first = (side, x, y, time_to_impact)
+        return first
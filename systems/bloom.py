@@ -0,0 +1,157 @@
+import numpy as np
+import pygame
+from utils.constants import *
+from systems.display_presenter import get_tile_runs
+
+class BloomRenderer:
+    """Post-process glow: emissive shapes are drawn into a low-resolution
+    buffer, box blurred and added onto the finished frame.
+
+    With bloom on, paddles, boundaries and the ball register themselves as
+    emissive instead of stacking translucent glow surfaces. A second box
+    blur pass turns the box kernel into a smoother triangle falloff. Only
+    the buffer tiles the blur actually lit are scaled up and added, so the
+    cost follows the glowing area rather than the screen size.
+    """
+
+    def __init__(self, screen_size, quality=BLOOM_DEFAULT_QUALITY):
+        self.screen_size = screen_size
+        self.scale = 1.0  # Pixels per world unit of the surface bloom is applied to
+        self.set_quality(quality)
+
+    def resize(self, screen_size, scale=1.0):
+        """Follow the size of the surface bloom is applied to (the world layer at its render scale)"""
+        if (screen_size, scale) != (self.screen_size, self.scale):
+            self.screen_size = screen_size
+            self.scale = scale
+            self.set_quality(self.quality)
+
+    def set_quality(self, quality):
+        """Switch bloom quality (BLOOM_QUALITY_LEVELS key) - "off" keeps the layered glows"""
+        settings = BLOOM_QUALITY_LEVELS[quality]
+        self.quality = quality
+        self.enabled = settings is not None
+        self.buffer = None
+        self.work = None
+        if not self.enabled:
+            return
+
+        # The buffer keeps its size in world units, so the glow spread doesn't change with the render scale
+        self.downscale = max(1, round(settings['downscale'] * self.scale))
+        self.radius = settings['radius']
+        self.passes = settings['passes']
+        self.strength = settings['strength']
+
+        # Emissive buffer, rounded up to whole tiles
+        tile = BLOOM_TILE_SIZE
+        width, height = self.screen_size
+        self.buffer_size = (-(-width // (self.downscale * tile)) * tile,
+                            -(-height // (self.downscale * tile)) * tile)
+        self.buffer = pygame.Surface(self.buffer_size, 0, 32)
+
+        # Blur workspace in row-major (y, x, byte) order with a zero border for the kernel spread.
+        # Every byte of a pixel is blurred the same way, so the channel order doesn't matter
+        self.border = self.radius * self.passes
+        self.work = np.zeros((self.buffer_size[1] + 2 * self.border,
+                              self.buffer_size[0] + 2 * self.border, 4), dtype=np.uint16)
+
+        # Tiles the blurred glow reaches, marked from the emissive shapes (tile row, tile column)
+        self.tile_lit = np.zeros((self.buffer_size[1] // tile, self.buffer_size[0] // tile), dtype=bool)
+        self.has_emission = False
+
+    def begin_frame(self):
+        """Clear the emissive buffer"""
+        if self.enabled and self.has_emission:
+            self.buffer.fill(BLACK)
+            self.tile_lit.fill(False)
+            self.has_emission = False
+
+    def get_emissive_color(self, color, intensity):
+        """Glow color for an element, scaled by its intensity and the bloom strength"""
+        scale = intensity * self.strength
+        return tuple(min(255, int(c * scale)) for c in color)
+
+    def add_rect(self, rect, color, intensity=1.0):
+        """Mark a rectangle (screen coordinates) as emissive"""
+        scale = self.downscale
+        left, top = int(rect[0]) // scale, int(rect[1]) // scale
+        right = -(-int(rect[0] + rect[2]) // scale)
+        bottom = -(-int(rect[1] + rect[3]) // scale)
+        right, bottom = max(right, left + 1), max(bottom, top + 1)
+        pygame.draw.rect(self.buffer, self.get_emissive_color(color, intensity),
+                         (left, top, right - left, bottom - top))
+        self.mark_lit(left, top, right, bottom)
+
+    def add_circle(self, center, radius, color, intensity=1.0):
+        """Mark a circle (screen coordinates) as emissive"""
+        scale = self.downscale
+        x, y = int(center[0]) // scale, int(center[1]) // scale
+        radius = max(1, round(radius / scale))
+        pygame.draw.circle(self.buffer, self.get_emissive_color(color, intensity), (x, y), radius)
+        self.mark_lit(x - radius, y - radius, x + radius + 1, y + radius + 1)
+
+    def mark_lit(self, left, top, right, bottom):
+        """Mark the tiles an emissive shape's blurred glow can reach (buffer coordinates)"""
+        tile, spread = BLOOM_TILE_SIZE, self.border
+        self.tile_lit[max(0, top - spread) // tile:-(-(bottom + spread) // tile),
+                      max(0, left - spread) // tile:-(-(right + spread) // tile)] = True
+        self.has_emission = True
+
+    def blur(self):
+        """Separable box blur of the emissive buffer in place; returns the lit-tile rects (buffer pixels)"""
+        border, radius = self.border, self.radius
+        width, height = self.buffer_size
+        work = self.work
+        work.fill(0)
+        # Row-major byte view of the buffer pixels (no copy, unlike surfarray's transposed views)
+        buffer = self.buffer.get_buffer()
+        pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(height, -1, 4)[:, :width]
+        inner = work[border:border + height, border:border + width]
+        inner[:] = pixels
+
+        taps = 2 * radius + 1
+        for _ in range(self.passes):
+            for axis in (0, 1):
+                # Sliding sum over taps neighbours along one axis
+                length = work.shape[axis] - 2 * radius
+                window = [slice(None)] * 3
+                window[axis] = slice(0, length)
+                total = work[tuple(window)].copy()
+                for offset in range(1, taps):
+                    window[axis] = slice(offset, offset + length)
+                    total += work[tuple(window)]
+                total //= taps
+                window[axis] = slice(radius, radius + length)
+                work[tuple(window)] = total
+
+        pixels[:] = inner
+        del pixels, buffer  # Release the surface lock before blitting
+
+        # Stack horizontal runs of lit tiles with the same span in consecutive rows into one rect
+        tile = BLOOM_TILE_SIZE
+        rects = []
+        open_rects = {}
+        for row, start, end in get_tile_runs(self.tile_lit):
+            rect = open_rects.get((start, end))
+            if rect is not None and rect.bottom == row:
+                rect.height += 1
+            else:
+                rect = pygame.Rect(start, row, end - start, 1)
+                open_rects[(start, end)] = rect
+                rects.append(rect)
+        return [pygame.Rect(rect.x * tile, rect.y * tile, rect.width * tile, rect.height * tile) for rect in rects]
+
+    def apply(self, screen):
+        """Blur the emissive buffer and add it onto the frame"""
+        if not self.enabled or not self.has_emission:
+            return
+        scale = self.downscale
+        bounds = self.buffer.get_rect()
+        for rect in self.blur():
+            # Scale with one extra buffer pixel on each side, to (n - 1) * scale + 1 pixels so buffer
+            # pixel i lands exactly on i * scale - every rect then samples the same grid, seam free
+            source = rect.inflate(2, 2).clip(bounds)
+            glow = pygame.transform.smoothscale(self.buffer.subsurface(source),
+                                                ((source.width - 1) * scale + 1, (source.height - 1) * scale + 1))
+            area = ((rect.x - source.x) * scale, (rect.y - source.y) * scale, rect.width * scale, rect.height * scale)
+            screen.blit(glow, (rect.x * scale, rect.y * scale), area, special_flags=pygame.BLEND_RGB_ADD)
@@ -1,78 +1,145 @@
 from utils.constants import *
 
+# Boundary sides in player order: left, right, top, bottom
+BOUNDARY_SIDES = ["left", "right", "top", "bottom"]
+
 class CollisionSystem:
     """Manages all collision detection and handling"""
-    
+
     def __init__(self):
         pass
-        
-    def check_ball_paddle_collisions(self, ball, paddles, alive_players, particle_system, renderer):
-        """Check and handle ball-paddle collisions"""
-        for i, paddle in enumerate(paddles):
-            if alive_players[i] and ball.rect.colliderect(paddle.rect):
-                ball.bounce_off_paddle(paddle)
-                # Add particle effect for paddle hit
-                particle_system.add_ball_impact_burst(ball.x, ball.y, paddle.color)
-                # Add screen shake for paddle hit
-                renderer.add_screen_shake(3, 8)
-                return True  # Collision occurred
-        return False  # No collision
-        
-    def check_ball_boundary_collisions(self, ball, alive_players, particle_system, renderer):
-        """Check ball boundary collisions - return collision info"""
+
+    def move_ball(self, ball, paddles, alive_players):
+        """Move the ball through one tick with swept collision detection.
+
+        Each contact is found at its exact time of impact within the tick and
+        resolved in order, so several contacts (paddle then wall, two walls in
+        a corner) can happen in a single tick and fast balls cannot tunnel.
+        Returns collision info for the tick, including every contact so the
+        caller can add visual feedback.
+        """
         collision_info = {
             'collision_occurred': False,
             'player_hit': -1,
             'bounced': False,
-            'life_lost': False
+            'life_lost': False,
+            'paddle_hit': -1,
+            'contacts': []  # (kind, player_id, x, y) in the order they happened
         }
-        
-        # Check left boundary
-        if ball.x <= BOUNDARY_THICKNESS:
-            collision_info['collision_occurred'] = True
-            collision_info['player_hit'] = 0
-            if alive_players[0]:  # Live player - loses life
-                collision_info['life_lost'] = True
-            else:  # Dead player - ball bounces
-                ball.bounce_off_wall("left")
-                particle_system.add_wall_impact_sparks(ball.x, ball.y)
-                renderer.add_screen_shake(1, 4)
-                collision_info['bounced'] = True
 
-        # Check right boundary
-        elif ball.x >= SCREEN_WIDTH - BOUNDARY_THICKNESS:
-            collision_info['collision_occurred'] = True
-            collision_info['player_hit'] = 1
-            if alive_players[1]:  # Live player - loses life
-                collision_info['life_lost'] = True
-            else:  # Dead player - ball bounces
-                ball.bounce_off_wall("right")
-                particle_system.add_wall_impact_sparks(ball.x, ball.y)
-                renderer.add_screen_shake(1, 4)
-                collision_info['bounced'] = True
+        remaining = 1.0  # Fraction of the tick left to travel
+        for _ in range(MAX_COLLISIONS_PER_TICK):
+            contact = self.find_first_contact(ball, paddles, alive_players, remaining)
+            if contact is None:
+                ball.move(remaining)
+                return collision_info
 
-        # Check top boundary
-        elif ball.y <= BOUNDARY_THICKNESS:
+            toi, kind, player_id = contact
+            ball.move(remaining * toi)
+            remaining *= 1.0 - toi
             collision_info['collision_occurred'] = True
-            collision_info['player_hit'] = 2
-            if alive_players[2]:  # Live player - loses life
-                collision_info['life_lost'] = True
-            else:  # Dead player - ball bounces
-                ball.bounce_off_wall("top")
-                particle_system.add_wall_impact_sparks(ball.x, ball.y)
-                renderer.add_screen_shake(1, 4)
-                collision_info['bounced'] = True
 
-        # Check bottom boundary
-        elif ball.y >= SCREEN_HEIGHT - BOUNDARY_THICKNESS:
-            collision_info['collision_occurred'] = True
-            collision_info['player_hit'] = 3
-            if alive_players[3]:  # Live player - loses life
+            if kind == 'paddle':
+                paddle = paddles[player_id]
+                ball.bounce_off_paddle(paddle)
+                collision_info['paddle_hit'] = player_id
+                collision_info['contacts'].append(('paddle', player_id, ball.x, ball.y))
+            elif alive_players[player_id]:  # Live player - loses life
+                collision_info['player_hit'] = player_id
                 collision_info['life_lost'] = True
+                return collision_info
             else:  # Dead player - ball bounces
-                ball.bounce_off_wall("bottom")
-                particle_system.add_wall_impact_sparks(ball.x, ball.y)
-                renderer.add_screen_shake(1, 4)
+                collision_info['player_hit'] = player_id
+                ball.bounce_off_wall(BOUNDARY_SIDES[player_id])
+                collision_info['contacts'].append(('wall', player_id, ball.x, ball.y))
                 collision_info['bounced'] = True
-                
-        return collision_info
\ No newline at end of file
+
+        # Contact budget used up - the rest of this tick's travel is dropped
+        return collision_info
+
+    def find_first_contact(self, ball, paddles, alive_players, fraction=1.0):
+        """Find the earliest contact along the ball's move this tick.
+
+        Returns (time_of_impact, kind, player_id) with time_of_impact in
+        [0, 1] relative to the move, kind 'paddle' or 'boundary', or None.
+        """
+        dx = ball.velocity.x * fraction
+        dy = ball.velocity.y * fraction
+        radius = ball.size // 2
+        first_contact = None
+
+        # Paddles first so a paddle wins a tie with the boundary behind it
+        for i, paddle in enumerate(paddles):
+            if not alive_players[i]:
+                continue
+            hit = paddle.rect.sweep_circle(ball.x, ball.y, dx, dy, radius)
+            if hit is not None and (first_contact is None or hit[0] < first_contact[0]):
+                first_contact = (hit[0], 'paddle', i)
+
+        for side in range(4):
+            toi = self.boundary_time_of_impact(ball.x, ball.y, dx, dy, side,
+                                               alive_players[side], radius)
+            if toi is not None and (first_contact is None or toi < first_contact[0]):
+                first_contact = (toi, 'boundary', side)
+
+        return first_contact
+
+    def free_flight_time(self, ball, paddles, alive_players, horizon):
+        """Ticks (up to horizon) before the ball can touch anything at all.
+
+        Paddles only ever move along their own lane, so until the ball enters
+        a live paddle's lane (widened by its radius) or reaches a boundary no
+        contact is possible wherever the paddles go.
+        """
+        vx, vy = ball.velocity.x, ball.velocity.y
+        radius = ball.size // 2
+        earliest = float(horizon)
+
+        for side in range(4):
+            toi = self.boundary_time_of_impact(ball.x, ball.y, vx * horizon, vy * horizon,
+                                               side, alive_players[side], radius)
+            if toi is not None:
+                earliest = min(earliest, toi * horizon)
+
+        for i, paddle in enumerate(paddles):
+            if not alive_players[i]:
+                continue
+            rect = paddle.rect
+            if paddle.orientation == 'vertical':
+                position, velocity, low, high = ball.x, vx, rect.left - radius, rect.right + radius
+            else:
+                position, velocity, low, high = ball.y, vy, rect.top - radius, rect.bottom + radius
+            if low <= position <= high:
+                return 0.0  # Already in the lane
+            if velocity > 0 and position < low:
+                earliest = min(earliest, (low - position) / velocity)
+            elif velocity < 0 and position > high:
+                earliest = min(earliest, (high - position) / velocity)
+
+        return earliest
+
+    def boundary_time_of_impact(self, x, y, dx, dy, side, is_goal, radius):
+        """Time of impact in [0, 1] against one boundary, or None.
+
+        A live player's boundary is a goal line the ball center must cross;
+        a dead player's boundary is a wall the ball edge bounces off.
+        """
+        inset = BOUNDARY_THICKNESS if is_goal else BOUNDARY_THICKNESS + radius
+
+        if side == 0:  # Left
+            position, delta, plane = x, dx, inset
+        elif side == 1:  # Right
+            position, delta, plane = -x, -dx, inset - WORLD_WIDTH
+        elif side == 2:  # Top
+            position, delta, plane = y, dy, inset
+        else:  # Bottom
+            position, delta, plane = -y, -dy, inset - WORLD_HEIGHT
+
+        # Only boundaries the ball is moving toward can be hit
+        if delta >= 0:
+            return None
+        if position <= plane:
+            return 0.0
+
+        toi = (plane - position) / delta
+        return toi if toi <= 1 else None
@@ -0,0 +1,102 @@
+import numpy as np
+import pygame
+from utils.constants import *
+
+PIXEL_DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32}  # By bytes per pixel
+
+def get_tile_runs(tile_mask):
+    """(row, start, end) of each horizontal run of set tiles in a 2D boolean mask, row by row"""
+    rows, columns = tile_mask.shape
+    padded = np.zeros((rows, columns + 2), dtype=np.int8)
+    padded[:, 1:-1] = tile_mask
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    run_ends = np.nonzero(edges == -1)[1]  # Row-major order pairs each end with its start
+    return zip(run_rows.tolist(), run_starts.tolist(), run_ends.tolist())
+
+class DisplayPresenter:
+    """Puts finished frames on the display.
+
+    By default every frame is a full pygame.display.flip(). In dirty-rect
+    mode the frame is compared with the previous one tile by tile and only
+    the changed tiles are sent with pygame.display.update(rects), which
+    saves fill rate on software-rendered displays. Frames with screen
+    shake, frames that change most of the screen and the first frame after
+    a resize still get a full flip.
+    """
+
+    def __init__(self, screen, dirty_rects=False):
+        self.screen = screen
+        self.dirty_rects = dirty_rects
+        self.previous_frame = None  # Pixels of the last presented frame (dirty-rect mode)
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.updated_pixels = 0
+
+    def present(self, force_full=False):
+        """Show the frame drawn on the screen surface"""
+        pixel_dtype = PIXEL_DTYPES.get(self.screen.get_bytesize())
+        if not self.dirty_rects or pixel_dtype is None:  # 24-bit displays always flip
+            pygame.display.flip()
+            self.full_frames += 1
+            return
+
+        # Row-major view of the screen pixels (no copy)
+        width, height = self.screen.get_size()
+        buffer = self.screen.get_buffer()
+        frame = np.frombuffer(buffer, dtype=pixel_dtype).reshape(height, -1)[:, :width]
+        rects = None
+        if not force_full and self.previous_frame is not None and self.previous_frame.shape == frame.shape:
+            rects = self.get_changed_rects(frame)
+        if rects is None:
+            self.previous_frame = frame.copy()
+        else:
+            for rect in rects:
+                self.previous_frame[rect.top:rect.bottom, rect.left:rect.right] = \
+                    frame[rect.top:rect.bottom, rect.left:rect.right]
+        del frame, buffer  # Release the surface lock before presenting
+
+        if rects is None:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.updated_pixels += width * height
+        else:
+            if rects:
+                pygame.display.update(rects)
+            self.partial_frames += 1
+            self.updated_pixels += sum(rect.width * rect.height for rect in rects)
+
+    def get_changed_rects(self, frame):
+        """Rects covering the tiles that differ from the last frame, or None for a full flip"""
+        tile = DIRTY_RECT_TILE_SIZE
+        height, width = frame.shape
+        changed = frame != self.previous_frame
+
+        # Collapse each band of tile rows, then each tile column within the bands
+        full_rows = height - height % tile
+        bands = changed[:full_rows].reshape(-1, tile, width).any(axis=1)
+        if full_rows < height:
+            bands = np.vstack((bands, changed[full_rows:].any(axis=0)))
+        columns = -(-width // tile)
+        if columns * tile != width:
+            padded = np.zeros((len(bands), columns * tile), dtype=bool)
+            padded[:, :width] = bands
+            bands = padded
+        tile_changed = bands.reshape(len(bands), columns, tile).any(axis=2)
+        if tile_changed.mean() > DIRTY_RECT_MAX_COVERAGE:
+            return None
+
+        # Merge horizontal runs of changed tiles in each tile row into one rect
+        return [pygame.Rect(start * tile, row * tile, min(end * tile, width) - start * tile,
+                            min(tile, height - row * tile))
+                for row, start, end in get_tile_runs(tile_changed)]
+
+    def get_stats(self):
+        """Presentation counters"""
+        frames = self.full_frames + self.partial_frames
+        screen_pixels = self.screen.get_width() * self.screen.get_height()
+        return {
+            'full_frames': self.full_frames,
+            'partial_frames': self.partial_frames,
+            'updated_share': self.updated_pixels / (frames * screen_pixels) if frames else 0.0
+        }
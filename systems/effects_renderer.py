@@ -1,16 +1,28 @@
 import pygame
-import random
+from collections import OrderedDict
+from core.rng import get_stream
 from utils.constants import *
 
 
 class EffectsRenderer:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng or get_stream(RNG_STREAM_COSMETIC)
+
         # Screen shake effects
         self.shake_intensity = 0
         self.shake_duration = 0
         self.shake_offset_x = 0
         self.shake_offset_y = 0
 
+        # Glow surfaces by (width, height, color, quantized alpha), least recently used first
+        self.glow_cache = OrderedDict()
+        self.glow_cache_hits = 0
+        self.glow_cache_misses = 0
+
+        # Ball trail segment sprites by (ball size, color) - a handful of player colors
+        self.trail_sprites = {}
+        self.trail_length = BALL_TRAIL_LENGTH  # Segments drawn (quality preset, at most BALL_TRAIL_LENGTH)
+
     def add_screen_shake(self, intensity, duration):
         """Add screen shake effect"""
         self.shake_intensity = max(self.shake_intensity, intensity)
@@ -21,8 +33,8 @@ class EffectsRenderer:
         if self.shake_duration > 0:
             # Calculate shake offset based on intensity
             max_offset = self.shake_intensity
-            self.shake_offset_x = random.randint(-max_offset, max_offset)
-            self.shake_offset_y = random.randint(-max_offset, max_offset)
+            self.shake_offset_x = self.rng.randint(-max_offset, max_offset)
+            self.shake_offset_y = self.rng.randint(-max_offset, max_offset)
             
             # Decrease shake over time
             self.shake_duration -= 1
@@ -34,16 +46,46 @@ class EffectsRenderer:
             self.shake_offset_x = 0
             self.shake_offset_y = 0
 
+    def is_shaking(self):
+        """Whether screen shake is moving the frame"""
+        return self.shake_duration > 0 or self.shake_offset_x != 0 or self.shake_offset_y != 0
+
     def get_shake_offset(self):
         """Get current shake offset for rendering"""
         return (self.shake_offset_x, self.shake_offset_y)
 
     def apply_shake_to_surface(self, main_screen, game_surface):
-        """Apply screen shake effect to a surface"""
-        main_screen.fill(BLACK)  # Clear the main screen
-        main_screen.blit(game_surface, (self.shake_offset_x, self.shake_offset_y))
+        """Present a frame at the shake offset, clearing only the strips it uncovers"""
+        offset_x, offset_y = self.shake_offset_x, self.shake_offset_y
+        main_screen.blit(game_surface, (offset_x, offset_y))
+        width, height = main_screen.get_size()
+        if offset_x > 0:
+            main_screen.fill(BLACK, (0, 0, offset_x, height))
+        elif offset_x < 0:
+            main_screen.fill(BLACK, (width + offset_x, 0, -offset_x, height))
+        if offset_y > 0:
+            main_screen.fill(BLACK, (0, 0, width, offset_y))
+        elif offset_y < 0:
+            main_screen.fill(BLACK, (0, height + offset_y, width, -offset_y))
 
     def create_glow_surface(self, width, height, color, alpha, position=(0, 0)):
+        """Get a glow surface from the LRU cache (shared - callers must not draw on it)"""
+        alpha = min(255, round(alpha / GLOW_ALPHA_STEP) * GLOW_ALPHA_STEP)
+        key = (width, height, tuple(color), alpha)
+        glow_surface = self.glow_cache.get(key)
+        if glow_surface is not None:
+            self.glow_cache_hits += 1
+            self.glow_cache.move_to_end(key)
+            return glow_surface
+
+        self.glow_cache_misses += 1
+        glow_surface = self.build_glow_surface(width, height, color, alpha)
+        self.glow_cache[key] = glow_surface
+        if len(self.glow_cache) > GLOW_CACHE_SIZE:
+            self.glow_cache.popitem(last=False)
+        return glow_surface
+
+    def build_glow_surface(self, width, height, color, alpha):
         """Create a glow surface with specified parameters"""
         glow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         glow_color = (*color, alpha)
@@ -53,13 +95,23 @@ class EffectsRenderer:
             pygame.draw.rect(glow_surface, glow_color, (0, 0, width, height))
         return glow_surface
 
-    def draw_multi_layer_glow(self, screen, rect, color, intensity=1.0, num_layers=3):
-        """Draw multi-layer glow effect around a rectangle"""
-        base_glow_size = int(15 * intensity)
+    def get_glow_cache_stats(self):
+        """Glow cache hit/miss counters"""
+        lookups = self.glow_cache_hits + self.glow_cache_misses
+        return {
+            'hits': self.glow_cache_hits,
+            'misses': self.glow_cache_misses,
+            'size': len(self.glow_cache),
+            'hit_rate': self.glow_cache_hits / lookups if lookups else 0.0
+        }
+
+    def draw_multi_layer_glow(self, screen, rect, color, intensity=1.0, num_layers=3, scale=1.0):
+        """Draw multi-layer glow effect around a rectangle (glow sizes times scale)"""
+        base_glow_size = int(15 * intensity * scale)
         base_alpha = int(120 * intensity)
         
         for i in range(num_layers):
-            layer_size = base_glow_size - (i * 3)
+            layer_size = base_glow_size - round(i * 3 * scale)
             layer_alpha = base_alpha // (i + 1)
             
             if layer_size > 0 and layer_alpha > 0:
@@ -85,7 +137,7 @@ class EffectsRenderer:
             )
             screen.blit(glow_surface, (center[0] - glow_radius, center[1] - glow_radius))
 
-    def create_trail_segment(self, position, size, color, alpha):
+    def create_trail_segment(self, size, color, alpha):
         """Create a single trail segment surface"""
         if alpha <= 0:
             return None
@@ -104,21 +156,43 @@ class EffectsRenderer:
         
         return trail_surface
 
-    def draw_enhanced_trail(self, screen, trail_positions, base_size, color):
-        """Draw an enhanced trail with glow effects"""
-        if len(trail_positions) < 2:
-            return
+    def set_trail_length(self, length):
+        """Change how many trail segments are drawn (rebuilds the sprites on next use)"""
+        length = min(length, BALL_TRAIL_LENGTH)
+        if length != self.trail_length:
+            self.trail_length = length
+            self.trail_sprites.clear()
 
-        for i, pos in enumerate(trail_positions):
-            progress = i / len(trail_positions)
-            alpha = int(255 * progress * 0.7)  # Increased trail visibility
-            
-            if alpha > 0:
-                trail_size = int(base_size * (0.3 + progress * 0.7))  # Variable size trail
-                trail_surface = self.create_trail_segment(pos, trail_size, color, alpha)
-                
-                if trail_surface:
-                    screen.blit(trail_surface, (pos[0] - trail_size, pos[1] - trail_size))
+    def get_trail_sprites(self, base_size, color):
+        """Trail segment sprites for a ball size and color, oldest first (built once)"""
+        key = (base_size, color)
+        sprites = self.trail_sprites.get(key)
+        if sprites is None:
+            sprites = []
+            for i in range(self.trail_length):
+                progress = i / self.trail_length
+                alpha = int(255 * progress * 0.7)  # Increased trail visibility
+                if alpha > 0:
+                    trail_size = int(base_size * (0.3 + progress * 0.7))  # Variable size trail
+                    trail_surface = self.create_trail_segment(trail_size, color, alpha)
+                    # Segment i trails the ball by (trail_length - i) ticks
+                    sprites.append((self.trail_length - i, trail_surface, trail_size))
+            self.trail_sprites[key] = sprites
+        return sprites
+
+    def draw_enhanced_trail(self, screen, trail, base_size, color, interpolation=1.0, scale=1.0):
+        """Draw an enhanced trail with glow effects, sampled at the interpolated render time.
+
+        Trail positions are world units, drawn at scale surface pixels per
+        unit; base_size is already in surface pixels.
+        """
+        blits = []
+        for ticks_behind, trail_surface, trail_size in self.get_trail_sprites(base_size, color):
+            # Sample ages are measured from the newest sample, one tick behind the ball
+            pos = trail.sample(ticks_behind - interpolation)
+            if pos is not None:
+                blits.append((trail_surface, (pos[0] * scale - trail_size, pos[1] * scale - trail_size)))
+        screen.blits(blits, doreturn=False)
 
     def create_impact_effect(self, screen, position, color, intensity=1.0, size=20):
         """Create visual impact effect at a position"""
@@ -21,7 +21,7 @@ class GameOverSystem:
         
         # Visual effects
         self.celebration_timer = 0
-        self.max_celebration_time = 300  # 5 seconds at 60 FPS
+        self.max_celebration_time = 300  # 5 seconds at 60 ticks/s
         
     def set_callbacks(self, on_restart=None, on_main_menu=None, on_quit=None):
         """Set callback functions for menu actions"""
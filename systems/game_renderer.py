@@ -4,15 +4,39 @@ from utils.constants import *
 
 
 class CoreGameRenderer:
-    def __init__(self, ui_effects, effects_renderer):
+    def __init__(self, ui_effects, effects_renderer, bloom=None):
         self.ui_effects = ui_effects
         self.effects_renderer = effects_renderer
+        self.bloom = bloom  # With bloom enabled, glowing elements emit into it instead of layering glows
         self.frame_count = 0
+        self.scale = 1.0  # World layer surface pixels per world unit (below 1 at reduced render resolution)
+        self.glow_layers = 3  # Paddle glow layers (quality preset)
 
     def update_frame_count(self, frame_count):
         """Update frame count for animations"""
         self.frame_count = frame_count
 
+    def set_view_scale(self, scale):
+        """Set the world-to-surface scale the world layer is drawn at"""
+        self.scale = scale
+
+    def to_view(self, x, y):
+        """World position to surface pixels"""
+        return int(x * self.scale), int(y * self.scale)
+
+    def to_view_rect(self, x, y, width, height):
+        """World rectangle to a surface pixel rect"""
+        return pygame.Rect(int(x * self.scale), int(y * self.scale),
+                           max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+
+    def to_view_size(self, size):
+        """World length (line width, radius) to whole surface pixels, at least one"""
+        return max(1, round(size * self.scale))
+
+    def use_bloom(self):
+        """Whether glows go through the bloom post-process"""
+        return self.bloom is not None and self.bloom.enabled
+
     def draw_boundaries(self, screen):
         """Draw the game boundaries with pulsing glow"""
         # Calculate pulsing intensity for boundaries
@@ -23,23 +47,29 @@ class CoreGameRenderer:
         glow_alpha = int(80 * glow_intensity)
         
         boundaries = [
-            (0, 0, SCREEN_WIDTH, BOUNDARY_THICKNESS),  # Top
-            (0, SCREEN_HEIGHT - BOUNDARY_THICKNESS, SCREEN_WIDTH, BOUNDARY_THICKNESS),  # Bottom
-            (0, 0, BOUNDARY_THICKNESS, SCREEN_HEIGHT),  # Left
-            (SCREEN_WIDTH - BOUNDARY_THICKNESS, 0, BOUNDARY_THICKNESS, SCREEN_HEIGHT)  # Right
+            (0, 0, WORLD_WIDTH, BOUNDARY_THICKNESS),  # Top
+            (0, WORLD_HEIGHT - BOUNDARY_THICKNESS, WORLD_WIDTH, BOUNDARY_THICKNESS),  # Bottom
+            (0, 0, BOUNDARY_THICKNESS, WORLD_HEIGHT),  # Left
+            (WORLD_WIDTH - BOUNDARY_THICKNESS, 0, BOUNDARY_THICKNESS, WORLD_HEIGHT)  # Right
         ]
+        glow_margin = self.to_view_size(10)
         
         for boundary in boundaries:
-            x, y, w, h = boundary
+            boundary_rect = self.to_view_rect(*boundary)
+            x, y, w, h = boundary_rect
             
             # Glow effect
-            glow_surface = self.effects_renderer.create_glow_surface(w + 20, h + 20, boundary_color, glow_alpha)
-            screen.blit(glow_surface, (x - 10, y - 10))
+            if self.use_bloom():
+                self.bloom.add_rect(boundary_rect, boundary_color, glow_intensity)
+            else:
+                glow_surface = self.effects_renderer.create_glow_surface(
+                    w + glow_margin * 2, h + glow_margin * 2, boundary_color, glow_alpha)
+                screen.blit(glow_surface, (x - glow_margin, y - glow_margin))
             
             # Main boundary
-            pygame.draw.rect(screen, boundary_color, (x, y, w, h))
+            pygame.draw.rect(screen, boundary_color, boundary_rect)
 
-    def draw_paddle(self, screen, paddle, is_alive=True):
+    def draw_paddle(self, screen, paddle, is_alive=True, interpolation=1.0):
         """Draw a paddle with pulsing neon glow effect"""
         # Calculate pulsing intensity (dimmed for dead players)
         pulse = (math.sin(self.frame_count * 0.1) + 1) * 0.5  # 0 to 1
@@ -54,11 +84,16 @@ class CoreGameRenderer:
         glow_size = int(15 * glow_intensity)
         glow_alpha = int(120 * glow_intensity)
         
-        paddle_rect = pygame.Rect(paddle.x, paddle.y, paddle.width, paddle.height)
+        paddle_x, paddle_y = paddle.get_render_position(interpolation)
+        paddle_rect = self.to_view_rect(paddle_x, paddle_y, paddle.width, paddle.height)
         
         if is_alive:  # Only show glow for alive players
-            # Use effects renderer for multi-layer glow
-            self.effects_renderer.draw_multi_layer_glow(screen, paddle_rect, paddle_color, glow_intensity)
+            if self.use_bloom():
+                self.bloom.add_rect(paddle_rect, paddle_color, glow_intensity)
+            else:
+                # Use effects renderer for multi-layer glow
+                self.effects_renderer.draw_multi_layer_glow(screen, paddle_rect, paddle_color, glow_intensity,
+                                                            self.glow_layers, self.scale)
         
         # Main paddle
         pygame.draw.rect(screen, paddle_color, paddle_rect)
@@ -67,40 +102,49 @@ class CoreGameRenderer:
             # Bright inner core with pulsing (only for alive players)
             core_brightness = int(50 * glow_intensity)
             inner_color = tuple(min(255, c + core_brightness) for c in paddle_color)
-            inner_width = max(1, paddle.width - 4)
-            inner_height = max(1, paddle.height - 4)
+            inset = self.to_view_size(2)
+            inner_width = max(1, paddle_rect.width - inset * 2)
+            inner_height = max(1, paddle_rect.height - inset * 2)
             pygame.draw.rect(screen, inner_color,
-                             (paddle.x + 2, paddle.y + 2, inner_width, inner_height))
+                             (paddle_rect.x + inset, paddle_rect.y + inset, inner_width, inner_height))
 
-    def draw_ball(self, screen, ball):
+    def draw_ball(self, screen, ball, interpolation=1.0):
         """Draw the ball with dynamic neon glow effect"""
+        ball_center = self.to_view(*ball.get_render_position(interpolation))
+        ball_radius = max(1, int(ball.size // 2 * self.scale))
+
         # Dynamic glow based on last paddle hit
         glow_radius = int((ball.size // 2 + 10) * ball.glow_intensity)
         glow_alpha = int(150 * ball.glow_intensity)
         
-        # Use effects renderer for circular glow
-        self.effects_renderer.draw_circular_glow(
-            screen, 
-            (int(ball.x), int(ball.y)), 
-            ball.size // 2, 
-            ball.last_hit_color, 
-            ball.glow_intensity
-        )
+        if self.use_bloom():
+            self.bloom.add_circle(ball_center, ball_radius, ball.last_hit_color, ball.glow_intensity)
+        else:
+            # Use effects renderer for circular glow
+            self.effects_renderer.draw_circular_glow(
+                screen, 
+                ball_center, 
+                ball_radius, 
+                ball.last_hit_color, 
+                ball.glow_intensity
+            )
         
         # Main ball
-        pygame.draw.circle(screen, WHITE, (int(ball.x), int(ball.y)), ball.size // 2)
+        pygame.draw.circle(screen, WHITE, ball_center, ball_radius)
 
         # Bright inner core with paddle color
         core_color = tuple(min(255, int(c * 0.7 + 255 * 0.3)) for c in ball.last_hit_color)
-        pygame.draw.circle(screen, core_color, (int(ball.x), int(ball.y)), max(1, ball.size // 4))
+        pygame.draw.circle(screen, core_color, ball_center, max(1, int(ball.size // 4 * self.scale)))
 
-    def draw_ball_trail(self, screen, ball):
+    def draw_ball_trail(self, screen, ball, interpolation=1.0):
         """Draw an enhanced trail behind the ball"""
         self.effects_renderer.draw_enhanced_trail(
             screen, 
-            ball.trail_positions, 
-            ball.size, 
-            ball.last_hit_color
+            ball.trail, 
+            self.to_view_size(ball.size), 
+            ball.last_hit_color,
+            interpolation,
+            self.scale
         )
 
     def draw_lives(self, screen, lives, alive_players):
@@ -119,24 +163,24 @@ class CoreGameRenderer:
             if alive_players[i]:
                 # Show lives for alive players
                 lives_text = f"Lives: {lives[i]}"
-                text = self.ui_effects.font_medium.render(lives_text, True, color)
+                text = self.ui_effects.render_text(self.ui_effects.font_medium, lives_text, color)
                 screen.blit(text, (x, y))
             else:
                 # Show "ELIMINATED" for dead players
                 elim_text = "ELIMINATED"
-                text = self.ui_effects.font_medium.render(elim_text, True, (100, 100, 100))
+                text = self.ui_effects.render_text(self.ui_effects.font_medium, elim_text, (100, 100, 100))
                 screen.blit(text, (x, y))
                 
                 # Draw X over eliminated text
                 pygame.draw.line(screen, (200, 0, 0), (x, y), (x + 120, y + 30), 3)
                 pygame.draw.line(screen, (200, 0, 0), (x + 120, y), (x, y + 30), 3)
 
-    def draw_aiming_system(self, screen, ball, aiming_player, aiming_angle, aiming_timer=0):
-        """Draw aiming arrow and indicators"""
+    def draw_aiming_system(self, screen, ball, aiming_player, aiming_angle, aiming_impact=None):
+        """Draw aiming arrow, forecast impact marker and aiming circle (world layer)"""
         # Draw aiming arrow
-        arrow_length = 80
-        arrow_start_x = ball.x
-        arrow_start_y = ball.y
+        arrow_length = 80 * self.scale
+        arrow_start_x = ball.x * self.scale
+        arrow_start_y = ball.y * self.scale
         
         # Calculate arrow end position
         angle_rad = math.radians(aiming_angle)
@@ -146,10 +190,10 @@ class CoreGameRenderer:
         # Draw arrow shaft
         arrow_color = PLAYER_COLORS[aiming_player]
         pygame.draw.line(screen, arrow_color, 
-                        (arrow_start_x, arrow_start_y), (arrow_end_x, arrow_end_y), 4)
+                        (arrow_start_x, arrow_start_y), (arrow_end_x, arrow_end_y), self.to_view_size(4))
         
         # Draw arrow head
-        head_size = 15
+        head_size = 15 * self.scale
         head_angle1 = aiming_angle + 150
         head_angle2 = aiming_angle - 150
         
@@ -158,13 +202,29 @@ class CoreGameRenderer:
         head2_x = arrow_end_x + math.cos(math.radians(head_angle2)) * head_size
         head2_y = arrow_end_y + math.sin(math.radians(head_angle2)) * head_size
         
-        pygame.draw.line(screen, arrow_color, (arrow_end_x, arrow_end_y), (head1_x, head1_y), 3)
-        pygame.draw.line(screen, arrow_color, (arrow_end_x, arrow_end_y), (head2_x, head2_y), 3)
+        head_width = self.to_view_size(3)
+        pygame.draw.line(screen, arrow_color, (arrow_end_x, arrow_end_y), (head1_x, head1_y), head_width)
+        pygame.draw.line(screen, arrow_color, (arrow_end_x, arrow_end_y), (head2_x, head2_y), head_width)
         
         # Draw aiming circle around ball
-        pygame.draw.circle(screen, arrow_color, (int(ball.x), int(ball.y)), 25, 2)
-        
-        # Draw "AIMING" text with angle information
+        outline_width = self.to_view_size(2)
+        pygame.draw.circle(screen, arrow_color, self.to_view(ball.x, ball.y), self.to_view_size(25), outline_width)
+
+        # Mark where the ball would first reach a paddle line (from the aiming forecast)
+        if aiming_impact is not None:
+            impact_x, impact_y = self.to_view(*aiming_impact)
+            cross_size = self.to_view_size(6)
+            pygame.draw.circle(screen, arrow_color, (impact_x, impact_y), self.to_view_size(10), outline_width)
+            pygame.draw.line(screen, arrow_color, (impact_x - cross_size, impact_y),
+                             (impact_x + cross_size, impact_y), outline_width)
+            pygame.draw.line(screen, arrow_color, (impact_x, impact_y - cross_size),
+                             (impact_x, impact_y + cross_size), outline_width)
+
+    def draw_aiming_info(self, screen, aiming_player, aiming_angle, aiming_timer=0):
+        """Draw the aiming player, angle, instructions and launch countdown (HUD)"""
+        arrow_color = PLAYER_COLORS[aiming_player]
+
+        # Draw "AIMING" text with angle information (changes every frame - not worth caching)
         aiming_text = self.ui_effects.font_medium.render(f"Player {aiming_player + 1} AIMING ({aiming_angle:.1f}°)", True, arrow_color)
         text_x = SCREEN_WIDTH // 2 - aiming_text.get_width() // 2
         text_y = 100
@@ -176,14 +236,14 @@ class CoreGameRenderer:
         else:  # AI player
             instruction = f"AI Player {aiming_player + 1} is aiming..."
         
-        instr_text = self.ui_effects.font_small.render(instruction, True, (200, 200, 200))
+        instr_text = self.ui_effects.render_text(self.ui_effects.font_small, instruction, (200, 200, 200))
         instr_x = SCREEN_WIDTH // 2 - instr_text.get_width() // 2
         instr_y = 130
         screen.blit(instr_text, (instr_x, instr_y))
         
         # Show countdown timer (calculate remaining time)
-        remaining_time = max(0, int(aiming_timer / 60) + 1)
-        timer_text = self.ui_effects.font_small.render(f"Auto-launch in: {remaining_time}s", True, (255, 255, 100))
+        remaining_time = max(0, int(aiming_timer / TICK_RATE) + 1)
+        timer_text = self.ui_effects.render_text(self.ui_effects.font_small, f"Auto-launch in: {remaining_time}s", (255, 255, 100))
         timer_x = SCREEN_WIDTH // 2 - timer_text.get_width() // 2
         timer_y = 155
         screen.blit(timer_text, (timer_x, timer_y))
@@ -199,43 +259,53 @@ class CoreGameRenderer:
         for i, control in enumerate(controls):
             if alive_players[i]:  # Only show controls for alive players
                 color = PLAYER_COLORS[i]
-                text = self.ui_effects.font_small.render(control, True, color)
+                text = self.ui_effects.render_text(self.ui_effects.font_small, control, color)
                 x_pos = 20 + x_offset * 150
                 screen.blit(text, (x_pos, y_offset))
                 x_offset += 1
 
-    def render_game_elements(self, screen, paddles, ball, lives, alive_players, particle_system=None, 
-                           game_state="playing", aiming_player=-1, aiming_angle=0, aiming_timer=0):
-        """Render all core game elements"""
-        # Clear screen with black background
-        screen.fill(BLACK)
-
-        # Draw background grid (delegate to ui_effects)
-        self.ui_effects.draw_background_grid(screen, self.frame_count)
+    def render_world(self, screen, paddles, ball, alive_players, particle_system=None,
+                     game_state="playing", aiming_player=-1, aiming_angle=0, interpolation=1.0, aiming_impact=None):
+        """Render the arena layer - everything in world units, drawn at the view scale"""
+        # Draw the background grid (opaque - it also clears the screen)
+        self.ui_effects.draw_background_grid(screen, self.frame_count, self.scale)
+        if self.use_bloom():
+            self.bloom.begin_frame()
 
         # Draw boundaries
         self.draw_boundaries(screen)
 
         # Draw ball trail
-        self.draw_ball_trail(screen, ball)
+        self.draw_ball_trail(screen, ball, interpolation)
 
         # Draw ball
-        self.draw_ball(screen, ball)
+        self.draw_ball(screen, ball, interpolation)
 
         # Draw paddles (only alive players, or dimmed for dead players)
         for i, paddle in enumerate(paddles):
-            self.draw_paddle(screen, paddle, alive_players[i])
+            self.draw_paddle(screen, paddle, alive_players[i], interpolation)
+
+        # Add the blurred glow of everything emissive drawn so far
+        if self.use_bloom():
+            self.bloom.apply(screen)
 
         # Draw particle effects
         if particle_system:
-            particle_system.render(screen)
+            particle_system.render(screen, interpolation, self.scale)
+
+        # Draw aiming graphics if in aiming mode
+        if game_state == GAME_STATE_AIMING and aiming_player >= 0:
+            self.draw_aiming_system(screen, ball, aiming_player, aiming_angle, aiming_impact)
 
+    def render_hud(self, screen, lives, alive_players, game_state="playing", aiming_player=-1, aiming_angle=0,
+                   aiming_timer=0):
+        """Render the HUD layer - screen pixels, always at window resolution"""
         # Draw lives
         self.draw_lives(screen, lives, alive_players)
 
-        # Draw aiming system if in aiming mode
+        # Draw aiming text if in aiming mode
         if game_state == GAME_STATE_AIMING and aiming_player >= 0:
-            self.draw_aiming_system(screen, ball, aiming_player, aiming_angle, aiming_timer)
+            self.draw_aiming_info(screen, aiming_player, aiming_angle, aiming_timer)
         
         # Draw controls info (uncomment if needed)
-        # self.draw_controls_info(screen, alive_players)
\ No newline at end of file
+        # self.draw_controls_info(screen, alive_players)
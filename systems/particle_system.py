@@ -1,162 +1,338 @@
+import itertools
+import json
 import pygame
-import random
 import math
+import numpy as np
+from core.rng import get_stream
 from utils.constants import *
 
-class Particle:
-    def __init__(self, x, y, velocity_x, velocity_y, color, size, lifetime):
-        self.x = x
-        self.y = y
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.color = color
-        self.size = size
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.gravity = 0.1
+# Quantization steps shared by the atlas and the per-frame sprite lookup
+ALPHA_BUCKET_SHIFT = 8 - (PARTICLE_ALPHA_BUCKETS - 1).bit_length()
+COLOR_LEVEL_SHIFT = 8 - (PARTICLE_COLOR_LEVELS - 1).bit_length()
+COLOR_KEY_BITS = 3 * (8 - COLOR_LEVEL_SHIFT)
 
-    def update(self):
-        """Update particle position and lifetime"""
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        self.velocity_y += self.gravity  # Add gravity effect
-        self.velocity_x *= 0.98  # Air resistance
-        self.velocity_y *= 0.98
-        self.lifetime -= 1
-        return self.lifetime > 0
-
-    def get_alpha(self):
-        """Get current alpha based on remaining lifetime"""
-        return int(255 * (self.lifetime / self.max_lifetime))
+class ParticleSpriteAtlas:
+    """Pre-rendered glow-dot sprites for additive particle blits.
+
+    Sprites are quantized by core size, color and alpha. Every (size, color)
+    pair gets one strip surface holding all of its alpha buckets side by
+    side, rendered the first time that pair appears; after that drawing a
+    particle is just a blit of an area of a strip. Brightness is baked into
+    the RGB so the strips blit with BLEND_ADD and need no per-pixel alpha.
+    """
 
-class ParticleSystem:
     def __init__(self):
-        self.particles = []
+        self.strips = {}
+        # Per size bucket: sprite half-extent and the area of each alpha bucket in a strip
+        self.half_extents = np.zeros(PARTICLE_SPRITE_MAX_SIZE + 1, dtype=np.int32)
+        self.areas = []
+        for size in range(PARTICLE_SPRITE_MAX_SIZE + 1):
+            half_extent = math.ceil(size * PARTICLE_GLOW_SCALE)
+            extent = 2 * half_extent + 1
+            self.half_extents[size] = half_extent
+            self.areas.extend(pygame.Rect(bucket * extent, 0, extent, extent)
+                              for bucket in range(PARTICLE_ALPHA_BUCKETS))
+
+    def get_quantized_color(self, color_key):
+        """Representative RGB for a quantized color key"""
+        level_bits = 8 - COLOR_LEVEL_SHIFT
+        mask = PARTICLE_COLOR_LEVELS - 1
+        scale = 255 / mask
+        return tuple(round(((color_key >> (level_bits * channel)) & mask) * scale) for channel in (2, 1, 0))
+
+    def get_strip(self, strip_key):
+        """Strip surface for a (size, color) key, rendered on first use"""
+        strip = self.strips.get(strip_key)
+        if strip is None:
+            strip = self.build_strip(strip_key >> COLOR_KEY_BITS, self.get_quantized_color(
+                strip_key & ((1 << COLOR_KEY_BITS) - 1)))
+            self.strips[strip_key] = strip
+        return strip
+
+    def build_strip(self, size, color):
+        """Render one glow dot per alpha bucket: a dim halo with a bright core"""
+        half_extent = int(self.half_extents[size])
+        extent = 2 * half_extent + 1
+        strip = pygame.Surface((extent * PARTICLE_ALPHA_BUCKETS, extent))
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert()  # Match the screen format for fast blits
+        strip.fill(BLACK)
+        for bucket in range(1, PARTICLE_ALPHA_BUCKETS):
+            alpha = (bucket << ALPHA_BUCKET_SHIFT) / 255
+            center = (bucket * extent + half_extent, half_extent)
+            pygame.draw.circle(strip, tuple(int(c * alpha / 3) for c in color), center, half_extent)
+            pygame.draw.circle(strip, tuple(int(c * alpha) for c in color), center, max(1, size))
+        return strip
+
+    def build_blits(self, positions, sizes, colors, alphas):
+        """Blit sequence for particles (NumPy arrays) - one entry per visible particle"""
+        alpha_buckets = alphas >> ALPHA_BUCKET_SHIFT
+        visible = alpha_buckets > 0
+        if not visible.all():
+            positions, sizes, colors, alpha_buckets = (
+                positions[visible], sizes[visible], colors[visible], alpha_buckets[visible])
+
+        size_buckets = np.clip(np.rint(sizes), 1, PARTICLE_SPRITE_MAX_SIZE).astype(np.int32)
+        levels = (colors >> COLOR_LEVEL_SHIFT).astype(np.int32)
+        level_bits = 8 - COLOR_LEVEL_SHIFT
+        strip_keys = (size_buckets << COLOR_KEY_BITS | levels[:, 0] << (2 * level_bits) |
+                      levels[:, 1] << level_bits | levels[:, 2])
+
+        # One strip lookup per distinct (size, color), not per particle
+        unique_keys, strip_index = np.unique(strip_keys, return_inverse=True)
+        strips = [self.get_strip(key) for key in unique_keys.tolist()]
+        area_index = size_buckets * PARTICLE_ALPHA_BUCKETS + alpha_buckets
+        dests = (positions - self.half_extents[size_buckets][:, None]).astype(np.int32)
+
+        # Assembled lazily by zip/map so no Python code runs per particle
+        return zip(map(strips.__getitem__, strip_index.tolist()),
+                   zip(dests[:, 0].tolist(), dests[:, 1].tolist()),
+                   map(self.areas.__getitem__, area_index.tolist()),
+                   itertools.repeat(pygame.BLEND_ADD))
+
+# Emitter layer fields and their defaults - ranges may also be given as a single number
+PRIORITY_NAMES = {
+    'decorative': PARTICLE_PRIORITY_DECORATIVE,
+    'effect': PARTICLE_PRIORITY_EFFECT,
+    'feedback': PARTICLE_PRIORITY_FEEDBACK,
+}
+LAYER_DEFAULTS = {
+    'priority': 'effect',
+    'count': 1,
+    'speed': 0.0,
+    'angle': [0.0, 360.0],         # Launch direction in degrees (0 = right, 90 = down)
+    'velocity_offset': [0.0, 0.0], # Added to every launch velocity (e.g. an upward bias)
+    'color': None,                 # Fixed base color; None tints from the caller's color
+    'mix_color': WHITE,            # Color blended into the base...
+    'mix_amount': 0.0,             # ...by this fraction
+    'size': 2.0,
+    'lifetime': 30,
+    'gravity': PARTICLE_GRAVITY,
+}
+RANGE_FIELDS = ('count', 'speed', 'angle', 'mix_amount', 'size', 'lifetime', 'gravity')
+
+def parse_emitter_layer(layer):
+    """Fill in defaults and normalize every range to (low, high)"""
+    unknown = set(layer) - set(LAYER_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown emitter fields {sorted(unknown)}")
+    parsed = dict(LAYER_DEFAULTS)
+    parsed.update(layer)
+    for field in RANGE_FIELDS:
+        value = parsed[field]
+        parsed[field] = (value, value) if isinstance(value, (int, float)) else tuple(value)
+    parsed['priority'] = PRIORITY_NAMES[parsed['priority']]
+    return parsed
+
+def load_emitter_definitions(path=PARTICLE_EMITTERS_FILE):
+    """Load emitter definitions (name -> list of burst layers) from JSON"""
+    try:
+        with open(path, 'r') as f:
+            raw = json.load(f)
+        return {name: [parse_emitter_layer(layer) for layer in layers] for name, layers in raw.items()}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error loading particle emitters from {path}: {e}")
+        return {}
+
+class ParticleSystem:
+    """Particles stored as parallel NumPy arrays (struct of arrays).
+
+    Live particles occupy slots [0, count); update moves all of them in a
+    few vector operations and fills the holes left by dead particles with
+    live ones from the end, so the live block stays contiguous.
+
+    At most budget particles are alive at once. Each burst reserves its
+    slots up front: bursts shrink as the budget fills (low priority
+    first), and a full budget evicts the lowest-priority, nearest-to-dead
+    particles to make room for equal or higher priority ones.
+
+    Effects are emitters loaded from JSON (see load_emitter_definitions);
+    each burst is sampled in one go straight into the arrays.
+    """
+
+    def __init__(self, rng=None, capacity=PARTICLE_INITIAL_CAPACITY, budget=PARTICLE_BUDGET, emitters=None):
+        # Vectorized sampling, seeded from the cosmetic stream so seeded runs stay repeatable
+        self.rng = np.random.default_rng((rng or get_stream(RNG_STREAM_COSMETIC)).getrandbits(64))
+        self.emitters = emitters if emitters is not None else load_emitter_definitions()
+        self.budget = budget
+        self.count = 0
+        self.allocate(capacity)
+        self.atlas = ParticleSpriteAtlas()
+
+    def allocate(self, capacity):
+        """(Re)allocate storage, keeping the live particles"""
+        arrays = {
+            'position': np.zeros((capacity, 2)),
+            'prev_position': np.zeros((capacity, 2)),
+            'velocity': np.zeros((capacity, 2)),
+            'color': np.zeros((capacity, 3), dtype=np.uint8),
+            'size': np.zeros(capacity),
+            'lifetime': np.zeros(capacity, dtype=np.int32),
+            'max_lifetime': np.ones(capacity, dtype=np.int32),
+            'gravity': np.zeros(capacity),
+            'priority': np.zeros(capacity, dtype=np.uint8),
+        }
+        for name, array in arrays.items():
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def get_spawn_count(self, count, priority):
+        """Scale a burst down as the budget fills (higher priorities scale later)"""
+        load = self.count / self.budget
+        scale_start = PARTICLE_SCALE_START[priority]
+        if scale_start >= 1.0 or load <= scale_start:
+            return count
+        return max(1, int(count * (1.0 - load) / (1.0 - scale_start)))
+
+    def reserve(self, count, priority):
+        """Make room for a burst and return how many particles it may spawn"""
+        count = self.get_spawn_count(count, priority)
+        overflow = self.count + count - self.budget
+        if overflow > 0:
+            # Evict lowest priority first, then whatever has the least life left
+            n = self.count
+            evictable = np.flatnonzero(self.priority[:n] <= priority)
+            if len(evictable) > overflow:
+                scores = self.priority[evictable].astype(np.int64) << 32 | self.lifetime[evictable]
+                evictable = evictable[np.argpartition(scores, overflow - 1)[:overflow]]
+            self.remove(evictable)
+            count = min(count, self.budget - self.count)
+        return count
+
+    def set_budget(self, budget):
+        """Change the live particle ceiling (quality preset), evicting the excess right away"""
+        self.budget = budget
+        overflow = self.count - budget
+        if overflow > 0:
+            n = self.count
+            scores = self.priority[:n].astype(np.int64) << 32 | self.lifetime[:n]
+            self.remove(np.argpartition(scores, overflow - 1)[:overflow])
+
+    def ensure_capacity(self, count):
+        """Grow storage until count particles fit"""
+        capacity = self.capacity
+        while capacity < count:
+            capacity *= 2
+        if capacity != self.capacity:
+            self.allocate(capacity)
+
+    def emit(self, name, x, y, color=WHITE):
+        """Fire every layer of a named emitter at (x, y), tinted from color"""
+        for layer in self.emitters.get(name, ()):
+            self.spawn_burst(layer, x, y, color)
+
+    def spawn_burst(self, layer, x, y, color):
+        """Sample a whole burst at once straight into the particle arrays"""
+        rng = self.rng
+        count_low, count_high = layer['count']
+        count = self.reserve(int(rng.integers(count_low, count_high + 1)), layer['priority'])
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        self.ensure_capacity(end)
+
+        self.position[start:end] = (x, y)
+        self.prev_position[start:end] = (x, y)
+        angles = np.radians(rng.uniform(*layer['angle'], count))
+        speeds = rng.uniform(*layer['speed'], count)
+        offset_x, offset_y = layer['velocity_offset']
+        self.velocity[start:end, 0] = np.cos(angles) * speeds + offset_x
+        self.velocity[start:end, 1] = np.sin(angles) * speeds + offset_y
+
+        base_color = np.array(color if layer['color'] is None else layer['color'], dtype=float)
+        mix_amount = rng.uniform(*layer['mix_amount'], count)[:, None]
+        mixed = base_color * (1.0 - mix_amount) + np.array(layer['mix_color'], dtype=float) * mix_amount
+        self.color[start:end] = np.clip(mixed, 0, 255)
+
+        self.size[start:end] = rng.uniform(*layer['size'], count)
+        lifetime_low, lifetime_high = layer['lifetime']
+        lifetime = rng.integers(lifetime_low, lifetime_high + 1, count)
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.gravity[start:end] = rng.uniform(*layer['gravity'], count)
+        self.priority[start:end] = layer['priority']
+        self.count = end
 
     def add_ball_impact_burst(self, x, y, paddle_color):
         """Create particle burst when ball hits paddle"""
-        particle_count = random.randint(8, 12)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            # Mix paddle color with white for sparks
-            spark_color = tuple(min(255, int(c * 0.8 + 255 * 0.2)) for c in paddle_color)
-            
-            size = random.uniform(2, 4)
-            lifetime = random.randint(15, 30)
-            
-            self.particles.append(Particle(x, y, velocity_x, velocity_y, spark_color, size, lifetime))
+        self.emit('ball_impact', x, y, paddle_color)
 
     def add_wall_impact_sparks(self, x, y):
         """Create small sparks when ball hits wall"""
-        particle_count = random.randint(4, 6)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            spark_color = NEON_BLUE
-            size = random.uniform(1, 2)
-            lifetime = random.randint(10, 20)
-            
-            self.particles.append(Particle(x, y, velocity_x, velocity_y, spark_color, size, lifetime))
-    
+        self.emit('wall_sparks', x, y)
+
     def add_victory_celebration(self, x, y, winner_color):
         """Create victory celebration effect for the last surviving player"""
-        particle_count = random.randint(50, 70)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(4, 10)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed - 4  # Strong upward bias
-            
-            # Bright, sparkling colors
-            sparkle_factor = random.uniform(0.7, 1.0)
-            victory_color = tuple(min(255, int(c * sparkle_factor + 255 * (1 - sparkle_factor))) for c in winner_color)
-            
-            size = random.uniform(3, 7)
-            lifetime = random.randint(60, 100)  # Long lasting celebration
-            
-            self.particles.append(Particle(x, y, velocity_x, velocity_y, victory_color, size, lifetime))
+        self.emit('victory', x, y, winner_color)
 
     def add_score_celebration(self, x, y, player_color):
         """Create celebration particles when player scores"""
-        particle_count = random.randint(15, 20)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed - 2  # Upward bias
-            
-            size = random.uniform(3, 6)
-            lifetime = random.randint(30, 50)
-            
-            self.particles.append(Particle(x, y, velocity_x, velocity_y, player_color, size, lifetime))
-    
+        self.emit('score', x, y, player_color)
+
     def add_elimination_effect(self, x, y, player_color):
         """Create dramatic elimination effect when player dies"""
-        # Large explosion of particles
-        particle_count = random.randint(30, 40)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(5, 12)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            # Mix player color with red for dramatic effect
-            red_intensity = random.uniform(0.5, 1.0)
-            elimination_color = (
-                int(player_color[0] * (1 - red_intensity) + 255 * red_intensity),
-                int(player_color[1] * (1 - red_intensity)),
-                int(player_color[2] * (1 - red_intensity))
-            )
-            
-            size = random.uniform(4, 8)  # Larger particles
-            lifetime = random.randint(40, 70)  # Longer lasting
-            
-            self.particles.append(Particle(x, y, velocity_x, velocity_y, elimination_color, size, lifetime))
-        
-        # Add some pure red "death" particles
-        for _ in range(10):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed - 3  # Slight upward bias
-            
-            size = random.uniform(2, 4)
-            lifetime = random.randint(50, 80)
-            
-            self.particles.append(Particle(x, y, velocity_x, velocity_y, (255, 0, 0), size, lifetime))
+        self.emit('elimination', x, y, player_color)
 
     def update(self):
-        """Update all particles and remove dead ones"""
-        self.particles = [p for p in self.particles if p.update()]
-
-    def render(self, screen):
-        """Render all particles with alpha blending"""
-        for particle in self.particles:
-            alpha = particle.get_alpha()
-            if alpha > 0:
-                # Create surface with alpha
-                particle_surface = pygame.Surface((particle.size * 2, particle.size * 2), pygame.SRCALPHA)
-                color_with_alpha = (*particle.color, alpha)
-                pygame.draw.circle(particle_surface, color_with_alpha, 
-                                 (particle.size, particle.size), particle.size)
-                
-                # Add glow effect
-                glow_size = particle.size * 1.5
-                glow_alpha = alpha // 3
-                if glow_alpha > 0:
-                    glow_color = (*particle.color, glow_alpha)
-                    pygame.draw.circle(particle_surface, glow_color,
-                                     (particle.size, particle.size), glow_size)
-                
-                screen.blit(particle_surface, (particle.x - particle.size, particle.y - particle.size))
+        """Advance every live particle one tick and compact out the dead ones"""
+        n = self.count
+        if n == 0:
+            return
+        position = self.position[:n]
+        velocity = self.velocity[:n]
+        self.prev_position[:n] = position
+        position += velocity
+        velocity[:, 1] += self.gravity[:n]
+        velocity *= PARTICLE_DRAG
+        lifetime = self.lifetime[:n]
+        lifetime -= 1
+
+        self.remove(np.flatnonzero(lifetime <= 0))
+
+    def remove(self, indices):
+        """Remove live particles by slot index (unique) with swap-compaction"""
+        if len(indices) == 0:
+            return
+        n = self.count
+        new_count = n - len(indices)
+        # Live particles past the new end move into the removed slots before it
+        keep = np.ones(n - new_count, dtype=bool)
+        tail = indices[indices >= new_count]
+        keep[tail - new_count] = False
+        holes = indices[indices < new_count]
+        if len(holes):
+            movers = np.flatnonzero(keep) + new_count
+            for array in (self.position, self.prev_position, self.velocity, self.color,
+                          self.size, self.lifetime, self.max_lifetime, self.priority, self.gravity):
+                array[holes] = array[movers]
+        self.count = new_count
+
+    def get_alphas(self):
+        """Alpha (0-255) of every live particle from its remaining lifetime"""
+        n = self.count
+        return (255 * self.lifetime[:n] // self.max_lifetime[:n]).astype(np.int32)
+
+    def get_render_positions(self, interpolation=1.0):
+        """Live particle positions interpolated between the last two ticks"""
+        n = self.count
+        prev_position = self.prev_position[:n]
+        return prev_position + (self.position[:n] - prev_position) * interpolation
+
+    def render(self, screen, interpolation=1.0, scale=1.0):
+        """Render all particles additively from the sprite atlas in one blits call (scale: pixels per world unit)"""
+        n = self.count
+        if n == 0:
+            return
+        positions = self.get_render_positions(interpolation)
+        sizes = self.size[:n]
+        if scale != 1.0:
+            positions = positions * scale
+            sizes = sizes * scale
+        blit_sequence = self.atlas.build_blits(positions, sizes, self.color[:n], self.get_alphas())
+        screen.blits(blit_sequence, doreturn=False)
 
     def clear(self):
         """Remove all particles"""
-        self.particles.clear()
\ No newline at end of file
+        self.count = 0
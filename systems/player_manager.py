@@ -1,22 +1,29 @@
 from entities.paddle import Paddle
 from systems.ai import AIPlayer
+from systems.ball_forecast import BallForecast
 from utils.constants import *
 
 class PlayerManager:
     """Manages player state, lives, and eliminations"""
     
-    def __init__(self, ai_difficulty=0.6):
+    def __init__(self, ai_difficulty=0.6, ai_player_ids=(1, 2, 3), verbose=True, seat_difficulties=None,
+                 ai_rng=None):
         # Game state - lives system
         self.lives = [STARTING_LIVES, STARTING_LIVES, STARTING_LIVES, STARTING_LIVES]  # Each player starts with configured lives
         self.alive_players = [True, True, True, True]  # Track which players are still alive
         self.starting_lives = STARTING_LIVES
         
-        # Store AI difficulty for creating AI players
+        # Store AI difficulty and seats for creating AI players
         self.ai_difficulty = ai_difficulty
+        self.ai_player_ids = tuple(ai_player_ids)
+        self.seat_difficulties = seat_difficulties  # Optional per-seat override of ai_difficulty
+        self.verbose = verbose  # Print elimination messages
+        self.ai_rng = ai_rng  # Random stream shared by the AIs (None = default AI stream)
         
         # Initialize paddles and AI
         self.paddles = []
         self.ai_players = []
+        self.ball_forecast = BallForecast()  # Shared by every AI, refreshed once per tick
         self.init_paddles()
         self.init_ai_players()
         
@@ -25,33 +32,42 @@ class PlayerManager:
         self.paddles = []
 
         # Player 1 - Left paddle (human player)
-        left_paddle = Paddle(PADDLE_MARGIN, SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2,
+        left_paddle = Paddle(PADDLE_MARGIN, WORLD_HEIGHT // 2 - PADDLE_HEIGHT // 2,
                              0, 'vertical')
         self.paddles.append(left_paddle)
 
         # Player 2 - Right paddle (AI)
-        right_paddle = Paddle(SCREEN_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH,
-                              SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2, 1, 'vertical')
+        right_paddle = Paddle(WORLD_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH,
+                              WORLD_HEIGHT // 2 - PADDLE_HEIGHT // 2, 1, 'vertical')
         self.paddles.append(right_paddle)
 
         # Player 3 - Top paddle (AI)
-        top_paddle = Paddle(SCREEN_WIDTH // 2 - H_PADDLE_WIDTH // 2, PADDLE_MARGIN,
+        top_paddle = Paddle(WORLD_WIDTH // 2 - H_PADDLE_WIDTH // 2, PADDLE_MARGIN,
                             2, 'horizontal')
         self.paddles.append(top_paddle)
 
         # Player 4 - Bottom paddle (AI)
-        bottom_paddle = Paddle(SCREEN_WIDTH // 2 - H_PADDLE_WIDTH // 2,
-                               SCREEN_HEIGHT - PADDLE_MARGIN - H_PADDLE_HEIGHT,
+        bottom_paddle = Paddle(WORLD_WIDTH // 2 - H_PADDLE_WIDTH // 2,
+                               WORLD_HEIGHT - PADDLE_MARGIN - H_PADDLE_HEIGHT,
                                3, 'horizontal')
         self.paddles.append(bottom_paddle)
         
     def init_ai_players(self):
         """Initialize AI players (players 1, 2, 3 are AI by default)"""
         self.ai_players = [
-            AIPlayer(self.paddles[1], difficulty=self.ai_difficulty),  # Player 2 (right)
-            AIPlayer(self.paddles[2], difficulty=self.ai_difficulty),  # Player 3 (top)
-            AIPlayer(self.paddles[3], difficulty=self.ai_difficulty),  # Player 4 (bottom)
+            AIPlayer(self.paddles[player_id], difficulty=self.get_seat_difficulty(player_id), rng=self.ai_rng)
+            for player_id in self.ai_player_ids
         ]
+
+    def get_seat_difficulty(self, player_id):
+        """Get the AI difficulty for a seat"""
+        if self.seat_difficulties is not None:
+            return self.seat_difficulties[player_id]
+        return self.ai_difficulty
+
+    def set_seat_difficulties(self, seat_difficulties):
+        """Set per-seat AI difficulties (None = ai_difficulty everywhere), applied on reset"""
+        self.seat_difficulties = seat_difficulties
         
     def get_paddles(self):
         """Get all paddles"""
@@ -94,7 +110,8 @@ class PlayerManager:
         if self.lives[player_id] <= 0:
             self.alive_players[player_id] = False
             result['eliminated'] = True
-            print(f"Player {player_id + 1} eliminated!")
+            if self.verbose:
+                print(f"Player {player_id + 1} eliminated!")
             
             # Check for game over (only one player left)
             alive_count = sum(self.alive_players)
@@ -129,13 +146,18 @@ class PlayerManager:
                 'message': "Game over - all players eliminated!"
             }
             
+    def get_ball_forecast(self):
+        """Get the shared ball forecast"""
+        return self.ball_forecast
+            
     def update_ai_players(self, ball):
         """Update AI players (only for alive players)"""
-        for i, ai_player in enumerate(self.ai_players):
-            # AI players are at indices 1, 2, 3 (not 0 since player 0 is human)
-            ai_player_index = i + 1
-            if self.alive_players[ai_player_index]:
-                ai_player.update(ball)
+        if not self.ai_players:
+            return
+        self.ball_forecast.update(ball, self.paddles, self.alive_players)
+        for ai_player in self.ai_players:
+            if self.alive_players[ai_player.paddle.player_id]:
+                ai_player.update(ball, self.ball_forecast)
                 
     def update_paddles(self):
         """Update paddles (only for alive players)"""
@@ -150,6 +172,7 @@ class PlayerManager:
         
         # Reset paddle positions
         self.init_paddles()
+        self.ball_forecast.invalidate()
         
         # Reinitialize AI with the new paddles
         self.init_ai_players()
\ No newline at end of file
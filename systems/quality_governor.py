@@ -0,0 +1,127 @@
+import time
+from utils.math_utils import percentile
+from utils.constants import *
+
+class QualityGovernor:
+    """Chooses the graphics quality preset (QUALITY_PRESETS).
+
+    A fixed mode (Low, Medium, High, Ultra) always uses its preset. In Auto
+    mode frame busy times are collected in windows of QUALITY_AUTO_WINDOW
+    frames, each judged by a high percentile, so steady slowness counts and
+    a single hitch doesn't. A window above QUALITY_AUTO_DOWN_MS steps the
+    preset down; QUALITY_AUTO_UP_WINDOWS windows in a row below
+    QUALITY_AUTO_UP_MS step it up.
+
+    A step down is remembered: the first window on the lower preset tells
+    how much slower the preset it left was. Stepping back up to that preset
+    waits until the current frame time, scaled by that ratio, fits
+    comfortably under QUALITY_AUTO_DOWN_MS - so a preset that can't hold
+    doesn't flip back and forth with the one below it. The memory expires
+    after QUALITY_AUTO_RECOVERY_WINDOWS windows.
+
+    With dynamic resolution on, the render scale reacts first: the caller
+    only allows a step down once the scale is at its lowest step, and a
+    step up once it is back at full resolution.
+    """
+
+    def __init__(self, mode=QUALITY_AUTO, auto_preset=QUALITY_HIGH):
+        self.frame_times = []
+        self.preset = QUALITY_HIGH
+        self.changes = 0
+        self.windows = 0
+        self.set_mode(mode, auto_preset)
+
+    def set_mode(self, mode, auto_preset=None):
+        """Switch to a fixed preset or Auto (starting from auto_preset, else the preset in use)"""
+        self.mode = mode
+        if mode != QUALITY_AUTO:
+            self.preset = mode
+        elif auto_preset is not None:
+            self.preset = auto_preset
+        self.frame_times.clear()
+        self.up_windows = 0   # Consecutive windows fast enough to step up
+        self.step_downs = {}  # Preset left for being slow -> {'slow_ms', 'lower_ms', 'window'}
+
+    def is_auto(self):
+        """Whether the preset follows measured frame times"""
+        return self.mode == QUALITY_AUTO
+
+    def get_preset(self):
+        """Name of the preset in use"""
+        return self.preset
+
+    def is_step_up_blocked(self, preset, frame_time):
+        """Whether a preset recently stepped down from is still expected to be too slow"""
+        step_down = self.step_downs.get(preset)
+        if step_down is None or step_down['lower_ms'] is None:
+            return False
+        if self.windows - step_down['window'] > QUALITY_AUTO_RECOVERY_WINDOWS:
+            del self.step_downs[preset]
+            return False
+        expected_ms = frame_time * step_down['slow_ms'] / max(step_down['lower_ms'], 0.001)
+        return expected_ms >= QUALITY_AUTO_DOWN_MS * QUALITY_AUTO_RECOVERY_HEADROOM
+
+    def update(self, frame_ms, can_step_down=True, can_step_up=True):
+        """Record one frame's busy time (milliseconds); True when Auto mode changed the preset"""
+        if self.mode != QUALITY_AUTO:
+            return False
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < QUALITY_AUTO_WINDOW:
+            return False
+
+        frame_time = percentile(self.frame_times, QUALITY_AUTO_PERCENTILE)
+        self.frame_times.clear()
+        self.windows += 1
+        level = QUALITY_PRESET_OPTIONS.index(self.preset)
+
+        # First window after a step down - learn how much slower the preset above was
+        if level < len(QUALITY_PRESET_OPTIONS) - 1:
+            step_down = self.step_downs.get(QUALITY_PRESET_OPTIONS[level + 1])
+            if step_down is not None and step_down['lower_ms'] is None:
+                step_down['lower_ms'] = frame_time
+
+        if frame_time > QUALITY_AUTO_DOWN_MS:
+            self.up_windows = 0
+            if level == 0 or not can_step_down:
+                return False
+            self.step_downs[self.preset] = {'slow_ms': frame_time, 'lower_ms': None, 'window': self.windows}
+            level -= 1
+        elif (frame_time < QUALITY_AUTO_UP_MS and level < len(QUALITY_PRESET_OPTIONS) - 1 and can_step_up
+              and not self.is_step_up_blocked(QUALITY_PRESET_OPTIONS[level + 1], frame_time)):
+            self.up_windows += 1
+            if self.up_windows < QUALITY_AUTO_UP_WINDOWS:
+                return False
+            level += 1
+        else:
+            self.up_windows = 0
+            return False
+
+        self.preset = QUALITY_PRESET_OPTIONS[level]
+        self.up_windows = 0
+        self.changes += 1
+        print(f"Auto quality: {self.preset} (p{QUALITY_AUTO_PERCENTILE * 100:.0f} frame time {frame_time:.1f} ms)")
+        return True
+
+    def get_stats(self):
+        """Mode, preset and change counter"""
+        return {
+            'mode': self.mode,
+            'preset': self.preset,
+            'changes': self.changes
+        }
+
+def run_quality_benchmark(apply_preset, render_frame, frames=QUALITY_BENCHMARK_FRAMES):
+    """Time frames at each preset, best first, and return the first that holds QUALITY_BENCHMARK_BUDGET_MS"""
+    for preset in reversed(QUALITY_PRESET_OPTIONS):
+        apply_preset(preset)
+        render_frame()  # Untimed - builds the preset's cached sprites
+        frame_times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            render_frame()
+            frame_times.append((time.perf_counter() - start) * 1000)
+        frame_time = percentile(frame_times, QUALITY_AUTO_PERCENTILE)
+        print(f"Quality benchmark: {preset} {frame_time:.1f} ms")
+        if frame_time <= QUALITY_BENCHMARK_BUDGET_MS:
+            return preset
+    return QUALITY_PRESET_OPTIONS[0]
@@ -0,0 +1,97 @@
+from utils.constants import *
+
+class RenderScaleController:
+    """Chooses the resolution the world layer is drawn at.
+
+    The arena (grid, boundaries, ball, paddles, particles) is drawn at a
+    share of the window resolution and scaled up to the window; the HUD and
+    menus always stay at full resolution. With dynamic scaling on, frame
+    draw times are smoothed with a moving average, and the settled average
+    of every scale is remembered for a while. Over budget the scale drops
+    to the next lower step that isn't known to draw slower than the current
+    one - the upscale has a fixed cost, so a lower scale can cost more (0.75
+    does on the reference machine). It climbs to the best step whose
+    expected draw time fits well inside the budget: the remembered average
+    if there is one, else the current time grown with the pixel count.
+    Every change is followed by a settle period so the scale doesn't
+    oscillate.
+    """
+
+    def __init__(self, scale=1.0, dynamic=False, budget_ms=RENDER_SCALE_BUDGET_MS):
+        self.dynamic = dynamic
+        self.budget_ms = budget_ms
+        self.changes = 0
+        self.frames = 0
+        # Last settled average draw time per step and the frame it was measured on
+        self.level_ms = [None] * len(RENDER_SCALE_LEVELS)
+        self.level_frames = [0] * len(RENDER_SCALE_LEVELS)
+        # Start at the closest available step
+        self.set_level(min(range(len(RENDER_SCALE_LEVELS)), key=lambda i: abs(RENDER_SCALE_LEVELS[i] - scale)))
+
+    def set_level(self, level):
+        """Switch to a RENDER_SCALE_LEVELS step and start measuring it afresh"""
+        self.level = level
+        self.scale = RENDER_SCALE_LEVELS[level]
+        self.average_ms = None
+        self.settle_frames = RENDER_SCALE_SETTLE_FRAMES
+
+    def get_scale(self):
+        """Current share of the window resolution per axis"""
+        return self.scale
+
+    def update(self, draw_ms):
+        """Feed one frame's draw time (milliseconds); may change the scale for the next frame"""
+        if not self.dynamic:
+            return
+        self.frames += 1
+        if self.average_ms is None:
+            self.average_ms = draw_ms
+        else:
+            self.average_ms += (draw_ms - self.average_ms) * RENDER_SCALE_SMOOTHING
+        if self.settle_frames > 0:
+            self.settle_frames -= 1
+            return
+        self.level_ms[self.level] = self.average_ms
+        self.level_frames[self.level] = self.frames
+
+        if self.average_ms > self.budget_ms:
+            level = self.get_cheaper_level()
+        else:
+            level = self.get_better_level()
+        if level is not None:
+            self.set_level(level)
+            self.changes += 1
+
+    def get_measured_ms(self, level):
+        """Remembered draw time of a step, None if unmeasured or too old to trust"""
+        if self.frames - self.level_frames[level] > RENDER_SCALE_MEMORY_FRAMES:
+            return None
+        return self.level_ms[level]
+
+    def get_cheaper_level(self):
+        """Next lower step not measured slower than the current average, or None"""
+        for level in range(self.level + 1, len(RENDER_SCALE_LEVELS)):
+            measured_ms = self.get_measured_ms(level)
+            if measured_ms is None or measured_ms < self.average_ms:
+                return level
+        return None
+
+    def get_better_level(self):
+        """Best higher step expected to fit the raise headroom, or None"""
+        for level in range(self.level):
+            expected_ms = self.get_measured_ms(level)
+            if expected_ms is None:
+                expected_ms = self.average_ms * (RENDER_SCALE_LEVELS[level] / self.scale) ** 2
+            if expected_ms < self.budget_ms * RENDER_SCALE_RAISE_HEADROOM:
+                return level
+        return None
+
+    def get_stats(self):
+        """Current scale and controller counters"""
+        return {
+            'scale': self.scale,
+            'dynamic': self.dynamic,
+            'average_ms': self.average_ms,
+            'level_ms': dict(zip(RENDER_SCALE_LEVELS, self.level_ms)),
+            'changes': self.changes
+        }
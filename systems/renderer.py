@@ -1,71 +1,124 @@
+import time
 import pygame
 from utils.constants import *
 from ui.ui_effects import UIEffects
 from ui.menu_renderer import MenuRenderer
 from systems.game_renderer import CoreGameRenderer
 from systems.effects_renderer import EffectsRenderer
+from systems.display_presenter import DisplayPresenter
+from systems.bloom import BloomRenderer
+from systems.render_scale import RenderScaleController
 
 class GameRenderer:
-    def __init__(self, screen):
+    def __init__(self, screen, dirty_rects=False, bloom_quality=BLOOM_DEFAULT_QUALITY, render_scale=1.0,
+                 dynamic_resolution=False):
         self.screen = screen
-        self.frame_count = 0  # For animation timing
+        self.frame_count = 0  # For animation timing (counts simulation ticks)
         
         # Initialize specialized renderers
         self.ui_effects = UIEffects()
+        # Dirty-rect presentation needs a still background - an animated grid changes every pixel
+        self.ui_effects.static_background = dirty_rects
+        self.presenter = DisplayPresenter(screen, dirty_rects)
+        # Persistent off-screen frame, only drawn into while the screen shakes
+        self.back_buffer = pygame.Surface(screen.get_size())
+        # World layer resolution - below full scale the arena is drawn into world_surface and scaled up
+        self.render_scale = RenderScaleController(render_scale, dynamic_resolution)
+        self.world_surface = None
         self.effects_renderer = EffectsRenderer()
-        self.game_renderer = CoreGameRenderer(self.ui_effects, self.effects_renderer)
+        self.bloom = BloomRenderer(screen.get_size(), bloom_quality)
+        self.game_renderer = CoreGameRenderer(self.ui_effects, self.effects_renderer, self.bloom)
         self.menu_renderer = MenuRenderer(self.ui_effects)
 
-    def render_frame(self, paddles, ball, lives, alive_players, particle_system=None, 
-                   game_state="playing", aiming_player=-1, aiming_angle=0, aiming_timer=0, pause_menu_selected=0):
-        """Render a complete game frame with screen shake"""
+    def update(self):
+        """Advance animation timers and screen shake by one simulation tick"""
         self.frame_count += 1
-        
-        # Update frame count in all renderers
-        self.game_renderer.update_frame_count(self.frame_count)
-        self.menu_renderer.update_frame_count(self.frame_count)
-        
-        # Update screen shake
         self.effects_renderer.update_screen_shake()
+
+    def sync_animation_clock(self, interpolation=1.0):
+        """Hand the tick-based animation clock (plus sub-tick progress) to all renderers"""
+        animation_time = self.frame_count + interpolation
+        self.game_renderer.update_frame_count(animation_time)
+        self.menu_renderer.update_frame_count(animation_time)
+
+    def render_frame(self, paddles, ball, lives, alive_players, particle_system=None, 
+                   game_state="playing", aiming_player=-1, aiming_angle=0, aiming_timer=0, pause_menu_selected=0,
+                   interpolation=1.0, aiming_impact=None):
+        """Render a complete game frame with screen shake"""
+        draw_start = time.perf_counter()
+        self.sync_animation_clock(interpolation)
         
-        # Create a surface for the main game content
-        game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Without shake the frame is drawn straight onto the screen; while shaking it goes
+        # to the back buffer, which is then presented at the shake offset
+        shaking = self.effects_renderer.is_shaking()
+        game_surface = self.back_buffer if shaking else self.screen
         
-        # Render game elements to the game surface
-        self.game_renderer.render_game_elements(
-            game_surface, paddles, ball, lives, alive_players, particle_system,
-            game_state, aiming_player, aiming_angle, aiming_timer
+        # Render the arena in world units, at reduced resolution when the render scale is below 1
+        world_surface = self.get_world_surface(game_surface)
+        view_scale = world_surface.get_width() / WORLD_WIDTH
+        self.game_renderer.set_view_scale(view_scale)
+        self.bloom.resize(world_surface.get_size(), view_scale)
+        self.game_renderer.render_world(
+            world_surface, paddles, ball, alive_players, particle_system,
+            game_state, aiming_player, aiming_angle, interpolation, aiming_impact
         )
+        if world_surface is not game_surface:
+            pygame.transform.scale(world_surface, game_surface.get_size(), game_surface)
+        
+        # HUD text on top, always at window resolution
+        self.game_renderer.render_hud(game_surface, lives, alive_players, game_state,
+                                      aiming_player, aiming_angle, aiming_timer)
         
         # Draw pause overlay if paused
         if game_state == GAME_STATE_PAUSED:
             self.menu_renderer.draw_pause_overlay(game_surface, pause_menu_selected)
         
-        # Apply screen shake and blit to main screen
-        self.effects_renderer.apply_shake_to_surface(self.screen, game_surface)
+        if shaking:
+            self.effects_renderer.apply_shake_to_surface(self.screen, game_surface)
+
+        self.render_scale.update((time.perf_counter() - draw_start) * 1000)
+
+    def get_world_surface(self, game_surface):
+        """Surface the arena is drawn on - the game surface itself at full render scale"""
+        scale = self.render_scale.get_scale()
+        if scale == 1.0:
+            return game_surface
+        width, height = game_surface.get_size()
+        size = (round(width * scale), round(height * scale))
+        if self.world_surface is None or self.world_surface.get_size() != size:
+            self.world_surface = pygame.Surface(size, 0, game_surface)
+        return self.world_surface
     
+    def present(self):
+        """Show the finished frame (full flip while the screen is shaking)"""
+        self.presenter.present(force_full=self.effects_renderer.is_shaking())
+
+    def apply_quality(self, settings):
+        """Apply a QUALITY_PRESETS entry to the renderers"""
+        self.game_renderer.glow_layers = settings['glow_layers']
+        self.effects_renderer.set_trail_length(settings['trail_length'])
+        self.ui_effects.grid_highlights_enabled = settings['grid_highlights']
+        self.menu_renderer.title_glow_layers = settings['title_glow_layers']
+
     def add_screen_shake(self, intensity, duration):
-        """Add screen shake effect"""
+        """Add screen shake effect (duration in simulation ticks)"""
         self.effects_renderer.add_screen_shake(intensity, duration)
     
             
-    def render_start_screen(self, start_screen_system):
+    def render_start_screen(self, start_screen_system, interpolation=1.0):
         """Render the start screen with title, demo game, and menu"""
-        self.frame_count += 1
-        self.menu_renderer.update_frame_count(self.frame_count)
+        self.sync_animation_clock(interpolation)
         
-        self.menu_renderer.render_start_screen(self.screen, start_screen_system)
+        self.menu_renderer.render_start_screen(self.screen, start_screen_system, interpolation)
             
-    def render_game_over_screen(self, game_over_system):
+    def render_game_over_screen(self, game_over_system, interpolation=1.0):
         """Render the game over screen with winner announcement and menu"""
-        self.frame_count += 1
-        self.menu_renderer.update_frame_count(self.frame_count)
+        self.sync_animation_clock(interpolation)
         
         self.menu_renderer.render_game_over_screen(self.screen, game_over_system)
 
-    def render_settings_screen(self, settings_screen_system):
+    def render_settings_screen(self, settings_screen_system, interpolation=1.0):
         """Render the settings screen with options and current values"""
-        self.frame_count += 1
-        self.menu_renderer.update_frame_count(self.frame_count)
+        self.sync_animation_clock(interpolation)
         
         self.menu_renderer.render_settings_screen(self.screen, settings_screen_system)
\ No newline at end of file
@@ -18,6 +18,7 @@ class SettingsScreenSystem:
         self.current_difficulty = DIFFICULTY_MEDIUM
         self.current_sound_enabled = True
         self.current_controller_sensitivity = 1.0
+        self.current_graphics_quality = QUALITY_AUTO
         
     def set_callbacks(self, on_back=None, on_setting_changed=None):
         """Set callback functions for menu actions"""
@@ -36,6 +37,7 @@ class SettingsScreenSystem:
             
             self.current_sound_enabled = settings_system.get_setting('sound_enabled')
             self.current_controller_sensitivity = settings_system.get_setting('controller_sensitivity')
+            self.current_graphics_quality = settings_system.get_setting('graphics_quality')
         
     def get_selected_option(self):
         """Get the currently selected menu option"""
@@ -49,6 +51,8 @@ class SettingsScreenSystem:
             return "On" if self.current_sound_enabled else "Off"
         elif option == SETTINGS_MENU_CONTROLLER:
             return f"{self.current_controller_sensitivity:.1f}"
+        elif option == SETTINGS_MENU_QUALITY:
+            return self.current_graphics_quality
         return ""
         
     def handle_settings_input(self, input_handler):
@@ -113,6 +117,15 @@ class SettingsScreenSystem:
             # Notify settings changed
             if self.on_setting_changed:
                 self.on_setting_changed('controller_sensitivity', self.current_controller_sensitivity)
+
+        elif setting_option == SETTINGS_MENU_QUALITY:
+            current_index = QUALITY_OPTIONS.index(self.current_graphics_quality)
+            new_index = (current_index + direction) % len(QUALITY_OPTIONS)
+            self.current_graphics_quality = QUALITY_OPTIONS[new_index]
+
+            # Notify settings changed
+            if self.on_setting_changed:
+                self.on_setting_changed('graphics_quality', self.current_graphics_quality)
                 
     def execute_menu_action(self, action):
         """Execute the selected menu action"""
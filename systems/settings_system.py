@@ -12,7 +12,9 @@ class SettingsSystem:
         self.default_settings = {
             'ai_difficulty': DIFFICULTY_VALUES[DIFFICULTY_MEDIUM],  # 0.6
             'sound_enabled': True,
-            'controller_sensitivity': CONTROLLER_SENSITIVITY
+            'controller_sensitivity': CONTROLLER_SENSITIVITY,
+            'graphics_quality': QUALITY_AUTO,
+            'auto_quality_start': None  # Preset picked by the first-launch benchmark (None: not run yet)
         }
         
         # Current settings (will be loaded from file or set to defaults)
@@ -72,6 +74,17 @@ class SettingsSystem:
                                 self.settings[key] = value
                             else:
                                 print(f"Invalid sound setting {value}, using default")
+                        # Validate graphics quality
+                        elif key == 'graphics_quality':
+                            if value in QUALITY_OPTIONS:
+                                self.settings[key] = value
+                            else:
+                                print(f"Invalid graphics quality {value}, using default")
+                        elif key == 'auto_quality_start':
+                            if value is None or value in QUALITY_PRESET_OPTIONS:
+                                self.settings[key] = value
+                            else:
+                                print(f"Invalid auto quality preset {value}, benchmarking again")
                         else:
                             self.settings[key] = value
                 
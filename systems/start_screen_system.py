@@ -1,6 +1,9 @@
 from entities.ball import Ball
 from entities.paddle import Paddle
 from systems.ai import AIPlayer
+from systems.ball_forecast import BallForecast
+from systems.collision_system import CollisionSystem
+from core.rng import get_stream
 from utils.constants import *
 
 class StartScreenSystem:
@@ -16,12 +19,18 @@ class StartScreenSystem:
         self.on_play = None
         self.on_settings = None
         
-        # AI demo game state
-        self.demo_ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        # AI demo game state - purely decorative, so it draws from the cosmetic stream
+        self.demo_rng = get_stream(RNG_STREAM_COSMETIC)
+        self.demo_ball = Ball(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, rng=self.demo_rng)
         self.demo_paddles = []
         self.demo_ai_players = []
         self.demo_frame_count = 0
         
+        # Demo uses the left/right paddles; top and bottom act as walls
+        self.demo_alive_players = [True, True, False, False]
+        self.collision_system = CollisionSystem()
+        self.demo_forecast = BallForecast()
+        
         # Initialize demo game
         self.init_demo_game()
         
@@ -36,16 +45,16 @@ class StartScreenSystem:
         self.demo_ai_players = []
         
         # Create two paddles for demo - left and right
-        left_paddle = Paddle(PADDLE_MARGIN, SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2, 0, 'vertical')
-        right_paddle = Paddle(SCREEN_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH, 
-                             SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2, 1, 'vertical')
+        left_paddle = Paddle(PADDLE_MARGIN, WORLD_HEIGHT // 2 - PADDLE_HEIGHT // 2, 0, 'vertical')
+        right_paddle = Paddle(WORLD_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH, 
+                             WORLD_HEIGHT // 2 - PADDLE_HEIGHT // 2, 1, 'vertical')
         
         self.demo_paddles = [left_paddle, right_paddle]
         
         # Create AI players for both paddles
         self.demo_ai_players = [
-            AIPlayer(left_paddle, difficulty=0.5),   # Left paddle AI
-            AIPlayer(right_paddle, difficulty=0.5),  # Right paddle AI
+            AIPlayer(left_paddle, difficulty=0.5, rng=self.demo_rng),   # Left paddle AI
+            AIPlayer(right_paddle, difficulty=0.5, rng=self.demo_rng),  # Right paddle AI
         ]
         
         # Set initial ball velocity
@@ -97,47 +106,34 @@ class StartScreenSystem:
         """Update the AI demo game"""
         self.demo_frame_count += 1
         
-        # Update AI players
+        # Remember last tick's positions for render interpolation
+        self.demo_ball.store_previous_position()
+        for paddle in self.demo_paddles:
+            paddle.store_previous_position()
+        
+        # Update AI players from one shared forecast
+        self.demo_forecast.update(self.demo_ball, self.demo_paddles, self.demo_alive_players)
         for ai_player in self.demo_ai_players:
-            ai_player.update(self.demo_ball)
+            ai_player.update(self.demo_ball, self.demo_forecast)
             
         # Update paddles
         for paddle in self.demo_paddles:
             paddle.update()
             
-        # Update ball
-        self.demo_ball.update()
-        
-        # Check ball-paddle collisions
-        for paddle in self.demo_paddles:
-            if self.demo_ball.rect.colliderect(paddle.rect):
-                self.demo_ball.bounce_off_paddle(paddle)
-                
-        # Check boundary collisions and reset if needed
-        self.check_demo_boundary_collisions()
+        # Update ball trail and glow
+        self.demo_ball.update_effects()
         
-    def check_demo_boundary_collisions(self):
-        """Check boundary collisions for demo game"""
-        reset_needed = False
+        # Move ball with swept collisions - paddles and top/bottom walls bounce
+        collision_info = self.collision_system.move_ball(
+            self.demo_ball, self.demo_paddles, self.demo_alive_players
+        )
         
-        # Check left/right boundaries (reset ball)
-        if (self.demo_ball.x <= BOUNDARY_THICKNESS or 
-            self.demo_ball.x >= SCREEN_WIDTH - BOUNDARY_THICKNESS):
-            reset_needed = True
-            
-        # Check top/bottom boundaries (bounce)
-        if self.demo_ball.y <= BOUNDARY_THICKNESS:
-            self.demo_ball.bounce_off_wall("top")
-        elif self.demo_ball.y >= SCREEN_HEIGHT - BOUNDARY_THICKNESS:
-            self.demo_ball.bounce_off_wall("bottom")
-            
-        # Reset ball if it went out of bounds
-        if reset_needed:
+        # Reset ball if it went out on the left/right
+        if collision_info['life_lost']:
             self.demo_ball.reset_position()
             # Vary the starting velocity for interesting gameplay
-            import random
-            speed_x = BALL_SPEED * random.choice([-0.8, 0.8])
-            speed_y = BALL_SPEED * random.uniform(-0.5, 0.5)
+            speed_x = BALL_SPEED * self.demo_rng.choice([-0.8, 0.8])
+            speed_y = BALL_SPEED * self.demo_rng.uniform(-0.5, 0.5)
             self.demo_ball.velocity.x = speed_x
             self.demo_ball.velocity.y = speed_y
             
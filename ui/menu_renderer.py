@@ -1,12 +1,18 @@
 import pygame
 import math
+from collections import OrderedDict
 from utils.constants import *
+from core.rng import get_stream
+from ui.text_cache import composite_layers
 
 
 class MenuRenderer:
     def __init__(self, ui_effects):
         self.ui_effects = ui_effects
         self.frame_count = 0
+        self.title_glow_cache = OrderedDict()  # (word, colors, offsets) -> glow composite, LRU
+        self.start_menu_cache = {}  # Selected option -> (menu surface, position)
+        self.title_glow_layers = 5  # Start-screen title glow layers drawn (quality preset)
 
     def update_frame_count(self, frame_count):
         """Update frame count for animations"""
@@ -25,22 +31,10 @@ class MenuRenderer:
         
         # Main PAUSED text
         pause_text = "PAUSED"
-        text_surface = self.ui_effects.font_large.render(pause_text, True, NEON_YELLOW)
-        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        
-        # Glow effect for pause text
-        glow_size = 15
-        glow_alpha = 80
-        for i in range(3):
-            glow_surface = pygame.Surface((text_rect.width + glow_size * 2, text_rect.height + glow_size * 2), pygame.SRCALPHA)
-            glow_color = (*NEON_YELLOW, glow_alpha // (i + 1))
-            glow_text = self.ui_effects.font_large.render(pause_text, True, glow_color)
-            glow_text_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
-            glow_surface.blit(glow_text, glow_text_rect)
-            screen.blit(glow_surface, (text_rect.x - glow_size, text_rect.y - glow_size))
-        
-        # Main pause text on top
-        screen.blit(text_surface, text_rect)
+        
+        # Pause text with its glow layers (one cached surface)
+        self.ui_effects.create_glow_effect(screen, pause_text, self.ui_effects.font_large, NEON_YELLOW,
+                                           (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100), glow_alpha=80)
         
         # Draw menu options
         menu_start_y = SCREEN_HEIGHT // 2 - 20
@@ -59,7 +53,7 @@ class MenuRenderer:
                 
                 # Draw selection arrow
                 arrow_text = "►"
-                arrow_surface = self.ui_effects.font_large.render(arrow_text, True, NEON_GREEN)
+                arrow_surface = self.ui_effects.render_text(self.ui_effects.font_large, arrow_text, NEON_GREEN)
                 arrow_rect = arrow_surface.get_rect(center=(SCREEN_WIDTH // 2 - 120, y_pos))
                 screen.blit(arrow_surface, arrow_rect)
                 
@@ -70,23 +64,15 @@ class MenuRenderer:
                 glow_intensity = 0.3
                 font_to_use = self.ui_effects.font_medium
             
-            # Create text surface
-            text_surface = font_to_use.render(option_text, True, text_color)
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-            
-            # Draw glow effect for selected option
+            # Glow layers for the selected option
+            glow_colors = ()
             if i == selected_option:
-                glow_size = int(20 * glow_intensity)
                 glow_alpha = int(120 * glow_intensity)
-                for j in range(3):
-                    glow_surface = pygame.Surface((text_rect.width + glow_size * 2, text_rect.height + glow_size * 2), pygame.SRCALPHA)
-                    current_glow_color = (*glow_color, glow_alpha // (j + 1))
-                    glow_text = font_to_use.render(option_text, True, current_glow_color)
-                    glow_text_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
-                    glow_surface.blit(glow_text, glow_text_rect)
-                    screen.blit(glow_surface, (text_rect.x - glow_size, text_rect.y - glow_size))
+                glow_colors = tuple((*glow_color, glow_alpha // (j + 1)) for j in range(3))
             
-            # Draw main text
+            # Draw text (glow composited into the cached surface)
+            text_surface = self.ui_effects.render_text(font_to_use, option_text, text_color, glow_colors)
+            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
             screen.blit(text_surface, text_rect)
         
         # Instructions at bottom
@@ -98,16 +84,68 @@ class MenuRenderer:
         ]
         
         for i, instruction in enumerate(instructions):
-            text_surface = self.ui_effects.font_small.render(instruction, True, (150, 150, 150))
+            text_surface = self.ui_effects.render_text(self.ui_effects.font_small, instruction, (150, 150, 150))
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, instruction_y + i * 20))
             screen.blit(text_surface, text_rect)
 
-    def render_start_screen(self, screen, start_screen_system):
-        """Render the start screen with title, demo game, and menu"""
-        # Clear screen with black background
-        screen.fill(BLACK)
+    def get_title_glow(self, word, glow_colors, glow_offsets):
+        """Cached composite of a title word's glow layers, each shifted right by its offset"""
+        key = (word, glow_colors, glow_offsets)
+        glow_surface = self.title_glow_cache.get(key)
+        if glow_surface is not None:
+            self.title_glow_cache.move_to_end(key)
+            return glow_surface
+        
+        font = self.ui_effects.font_retro_massive
+        width, height = font.size(word)
+        layers = [(self.ui_effects.render_text(font, word, glow_color), (offset, 0))
+                  for glow_color, offset in zip(glow_colors, glow_offsets)]
+        glow_surface = composite_layers(layers, (width + max(glow_offsets), height))
+        self.title_glow_cache[key] = glow_surface
+        if len(self.title_glow_cache) > START_TITLE_GLOW_CACHE_SIZE:
+            self.title_glow_cache.popitem(last=False)
+        return glow_surface
+
+    def get_start_menu(self, selected_option):
+        """Start menu options and instructions composited into one cached surface.
+
+        The selected option's glow is the same text drawn underneath (font
+        rendering drops the color's alpha, so the glow never pulsed) - the
+        whole block only changes with the selection.
+        """
+        if selected_option in self.start_menu_cache:
+            return self.start_menu_cache[selected_option]
+        
+        # Menu options at bottom
+        menu_y = 580  # Moved down more for larger menu text
+        items = []
+        for i, option in enumerate(START_MENU_OPTIONS):
+            if i == selected_option:
+                text_surface = self.ui_effects.render_text(self.ui_effects.font_retro_large_menu, option,
+                                                           NEON_YELLOW, (NEON_YELLOW,))
+            else:
+                text_surface = self.ui_effects.render_text(self.ui_effects.font_retro_large_menu, option, WHITE)
+            items.append((text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, menu_y + i * 70))))
         
-        # Draw subtle background grid - delegate to ui_effects
+        # Instructions at bottom
+        instruction_y = 720
+        instructions = [
+            "Use Up/Down or Analog Stick to navigate",
+            "Press A or ENTER to select"
+        ]
+        for i, instruction in enumerate(instructions):
+            text_surface = self.ui_effects.render_text(self.ui_effects.font_small, instruction, (150, 150, 150))
+            items.append((text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, instruction_y + i * 20))))
+        
+        bounds = items[0][1].unionall([rect for _, rect in items[1:]])
+        layers = [(text_surface, (rect.x - bounds.x, rect.y - bounds.y)) for text_surface, rect in items]
+        menu = (composite_layers(layers, bounds.size), bounds.topleft)
+        self.start_menu_cache[selected_option] = menu
+        return menu
+
+    def render_start_screen(self, screen, start_screen_system, interpolation=1.0):
+        """Render the start screen with title, demo game, and menu"""
+        # Draw the background grid (opaque - it also clears the screen)
         self.ui_effects.draw_background_grid(screen, self.frame_count)
         
         # Get demo game state
@@ -139,28 +177,28 @@ class MenuRenderer:
             int(current_color[2] * (1 - color_blend) + next_color[2] * color_blend)
         )
         
+        # Glow layers are the base colors dimmed to a quarter (as many as the quality preset allows)
+        glow_colors = tuple((color[0] // 4, color[1] // 4, color[2] // 4)
+                            for color in base_colors[:self.title_glow_layers])
+        title_font = self.ui_effects.font_retro_massive
+        
         # Draw each word of the title
         for word_idx, (word, y_pos) in enumerate(zip(title_words, title_positions)):
-            # Create pulsing glow layers for this word
-            glow_colors = []
-            for i, base_color in enumerate(base_colors):
-                # Create pulsing glow with varying intensities
-                glow_alpha = int((pulse_intensity * 0.3 + 0.1) * 255)  # 10% to 40% opacity
-                glow_color = (base_color[0] // 4, base_color[1] // 4, base_color[2] // 4, glow_alpha)
-                glow_colors.append(glow_color)
-            
-            # Draw multiple animated glow layers for this word
-            for i, glow_color in enumerate(glow_colors):
+            # Glow layers sway by a few pixels - each arrangement is composited once and cached
+            word_size = title_font.size(word)
+            glow_rects = []
+            for i in range(len(glow_colors)):
                 glow_offset = math.sin(pulse_time + i * 0.5 + word_idx * 0.3) * 2  # Slight offset variation
-                glow_surface = pygame.Surface((SCREEN_WIDTH, 150), pygame.SRCALPHA)
-                glow_text = self.ui_effects.font_retro_massive.render(word, True, glow_color[:3])
-                glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH // 2 + glow_offset, 75))
-                glow_surface.blit(glow_text, glow_rect)
-                screen.blit(glow_surface, (0, y_pos - 75))
+                glow_rect = pygame.Rect((0, 0), word_size)
+                glow_rect.center = (SCREEN_WIDTH // 2 + glow_offset, y_pos)
+                glow_rects.append(glow_rect)
+            left = min(glow_rect.x for glow_rect in glow_rects)
+            glow_offsets = tuple(glow_rect.x - left for glow_rect in glow_rects)
+            screen.blit(self.get_title_glow(word, glow_colors, glow_offsets), (left, glow_rects[0].y))
             
-            # Draw main word with pulsing size
+            # Draw main word with pulsing size (color cycles every frame - rendered directly)
             scale_factor = 0.9 + pulse_intensity * 0.1  # Slight size pulsing
-            word_surface = self.ui_effects.font_retro_massive.render(word, True, title_color)
+            word_surface = title_font.render(word, True, title_color)
             if scale_factor != 1.0:
                 # Scale the word surface
                 scaled_size = (int(word_surface.get_width() * scale_factor), 
@@ -174,7 +212,8 @@ class MenuRenderer:
         
         # Draw demo paddles at actual game size
         for paddle in demo_state['paddles']:
-            paddle_rect = pygame.Rect(paddle.x, paddle.y, paddle.width, paddle.height)
+            paddle_x, paddle_y = paddle.get_render_position(interpolation)
+            paddle_rect = pygame.Rect(paddle_x, paddle_y, paddle.width, paddle.height)
             
             # Draw paddle glow
             glow_surface = pygame.Surface((paddle_rect.width + 20, paddle_rect.height + 20), pygame.SRCALPHA)
@@ -188,68 +227,24 @@ class MenuRenderer:
         
         # Draw demo ball at actual game size
         ball = demo_state['ball']
+        ball_x, ball_y = ball.get_render_position(interpolation)
         
         # Draw ball glow
         glow_radius = int(ball.size * 2)
         glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(glow_surface, (*WHITE, 40), (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surface, (ball.x - glow_radius, ball.y - glow_radius))
+        screen.blit(glow_surface, (ball_x - glow_radius, ball_y - glow_radius))
         
         # Draw main ball
-        pygame.draw.circle(screen, WHITE, (int(ball.x), int(ball.y)), int(ball.size))
+        pygame.draw.circle(screen, WHITE, (int(ball_x), int(ball_y)), int(ball.size))
         
-        # Draw menu options at bottom
-        menu_y = 580  # Moved down more for larger menu text
-        selected_option = start_screen_system.get_selected_option()
-        
-        for i, option in enumerate(START_MENU_OPTIONS):
-            is_selected = (i == selected_option)
-            
-            # Create text surface
-            if is_selected:
-                text_surface = self.ui_effects.font_retro_large_menu.render(option, True, NEON_YELLOW)
-            else:
-                text_surface = self.ui_effects.font_retro_large_menu.render(option, True, WHITE)
-            
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, menu_y + i * 70))  # Increased spacing for larger text
-            
-            # Draw glow for selected option
-            if is_selected:
-                # Pulsing glow effect
-                pulse = abs(math.sin(self.frame_count * 0.1)) * 0.5 + 0.5
-                glow_alpha = int(80 + pulse * 40)
-                
-                glow_size = 25  # Larger glow for larger text
-                glow_surface = pygame.Surface((text_rect.width + glow_size * 2, 
-                                             text_rect.height + glow_size * 2), pygame.SRCALPHA)
-                glow_color = (*NEON_YELLOW, glow_alpha)
-                glow_text = self.ui_effects.font_retro_large_menu.render(option, True, glow_color)
-                glow_text_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, 
-                                                          glow_surface.get_height() // 2))
-                glow_surface.blit(glow_text, glow_text_rect)
-                screen.blit(glow_surface, (text_rect.x - glow_size, text_rect.y - glow_size))
-            
-            # Draw main text
-            screen.blit(text_surface, text_rect)
-        
-        # Draw instructions at bottom
-        instruction_y = 720
-        instructions = [
-            "Use Up/Down or Analog Stick to navigate",
-            "Press A or ENTER to select"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text_surface = self.ui_effects.font_small.render(instruction, True, (150, 150, 150))
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, instruction_y + i * 20))
-            screen.blit(text_surface, text_rect)
+        # Draw menu options and instructions (one cached block per selection)
+        menu_surface, menu_position = self.get_start_menu(start_screen_system.get_selected_option())
+        screen.blit(menu_surface, menu_position)
 
     def render_game_over_screen(self, screen, game_over_system):
         """Render the game over screen with winner announcement and menu"""
-        # Clear screen with black background
-        screen.fill(BLACK)
-        
-        # Draw subtle background grid
+        # Draw the background grid (opaque - it also clears the screen)
         self.ui_effects.draw_background_grid(screen, self.frame_count)
         
         # Get winner information
@@ -267,22 +262,14 @@ class MenuRenderer:
         pulse = abs(math.sin(self.frame_count * 0.08)) * 0.3 + 0.7
         title_glow_alpha = int(60 * pulse)
         
-        # Draw multiple glow layers for title
-        glow_colors = [
-            (NEON_PURPLE[0] // 4, NEON_PURPLE[1] // 4, NEON_PURPLE[2] // 4),
-            (NEON_ORANGE[0] // 3, NEON_ORANGE[1] // 3, NEON_ORANGE[2] // 3),
-        ]
-        
-        for i, glow_color in enumerate(glow_colors):
-            glow_size = 8 + i * 4
-            glow_surface = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA)
-            glow_text = self.ui_effects.font_retro_large.render(game_over_text, True, (*glow_color, title_glow_alpha))
-            glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
-            glow_surface.blit(glow_text, glow_rect)
-            screen.blit(glow_surface, (0, game_over_y - 40))
+        # Glow layers for title
+        glow_colors = (
+            (NEON_PURPLE[0] // 4, NEON_PURPLE[1] // 4, NEON_PURPLE[2] // 4, title_glow_alpha),
+            (NEON_ORANGE[0] // 3, NEON_ORANGE[1] // 3, NEON_ORANGE[2] // 3, title_glow_alpha),
+        )
         
-        # Draw main title text
-        title_surface = self.ui_effects.font_retro_large.render(game_over_text, True, WHITE)
+        # Draw main title text over its glow layers
+        title_surface = self.ui_effects.render_text(self.ui_effects.font_retro_large, game_over_text, WHITE, glow_colors)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, game_over_y))
         screen.blit(title_surface, title_rect)
         
@@ -299,29 +286,22 @@ class MenuRenderer:
             celebration_intensity = celebration_timer / max_celebration_time
             celebration_glow_alpha = int(100 + celebration_intensity * 100)
             
-            # Draw winner glow
-            glow_size = 15
-            glow_surface = pygame.Surface((SCREEN_WIDTH, 100), pygame.SRCALPHA)
-            glow_text = self.ui_effects.font_retro_medium.render(winner_text, True, (*winner_color, celebration_glow_alpha))
-            glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-            glow_surface.blit(glow_text, glow_rect)
-            screen.blit(glow_surface, (0, winner_y - 50))
-            
-            # Draw main winner text
-            winner_surface = self.ui_effects.font_retro_medium.render(winner_text, True, winner_color)
+            # Draw main winner text over its glow
+            winner_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, winner_text, winner_color,
+                                                         ((*winner_color, celebration_glow_alpha),))
             winner_rect = winner_surface.get_rect(center=(SCREEN_WIDTH // 2, winner_y))
             screen.blit(winner_surface, winner_rect)
             
             # Draw lives remaining info
             lives_y = winner_y + 60
             lives_text = f"Lives Remaining: {winner_info['winner_lives']}"
-            lives_surface = self.ui_effects.font_small.render(lives_text, True, (200, 200, 200))
+            lives_surface = self.ui_effects.render_text(self.ui_effects.font_small, lives_text, (200, 200, 200))
             lives_rect = lives_surface.get_rect(center=(SCREEN_WIDTH // 2, lives_y))
             screen.blit(lives_surface, lives_rect)
         else:
             # Draw tie/no winner message
             no_winner_text = "ALL PLAYERS ELIMINATED!"
-            no_winner_surface = self.ui_effects.font_retro_medium.render(no_winner_text, True, NEON_PURPLE)
+            no_winner_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, no_winner_text, NEON_PURPLE)
             no_winner_rect = no_winner_surface.get_rect(center=(SCREEN_WIDTH // 2, winner_y))
             screen.blit(no_winner_surface, no_winner_rect)
         
@@ -332,12 +312,12 @@ class MenuRenderer:
             particle_surface = pygame.Surface((particle_area.width, particle_area.height), pygame.SRCALPHA)
             
             # Draw some simple celebration "sparks"
-            import random
+            rng = get_stream(RNG_STREAM_COSMETIC)
             for _ in range(int(20 * celebration_intensity)):
-                x = random.randint(0, particle_area.width)
-                y = random.randint(0, particle_area.height)
-                color = random.choice(PLAYER_COLORS)
-                size = random.randint(2, 5)
+                x = rng.randint(0, particle_area.width)
+                y = rng.randint(0, particle_area.height)
+                color = rng.choice(PLAYER_COLORS)
+                size = rng.randint(2, 5)
                 pygame.draw.circle(particle_surface, (*color, particle_alpha), (x, y), size)
             
             screen.blit(particle_surface, particle_area.topleft)
@@ -349,31 +329,16 @@ class MenuRenderer:
         for i, option in enumerate(GAME_OVER_MENU_OPTIONS):
             is_selected = (i == selected_option)
             
-            # Create text surface
+            # Create text surface (selected option: pulsing glow composited in)
             if is_selected:
-                text_surface = self.ui_effects.font_retro_medium.render(option, True, NEON_YELLOW)
-            else:
-                text_surface = self.ui_effects.font_retro_medium.render(option, True, WHITE)
-            
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, menu_y + i * 60))
-            
-            # Draw glow for selected option
-            if is_selected:
-                # Pulsing glow effect
                 pulse = abs(math.sin(self.frame_count * 0.1)) * 0.5 + 0.5
                 glow_alpha = int(80 + pulse * 40)
-                
-                glow_size = 20
-                glow_surface = pygame.Surface((text_rect.width + glow_size * 2, 
-                                             text_rect.height + glow_size * 2), pygame.SRCALPHA)
-                glow_color = (*NEON_YELLOW, glow_alpha)
-                glow_text = self.ui_effects.font_retro_medium.render(option, True, glow_color)
-                glow_text_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, 
-                                                          glow_surface.get_height() // 2))
-                glow_surface.blit(glow_text, glow_text_rect)
-                screen.blit(glow_surface, (text_rect.x - glow_size, text_rect.y - glow_size))
+                text_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, option,
+                                                           NEON_YELLOW, ((*NEON_YELLOW, glow_alpha),))
+            else:
+                text_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, option, WHITE)
             
-            # Draw main text
+            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, menu_y + i * 60))
             screen.blit(text_surface, text_rect)
         
         # Draw instructions at bottom
@@ -384,16 +349,13 @@ class MenuRenderer:
         ]
         
         for i, instruction in enumerate(instructions):
-            text_surface = self.ui_effects.font_small.render(instruction, True, (150, 150, 150))
+            text_surface = self.ui_effects.render_text(self.ui_effects.font_small, instruction, (150, 150, 150))
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, instruction_y + i * 20))
             screen.blit(text_surface, text_rect)
 
     def render_settings_screen(self, screen, settings_screen_system):
         """Render the settings screen with options and current values"""
-        # Clear screen with black background
-        screen.fill(BLACK)
-        
-        # Draw subtle background grid
+        # Draw the background grid (opaque - it also clears the screen)
         self.ui_effects.draw_background_grid(screen, self.frame_count)
         
         # Draw "SETTINGS" title at top
@@ -401,22 +363,13 @@ class MenuRenderer:
         title_text = "SETTINGS"
         
         # Create multiple glow layers for title
-        glow_colors = [
+        glow_colors = (
             (NEON_GREEN[0] // 4, NEON_GREEN[1] // 4, NEON_GREEN[2] // 4),  # Dim green glow
             (NEON_PURPLE[0] // 3, NEON_PURPLE[1] // 3, NEON_PURPLE[2] // 3),  # Dim purple glow
-        ]
+        )
         
-        # Draw multiple glow layers for title
-        for i, glow_color in enumerate(glow_colors):
-            glow_size = 8 + i * 4
-            glow_surface = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA)
-            glow_text = self.ui_effects.font_retro_large.render(title_text, True, glow_color)
-            glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
-            glow_surface.blit(glow_text, glow_rect)
-            screen.blit(glow_surface, (0, title_y - 40))
-        
-        # Draw main title text
-        title_surface = self.ui_effects.font_retro_large.render(title_text, True, WHITE)
+        # Draw main title text over its glow layers
+        title_surface = self.ui_effects.render_text(self.ui_effects.font_retro_large, title_text, WHITE, glow_colors)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, title_y))
         screen.blit(title_surface, title_rect)
         
@@ -435,9 +388,9 @@ class MenuRenderer:
             # Create option text
             option_text = option
             if is_selected:
-                option_surface = self.ui_effects.font_retro_medium.render(option_text, True, NEON_YELLOW)
+                option_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, option_text, NEON_YELLOW)
             else:
-                option_surface = self.ui_effects.font_retro_medium.render(option_text, True, WHITE)
+                option_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, option_text, WHITE)
             
             # Position option text on the left
             option_rect = option_surface.get_rect()
@@ -447,9 +400,9 @@ class MenuRenderer:
             # Create value text (except for Back option)
             if i != SETTINGS_MENU_BACK:
                 if is_selected:
-                    value_surface = self.ui_effects.font_retro_medium.render(current_value, True, NEON_CYAN)
+                    value_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, current_value, NEON_CYAN)
                 else:
-                    value_surface = self.ui_effects.font_retro_medium.render(current_value, True, (200, 200, 200))
+                    value_surface = self.ui_effects.render_text(self.ui_effects.font_retro_medium, current_value, (200, 200, 200))
                 
                 # Position value text on the right
                 value_rect = value_surface.get_rect()
@@ -514,6 +467,6 @@ class MenuRenderer:
         ]
         
         for i, instruction in enumerate(instructions):
-            text_surface = self.ui_effects.font_small.render(instruction, True, (150, 150, 150))
+            text_surface = self.ui_effects.render_text(self.ui_effects.font_small, instruction, (150, 150, 150))
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, instruction_y + i * 25))
             screen.blit(text_surface, text_rect)
\ No newline at end of file
@@ -0,0 +1,96 @@
+import numpy as np
+import pygame
+from collections import OrderedDict
+from utils.constants import *
+
+def composite_layers(layers, size):
+    """Flatten (surface, (x, y)) layers, bottom first, into one straight-alpha surface.
+
+    Layers are stacked with premultiplied "over" blending, which gives
+    the same pixels as blitting each layer onto the screen in turn.
+    """
+    rgb = np.zeros((*size, 3), dtype=np.float32)  # Premultiplied
+    alpha = np.zeros(size, dtype=np.float32)
+    for surface, (x, y) in layers:
+        # Copy onto a plain SRCALPHA surface so every layer has the same pixel format
+        layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        layer.blit(surface, (0, 0))
+        area = (slice(x, x + layer.get_width()), slice(y, y + layer.get_height()))
+        layer_alpha = pygame.surfarray.array_alpha(layer).astype(np.float32)[:, :, None] / 255
+        layer_rgb = pygame.surfarray.array3d(layer).astype(np.float32)
+        rgb[area] = layer_rgb * layer_alpha + rgb[area] * (1 - layer_alpha)
+        alpha[area] = layer_alpha[:, :, 0] + alpha[area] * (1 - layer_alpha[:, :, 0])
+
+    # Back to straight alpha so callers blit it like any other text surface
+    composite = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(composite)[:] = np.clip(
+        np.rint(rgb / np.maximum(alpha, 1e-6)[:, :, None]), 0, 255).astype(np.uint8)
+    pygame.surfarray.pixels_alpha(composite)[:] = np.rint(alpha * 255).astype(np.uint8)
+    return composite
+
+class TextCache:
+    """Finished text surfaces keyed by font, string, color and glow layers.
+
+    Menus and HUDs draw the same strings every frame; rasterizing them once
+    and reusing the surface skips font.render entirely. Glow layers (the
+    same string drawn underneath in other colors) are composited into the
+    cached surface, so a glowing label is one blit. The cache is bounded
+    by pixel memory and drops the least recently used strings first.
+    Cached surfaces are shared - blit them, never draw on them.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, glow_colors=()):
+        """Antialiased text in color, on top of one layer per glow color (RGB or RGBA)"""
+        # font.render ignores the alpha of a color, so glow alphas can't change the pixels -
+        # keyed by RGB only, pulsing glows share one surface instead of one per alpha
+        glow_colors = tuple(tuple(glow_color[:3]) for glow_color in glow_colors)
+        key = (font, text, tuple(color), glow_colors)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        if glow_colors:
+            surface = self.composite_glow(font, text, surface, glow_colors)
+        self.entries[key] = surface
+        self.bytes += self.get_surface_bytes(surface)
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.get_surface_bytes(evicted)
+        return surface
+
+    def composite_glow(self, font, text, text_surface, glow_colors):
+        """Flatten glow layers and the text into one straight-alpha surface"""
+        layers = [(font.render(text, True, glow_color), (0, 0)) for glow_color in glow_colors]
+        layers.append((text_surface, (0, 0)))
+        return composite_layers(layers, text_surface.get_size())
+
+    def get_surface_bytes(self, surface):
+        """Pixel memory of a cached surface"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def clear(self):
+        """Drop every cached string"""
+        self.entries.clear()
+        self.bytes = 0
+
+    def get_stats(self):
+        """Cache hit/miss counters and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -1,5 +1,6 @@
 import pygame
 import math
+from ui.text_cache import TextCache
 from utils.constants import *
 
 
@@ -30,64 +31,109 @@ class UIEffects:
             self.font_retro_medium = pygame.font.Font(None, 32)
             self.font_retro_small = self.font_small
 
-    def draw_background_grid(self, screen, frame_count):
-        """Draw an animated neon grid background"""
+        # Rendered strings (with glow) reused across frames
+        self.text_cache = TextCache()
+
+        # Pre-rendered background grid (see draw_background_grid)
+        self.static_background = False  # Freeze the grid's scroll and pulse
+        self.grid_highlights_enabled = True  # Intersection dots (quality preset)
+        self.grid_spacing = 50
+        self.grid_layouts = {}  # (grid tile, highlight radius, highlight positions) by surface size and scale
+        self.grid_highlights = {}  # Intersection highlight sprite by (alpha, radius)
+
+    def get_grid_layout(self, size, scale=1.0):
+        """Grid tile and intersection highlight layout for a surface size and world-to-surface scale"""
+        key = (size, scale)
+        layout = self.grid_layouts.get(key)
+        if layout is None:
+            width, height = size
+            spacing = self.grid_spacing * scale
+            radius = max(1, round(3 * scale))
+            highlight_positions = [(round(x * spacing) - radius, round(y * spacing) - radius)
+                                   for x in range(0, math.ceil(width / spacing), 2)
+                                   for y in range(0, math.ceil(height / spacing), 2)]
+            layout = (self.build_grid_tile(size, scale), radius, highlight_positions)
+            self.grid_layouts[key] = layout
+        return layout
+
+    def build_grid_tile(self, size, scale=1.0):
+        """Render the scrolling grid lines once into an 8-bit tile one cell larger than the surface.
+
+        Palette entry 1 is the line color, so the pulse is a palette update
+        instead of a redraw.
+        """
+        spacing = self.grid_spacing * scale
+        width = size[0] + math.ceil(spacing)
+        height = size[1] + math.ceil(spacing)
+        tile = pygame.Surface((width, height), depth=8)
+        tile.set_palette_at(0, BLACK)
+        tile.set_palette_at(1, NEON_CYAN)
+        for i in range(math.ceil(width / spacing)):
+            x = round(i * spacing)
+            pygame.draw.line(tile, NEON_CYAN, (x, 0), (x, height), 1)
+        for i in range(math.ceil(height / spacing)):
+            y = round(i * spacing)
+            pygame.draw.line(tile, NEON_CYAN, (0, y), (width, y), 1)
+        return tile
+
+    def get_grid_highlight(self, alpha, radius=3):
+        """Intersection highlight sprite for an alpha (a few dozen distinct values)"""
+        key = (alpha, radius)
+        highlight_surface = self.grid_highlights.get(key)
+        if highlight_surface is None:
+            highlight_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(highlight_surface, (*NEON_BLUE, alpha), (radius, radius), radius)
+            self.grid_highlights[key] = highlight_surface
+        return highlight_surface
+
+    def draw_background_grid(self, screen, frame_count, scale=1.0):
+        """Draw an animated neon grid background (opaque - covers the whole screen).
+
+        scale is surface pixels per world unit, for the world layer drawn
+        at a reduced render resolution.
+        """
+        if self.static_background:
+            frame_count = 0
+        width, height = screen.get_size()
+        grid_tile, highlight_radius, highlight_positions = self.get_grid_layout((width, height), scale)
+
         # Pulsing grid intensity
         pulse = (math.sin(frame_count * 0.05) + 1) * 0.5
         base_intensity = 50
         grid_intensity = int(base_intensity + pulse * 20)
-        
-        grid_color = (0, grid_intensity, grid_intensity)
-        grid_spacing = 50
-        
-        # Moving grid offset for subtle animation
-        offset = int(frame_count * 0.2) % grid_spacing
-
-        # Vertical lines with movement
-        for x in range(-offset, SCREEN_WIDTH + grid_spacing, grid_spacing):
-            if 0 <= x <= SCREEN_WIDTH:
-                pygame.draw.line(screen, grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
+        grid_tile.set_palette_at(1, (0, grid_intensity, grid_intensity))
 
-        # Horizontal lines with movement
-        for y in range(-offset, SCREEN_HEIGHT + grid_spacing, grid_spacing):
-            if 0 <= y <= SCREEN_HEIGHT:
-                pygame.draw.line(screen, grid_color, (0, y), (SCREEN_WIDTH, y), 1)
+        # Moving grid offset for subtle animation
+        offset = int(int(frame_count * 0.2) % self.grid_spacing * scale)
+        screen.blit(grid_tile, (-offset, -offset))
 
         # Center lines with enhanced pulsing
         center_pulse = (math.sin(frame_count * 0.12) + 1) * 0.5
         center_intensity = int(100 + center_pulse * 50)
         center_color = (0, center_intensity, center_intensity)
+        center_width = max(1, round(2 * scale))
         
         pygame.draw.line(screen, center_color,
-                         (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT), 2)
+                         (width // 2, 0), (width // 2, height), center_width)
         pygame.draw.line(screen, center_color,
-                         (0, SCREEN_HEIGHT // 2), (SCREEN_WIDTH, SCREEN_HEIGHT // 2), 2)
+                         (0, height // 2), (width, height // 2), center_width)
         
         # Grid intersection highlights
-        for x in range(0, SCREEN_WIDTH, grid_spacing * 2):
-            for y in range(0, SCREEN_HEIGHT, grid_spacing * 2):
-                highlight_alpha = int(30 * pulse)
-                if highlight_alpha > 0:
-                    highlight_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-                    highlight_color = (*NEON_BLUE, highlight_alpha)
-                    pygame.draw.circle(highlight_surface, highlight_color, (3, 3), 3)
-                    screen.blit(highlight_surface, (x - 3, y - 3))
+        highlight_alpha = int(30 * pulse)
+        if highlight_alpha > 0 and self.grid_highlights_enabled:
+            highlight_surface = self.get_grid_highlight(highlight_alpha, highlight_radius)
+            screen.blits([(highlight_surface, position) for position in highlight_positions],
+                         doreturn=False)
+
+    def render_text(self, font, text, color, glow_colors=()):
+        """Cached antialiased text, drawn over glow layers of the same text in glow_colors"""
+        return self.text_cache.render(font, text, color, glow_colors)
 
     def create_glow_effect(self, screen, text, font, color, position, glow_size=15, glow_alpha=80, num_layers=3):
         """Create a multi-layer glow effect for text"""
-        text_surface = font.render(text, True, color)
+        glow_colors = tuple((*color, glow_alpha // (i + 1)) for i in range(num_layers))
+        text_surface = self.render_text(font, text, color, glow_colors)
         text_rect = text_surface.get_rect(center=position)
-        
-        # Draw glow layers
-        for i in range(num_layers):
-            glow_surface = pygame.Surface((text_rect.width + glow_size * 2, text_rect.height + glow_size * 2), pygame.SRCALPHA)
-            glow_color = (*color, glow_alpha // (i + 1))
-            glow_text = font.render(text, True, glow_color)
-            glow_text_rect = glow_text.get_rect(center=(glow_surface.get_width() // 2, glow_surface.get_height() // 2))
-            glow_surface.blit(glow_text, glow_text_rect)
-            screen.blit(glow_surface, (text_rect.x - glow_size, text_rect.y - glow_size))
-        
-        # Draw main text
         screen.blit(text_surface, text_rect)
         return text_rect
 
@@ -101,7 +147,7 @@ class UIEffects:
     def draw_menu_selection_indicator(self, screen, position, color=NEON_GREEN, size=20):
         """Draw a selection arrow indicator"""
         arrow_text = "►"
-        arrow_surface = self.font_large.render(arrow_text, True, color)
+        arrow_surface = self.render_text(self.font_large, arrow_text, color)
         arrow_rect = arrow_surface.get_rect(center=position)
         screen.blit(arrow_surface, arrow_rect)
 
@@ -126,7 +172,7 @@ class UIEffects:
     def create_instruction_text(self, screen, instructions, start_y, spacing=20, color=(150, 150, 150)):
         """Create and render instruction text at the bottom of screens"""
         for i, instruction in enumerate(instructions):
-            text_surface = self.font_small.render(instruction, True, color)
+            text_surface = self.render_text(self.font_small, instruction, color)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * spacing))
             screen.blit(text_surface, text_rect)
 
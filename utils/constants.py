@@ -1,10 +1,19 @@
-# Game constants and configuration
-import pygame
+# Game constants and configuration (pure Python - no pygame import)
 
-# Screen dimensions
+# Screen dimensions (window pixels - menus and the HUD are laid out in these)
 SCREEN_WIDTH = 850
 SCREEN_HEIGHT = 850
-FPS = 60
+
+# World dimensions (simulation units - the arena, paddles and ball; mapped onto the window when drawn)
+WORLD_WIDTH = 850
+WORLD_HEIGHT = 850
+FPS = 60  # Default render frame cap (--fps) - game speed is set by TICK_RATE, not by this
+
+# Simulation timing (fixed-tick loop, see Game.run)
+TICK_RATE = 60                   # Simulation ticks per second
+TICK_DURATION = 1.0 / TICK_RATE  # Seconds per simulation tick
+MAX_FRAME_TIME = 0.25            # Longest frame delta fed to the tick accumulator (seconds)
+MAX_TICKS_PER_FRAME = 5          # Catch-up cap - extra backlog is dropped after a hitch
 
 # Colors (Retro Neon Theme)
 BLACK = (0, 0, 0)
@@ -30,10 +39,104 @@ H_PADDLE_HEIGHT = 15
 BALL_SIZE = 15
 BALL_SPEED = 8
 BALL_SPEED_BOOST = 0.1  # Optional speed boost on paddle hits (0.0 = no boost, 0.1 = 10% boost)
+BALL_TRAIL_LENGTH = 15  # Ticks of ball positions kept for the trail (ring buffer size)
+
+# Dirty-rectangle presentation (main.py --dirty-rects, systems.display_presenter)
+DIRTY_RECT_TILE_SIZE = 25       # Changed pixels are tracked in square tiles of this size
+DIRTY_RECT_MAX_COVERAGE = 0.5   # Above this changed share of the screen a full flip is cheaper
+
+# Glow surface cache (systems.effects_renderer)
+GLOW_CACHE_SIZE = 128   # Most glow surfaces kept (least recently used are dropped)
+GLOW_ALPHA_STEP = 4     # Glow alpha is quantized to this step so pulses reuse surfaces
+
+# Bloom post-process (systems.bloom, main.py --bloom)
+BLOOM_QUALITY_OFF = "off"      # Layered glow surfaces, no post-process
+BLOOM_QUALITY_LOW = "low"
+BLOOM_QUALITY_HIGH = "high"
+BLOOM_QUALITY_LEVELS = {
+    # downscale: emissive buffer is 1/downscale of the screen per axis
+    # radius/passes: box blur half-width (buffer pixels) and repeat count
+    # strength: emissive brightness multiplier before the blur
+    BLOOM_QUALITY_OFF: None,
+    BLOOM_QUALITY_LOW: {'downscale': 4, 'radius': 2, 'passes': 1, 'strength': 1.0},
+    BLOOM_QUALITY_HIGH: {'downscale': 4, 'radius': 2, 'passes': 2, 'strength': 1.4},
+}
+BLOOM_DEFAULT_QUALITY = BLOOM_QUALITY_OFF
+BLOOM_TILE_SIZE = 8  # Buffer pixels per tile when finding the lit area to scale up
+
+# Render resolution of the world layer (systems.render_scale, main.py --render-scale / --dynamic-resolution)
+RENDER_SCALE_LEVELS = (1.0, 0.75, 0.5)  # Share of the window resolution per axis, best first (0.5 upscales fastest)
+RENDER_SCALE_BUDGET_MS = 10.0        # Frame draw time to stay under (rest of a 60 FPS frame: ticks, presenting)
+RENDER_SCALE_SMOOTHING = 0.1         # Weight of the newest draw time in its moving average
+RENDER_SCALE_RAISE_HEADROOM = 0.8    # Step up only if the next scale's estimated draw time fits this budget share
+RENDER_SCALE_SETTLE_FRAMES = 60      # Frames measured after a scale change before the next one
+RENDER_SCALE_MEMORY_FRAMES = 600     # Frames a step's measured draw time is trusted for
+
+# Graphics quality presets (systems.quality_governor, settings screen)
+QUALITY_LOW = "Low"
+QUALITY_MEDIUM = "Medium"
+QUALITY_HIGH = "High"
+QUALITY_ULTRA = "Ultra"
+QUALITY_AUTO = "Auto"
+QUALITY_PRESET_OPTIONS = [QUALITY_LOW, QUALITY_MEDIUM, QUALITY_HIGH, QUALITY_ULTRA]  # Cheapest first
+QUALITY_OPTIONS = QUALITY_PRESET_OPTIONS + [QUALITY_AUTO]
+QUALITY_PRESETS = {
+    # glow_layers: paddle glow layers (draw_multi_layer_glow num_layers)
+    # trail_length: ball trail segments (at most BALL_TRAIL_LENGTH)
+    # particle_budget: live particle ceiling
+    # grid_highlights: background grid intersection dots
+    # title_glow_layers: start-screen title glow layers (of 5)
+    QUALITY_LOW: {'glow_layers': 1, 'trail_length': 5, 'particle_budget': 500,
+                  'grid_highlights': False, 'title_glow_layers': 1},
+    QUALITY_MEDIUM: {'glow_layers': 2, 'trail_length': 10, 'particle_budget': 1500,
+                     'grid_highlights': True, 'title_glow_layers': 3},
+    QUALITY_HIGH: {'glow_layers': 3, 'trail_length': 15, 'particle_budget': 3000,
+                   'grid_highlights': True, 'title_glow_layers': 5},
+    QUALITY_ULTRA: {'glow_layers': 4, 'trail_length': 15, 'particle_budget': 5000,
+                    'grid_highlights': True, 'title_glow_layers': 5},
+}
+QUALITY_AUTO_WINDOW = 120          # Frames of busy time per Auto mode decision window
+QUALITY_AUTO_PERCENTILE = 0.9      # Frame time percentile compared with the thresholds
+QUALITY_AUTO_DOWN_MS = 15.0        # Step down above this (a 60 FPS frame is 16.7 ms)
+QUALITY_AUTO_UP_MS = 7.0           # Step up below this - the gap between the two is the hysteresis
+QUALITY_AUTO_UP_WINDOWS = 2        # Consecutive fast windows needed to step up
+QUALITY_AUTO_RECOVERY_HEADROOM = 0.8  # Back up to a stepped-down preset only if expected under this share of DOWN_MS
+QUALITY_AUTO_RECOVERY_WINDOWS = 30    # Windows a step down is remembered for
+QUALITY_BENCHMARK_FRAMES = 20      # Timed frames per preset in the first-launch benchmark
+QUALITY_BENCHMARK_BUDGET_MS = 8.0  # Draw + present time a preset must hold in the benchmark
+
+# Text cache (ui.text_cache)
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # Pixel memory kept for rendered strings (LRU beyond this)
+START_TITLE_GLOW_CACHE_SIZE = 96        # Start-screen title glow composites kept (one per sway position)
+
+# Particle effects (systems.particle_system)
+PARTICLE_EMITTERS_FILE = "assets/particle_emitters.json"  # Data-driven burst definitions
+PARTICLE_INITIAL_CAPACITY = 4096  # Preallocated slots - storage doubles when a burst overflows it
+PARTICLE_GRAVITY = 0.1            # Default vertical acceleration per tick (emitters may override)
+PARTICLE_DRAG = 0.98              # Velocity multiplier per tick (air resistance)
+PARTICLE_GLOW_SCALE = 1.5         # Glow halo radius relative to the particle core
+PARTICLE_SPRITE_MAX_SIZE = 12     # Largest core radius in the sprite atlas (bigger particles are clamped)
+PARTICLE_ALPHA_BUCKETS = 16       # Fade levels baked per sprite (alpha 0-255 in steps of 16)
+PARTICLE_COLOR_LEVELS = 16        # Quantization levels per color channel
+PARTICLE_BUDGET = 3000            # Live particle ceiling - keeps effect frame cost bounded
+
+# Particle priority classes - when the budget is full, lower classes are evicted first
+PARTICLE_PRIORITY_DECORATIVE = 0  # Score and victory confetti
+PARTICLE_PRIORITY_EFFECT = 1      # Elimination explosions
+PARTICLE_PRIORITY_FEEDBACK = 2    # Paddle and wall hit sparks
+# Budget load at which each class starts spawning scaled-down bursts (1.0 = never scaled)
+PARTICLE_SCALE_START = {
+    PARTICLE_PRIORITY_DECORATIVE: 0.5,
+    PARTICLE_PRIORITY_EFFECT: 0.75,
+    PARTICLE_PRIORITY_FEEDBACK: 1.0,
+}
 
 # Game boundaries
 BOUNDARY_THICKNESS = 10
 
+# Collision settings
+MAX_COLLISIONS_PER_TICK = 4  # Contacts resolved per tick by the swept collision pass
+
 # Player positions
 PLAYER_COLORS = [NEON_BLUE, NEON_PINK, NEON_GREEN, NEON_YELLOW]
 
@@ -51,8 +154,31 @@ GAME_STATE_AIMING = "aiming"
 GAME_STATE_PAUSED = "paused"
 GAME_STATE_GAME_OVER = "game_over"
 
+# Headless match runner (main.py --headless)
+HEADLESS_DEFAULT_MATCHES = 100
+HEADLESS_MAX_MATCH_TICKS = 60 * 60 * 30  # Give up on a match after 30 minutes of game time
+HEADLESS_FREE_FLIGHT_LOOKAHEAD = 600  # Free flight: longest contact-free stretch looked for (ticks)
+BATCH_CHECK_SIGMAS = 3  # --batch-check: allowed batch/scalar gap, in standard errors of the difference
+
+# Tournament runner (main.py --tournament)
+TOURNAMENT_DEFAULT_OUTPUT = "tournament_results.jsonl"
+TOURNAMENT_MAX_CHUNKSIZE = 4          # Matches handed to a worker per request
+TOURNAMENT_PROGRESS_INTERVAL = 0.5    # Seconds between live aggregate updates
+
+# Match events (emitted by core.match.Match for the presentation layer)
+MATCH_EVENT_PADDLE_HIT = "paddle_hit"
+MATCH_EVENT_WALL_BOUNCE = "wall_bounce"
+MATCH_EVENT_LIFE_LOST = "life_lost"
+MATCH_EVENT_LAUNCH = "launch"
+MATCH_EVENT_GAME_OVER = "game_over"
+
+# Random streams (core.rng) - separate so cosmetics never shift gameplay
+RNG_STREAM_GAMEPLAY = "gameplay"   # Ball serves
+RNG_STREAM_AI = "ai"               # AI accuracy errors and aiming
+RNG_STREAM_COSMETIC = "cosmetic"   # Particles, screen shake, menu effects
+
 # Aiming system
-AIMING_TIME = 90  # 3 seconds at 60 FPS
+AIMING_TIME = 90  # Simulation ticks (1.5 seconds at 60 ticks/s)
 AIMING_ANGLE_RANGE = 60  # ±60 degrees from straight out
 
 # Pause menu
@@ -73,11 +199,12 @@ GAME_OVER_MAIN_MENU = 1
 GAME_OVER_QUIT = 2
 
 # Settings menu
-SETTINGS_MENU_OPTIONS = ["Difficulty", "Sound", "Controller Sensitivity", "Back"]
+SETTINGS_MENU_OPTIONS = ["Difficulty", "Sound", "Controller Sensitivity", "Quality", "Back"]
 SETTINGS_MENU_DIFFICULTY = 0
 SETTINGS_MENU_SOUND = 1
 SETTINGS_MENU_CONTROLLER = 2
-SETTINGS_MENU_BACK = 3
+SETTINGS_MENU_QUALITY = 3
+SETTINGS_MENU_BACK = 4
 
 # Difficulty levels
 DIFFICULTY_EASY = "Easy"
@@ -96,8 +223,8 @@ CONTROLLER_SENSITIVITY = 1.0  # Movement sensitivity multiplier
 
 # AI Prediction settings
 AI_PREDICTION_ENABLED = True           # Enable trajectory prediction
-AI_PREDICTION_LOOKAHEAD_TIME = 60     # Frames to look ahead (1 second at 60fps)
-AI_MAX_PREDICTION_BOUNCES = 1          # Maximum wall bounces to predict
+AI_PREDICTION_LOOKAHEAD_TIME = 60     # Ticks to look ahead (1 second at 60 ticks/s)
+AI_MAX_PREDICTION_BOUNCES = 1          # Wall bounces Medium AI predicts through (Hard: unlimited)
 AI_PREDICTION_ACCURACY = 0.9           # Base prediction accuracy (0.0-1.0)
 
 # AI Strategic Positioning settings
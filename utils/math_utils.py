@@ -1,4 +1,3 @@
-import pygame
 import math
 
 class Vector2:
@@ -28,6 +27,11 @@ def clamp(value, min_val, max_val):
     """Clamp a value between min and max"""
     return max(min_val, min(value, max_val))
 
+def percentile(values, fraction):
+    """Nearest-rank percentile (fraction 0-1) of a non-empty sequence"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
 def distance(pos1, pos2):
     """Calculate distance between two points"""
     return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
@@ -39,4 +43,121 @@ def reflect_vector(vector, normal):
     return Vector2(
         vector.x - 2 * dot_product * normal.x,
         vector.y - 2 * dot_product * normal.y
-    )
\ No newline at end of file
+    )
+
+def _sweep_slab(origin, delta, low, high):
+    """Entry/exit times of a 1D sweep through the slab [low, high]"""
+    if delta == 0:
+        # Parallel to the slab - either always inside or never
+        if origin < low or origin > high:
+            return None
+        return -math.inf, math.inf
+    t1 = (low - origin) / delta
+    t2 = (high - origin) / delta
+    return (t1, t2) if t1 < t2 else (t2, t1)
+
+def sweep_circle_point(cx, cy, dx, dy, radius, px, py):
+    """Time of impact of a circle moving by (dx, dy) against a point.
+
+    Returns (toi, normal_x, normal_y) with toi in [0, 1], or None on a miss.
+    """
+    mx = cx - px
+    my = cy - py
+    c = mx * mx + my * my - radius * radius
+    if c <= 0:
+        # Already touching
+        length = math.sqrt(mx * mx + my * my)
+        if length == 0:
+            return 0.0, 0.0, 0.0
+        return 0.0, mx / length, my / length
+
+    a = dx * dx + dy * dy
+    b = mx * dx + my * dy
+    if a == 0 or b >= 0:  # Not moving, or moving away
+        return None
+
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+
+    toi = (-b - math.sqrt(discriminant)) / a
+    if toi > 1:
+        return None
+
+    hit_x = cx + dx * toi
+    hit_y = cy + dy * toi
+    return toi, (hit_x - px) / radius, (hit_y - py) / radius
+
+def sweep_circle_aabb(cx, cy, dx, dy, radius, left, top, right, bottom):
+    """Time of impact of a circle moving by (dx, dy) against an axis-aligned box.
+
+    Sweeps the circle center against the box grown by the radius (with
+    rounded corners). Returns (toi, normal_x, normal_y) for the first contact
+    with toi in [0, 1], toi 0 if the circle already overlaps the box, or None
+    when the move misses the box.
+    """
+    # Slab test against the box expanded by the radius on every side
+    x_range = _sweep_slab(cx, dx, left - radius, right + radius)
+    if x_range is None:
+        return None
+    y_range = _sweep_slab(cy, dy, top - radius, bottom + radius)
+    if y_range is None:
+        return None
+
+    t_enter = max(x_range[0], y_range[0])
+    t_exit = min(x_range[1], y_range[1])
+    if t_enter > t_exit or t_exit < 0 or t_enter > 1:
+        return None
+
+    # Where the center is when it enters the expanded box (or now, if inside)
+    toi = max(t_enter, 0.0)
+    hit_x = cx + dx * toi
+    hit_y = cy + dy * toi
+
+    # Corner regions of the expanded box are rounded - test the corner point
+    outside_x = hit_x < left or hit_x > right
+    outside_y = hit_y < top or hit_y > bottom
+    if outside_x and outside_y:
+        corner_x = left if hit_x < left else right
+        corner_y = top if hit_y < top else bottom
+        return sweep_circle_point(cx, cy, dx, dy, radius, corner_x, corner_y)
+
+    if t_enter < 0:
+        # Started overlapping a face - push out along the shallowest side
+        penetrations = [
+            (cx - (left - radius), -1.0, 0.0),
+            ((right + radius) - cx, 1.0, 0.0),
+            (cy - (top - radius), 0.0, -1.0),
+            ((bottom + radius) - cy, 0.0, 1.0),
+        ]
+        _, normal_x, normal_y = min(penetrations)
+        return 0.0, normal_x, normal_y
+
+    # Face hit - the normal comes from whichever slab was entered last
+    if x_range[0] > y_range[0]:
+        return toi, (-1.0 if dx > 0 else 1.0), 0.0
+    return toi, 0.0, (-1.0 if dy > 0 else 1.0)
+
+def mirror_fold(position, low, high):
+    """Fold an unbounded 1D position into [low, high] by mirror reflection.
+
+    Closed form for a ball bouncing between two walls any number of times.
+    Returns (folded_position, bounces, first_wall) where first_wall is -1 for
+    the low wall, 1 for the high wall and 0 when there is no bounce.
+    """
+    span = high - low
+    offset = position - low
+    if 0 <= offset <= span:
+        return position, 0, 0
+
+    if offset > span:
+        bounces = int(offset // span)
+        first_wall = 1
+    else:
+        bounces = math.ceil(-offset / span)
+        first_wall = -1
+
+    offset %= 2 * span
+    if offset > span:
+        offset = 2 * span - offset
+    return low + offset, bounces, first_wall